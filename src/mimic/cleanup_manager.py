@@ -1,15 +1,23 @@
 """Resource cleanup management for Mimic instances."""
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 
 from rich.console import Console
 
+from . import settings
 from .config_manager import ConfigManager
 from .gh import GitHubClient
 from .instance_repository import InstanceRepository
 from .models import Instance
 from .unify import UnifyAPIClient
 
+# (GitHub client, CloudBees client) used to clean up an instance; either is
+# None when its credentials aren't configured
+Clients = tuple[GitHubClient | None, UnifyAPIClient | None]
+
 
 class CleanupManager:
     """Manages cleanup of resources for Mimic instances."""
@@ -39,13 +47,13 @@ class CleanupManager:
         Returns:
             Dictionary with counts of total, active, and expired instances
         """
-        all_instances = self.instance_repository.find_all(include_expired=True)
-        expired_instances = self.instance_repository.find_expired()
+        total = self.instance_repository.count()
+        expired = self.instance_repository.count(expired_only=True)
 
         return {
-            "total_sessions": len(all_instances),
-            "active_sessions": len(all_instances) - len(expired_instances),
-            "expired_sessions": len(expired_instances),
+            "total_sessions": total,
+            "active_sessions": total - expired,
+            "expired_sessions": expired,
         }
 
     def check_expired_sessions(self) -> list[Instance]:
@@ -58,7 +66,12 @@ class CleanupManager:
         return self.instance_repository.find_expired()
 
     async def cleanup_session(
-        self, session_id: str, dry_run: bool = False
+        self,
+        session_id: str,
+        dry_run: bool = False,
+        delete_instance: bool = True,
+        instance: Instance | None = None,
+        clients: Clients | None = None,
     ) -> dict[str, Any]:
         """
         Clean up all resources for a specific instance.
@@ -66,6 +79,12 @@ class CleanupManager:
         Args:
             session_id: Instance ID to clean up
             dry_run: If True, only show what would be cleaned up without doing it
+            delete_instance: If False, leave removing the instance record to the
+                caller (used to batch removals across several instances)
+            instance: The instance to clean up, if the caller has already loaded
+                it; saves looking it up again by ID
+            clients: The (GitHub, CloudBees) clients to use, if the caller
+                shares them across instances; the caller then closes them
 
         Returns:
             Dictionary with cleanup results
@@ -73,7 +92,8 @@ class CleanupManager:
         Raises:
             ValueError: If instance not found
         """
-        instance = self.instance_repository.get_by_id(session_id)
+        if instance is None:
+            instance = self.instance_repository.get_by_id(session_id)
         if not instance:
             raise ValueError(f"Instance {session_id} not found")
 
@@ -92,24 +112,17 @@ class CleanupManager:
                 "\n[yellow]Dry run - no resources will be deleted[/yellow]"
             )
 
-        # Get credentials
-        github_pat = self.config_manager.get_github_pat()
-        cloudbees_pat = self.config_manager.get_cloudbees_pat(instance.tenant)
-        env_url = self.config_manager.get_tenant_url(instance.tenant)
-
-        if not cloudbees_pat or not env_url:
-            self.console.print(
-                f"[yellow]Warning:[/yellow] No credentials found for environment '{instance.tenant}'. "
-                "Skipping CloudBees resources."
+        # Initialize clients. A dry run never calls the APIs, so it skips the
+        # credential lookups and client setup altogether.
+        owns_clients = clients is None and not dry_run
+        if dry_run:
+            clients = (None, None)
+        elif clients is None:
+            github_client, cloudbees_clients = await self._open_clients(
+                [instance.tenant]
             )
-
-        # Initialize clients
-        github_client = GitHubClient(github_pat) if github_pat else None
-        cloudbees_client = (
-            UnifyAPIClient(base_url=env_url, api_key=cloudbees_pat)
-            if cloudbees_pat and env_url
-            else None
-        )
+            clients = (github_client, cloudbees_clients[instance.tenant])
+        github_client, cloudbees_client = clients
 
         # Clean up resources in reverse order (to handle dependencies)
         # Skip flags - they're not safe to auto-cleanup
@@ -122,221 +135,220 @@ class CleanupManager:
                 }
             )
 
-        # Clean up applications
-        for application in instance.applications:
-            await self._cleanup_application(
-                application, cloudbees_client, results, dry_run
+        try:
+            # Resources within a tier don't depend on each other, so each tier
+            # is deleted in bulk, one call per organization; the tiers stay in
+            # order
+            await self._cleanup_cloudbees_tier(
+                "application", instance.applications, cloudbees_client, results, dry_run
             )
-
-        # Clean up environments
-        for environment in instance.environments:
-            await self._cleanup_environment(
-                environment, cloudbees_client, results, dry_run
+            await self._cleanup_cloudbees_tier(
+                "environment", instance.environments, cloudbees_client, results, dry_run
+            )
+            await self._cleanup_cloudbees_tier(
+                "component", instance.components, cloudbees_client, results, dry_run
             )
 
-        # Clean up components
-        for component in instance.components:
-            await self._cleanup_component(component, cloudbees_client, results, dry_run)
-
-        # Clean up GitHub repositories
-        for repository in instance.repositories:
-            await self._cleanup_github_repo(repository, github_client, results, dry_run)
+            # Clean up GitHub repositories
+            await self._cleanup_github_repos(
+                instance.repositories, github_client, results, dry_run
+            )
+        finally:
+            # Close clients, even if a tier raised
+            if owns_clients:
+                await self._close_clients(github_client, [cloudbees_client])
 
         # Delete instance from repository if not dry run
-        if not dry_run:
+        if not dry_run and delete_instance:
             self.instance_repository.delete(session_id)
             results["session_deleted"] = True
 
-        # Close clients
-        if cloudbees_client:
-            cloudbees_client.close()
-
         return results
 
-    async def _cleanup_github_repo(
-        self, resource, github_client, results, dry_run: bool
-    ):
-        """Clean up a GitHub repository."""
-        repo_name = resource.id  # Full repo name like "owner/repo"
+    async def _open_clients(
+        self, tenants: Iterable[str]
+    ) -> tuple[GitHubClient | None, dict[str, UnifyAPIClient | None]]:
+        """
+        Create the API clients needed to clean up instances on each tenant.
 
-        if not github_client:
-            results["skipped"].append(
-                {
-                    "type": "github_repo",
-                    "id": resource.id,
-                    "reason": "No GitHub credentials configured",
-                }
-            )
-            return
+        Each PAT is looked up once, however many tenants or instances share it.
+        Keyring lookups can block (e.g. on a D-Bus round trip), so they run
+        concurrently off the event loop.
 
-        try:
-            if dry_run:
-                self.console.print(
-                    f"  [dim]Would delete GitHub repo:[/dim] {repo_name}"
-                )
-                results["cleaned"].append(
-                    {"type": "github_repo", "id": resource.id, "dry_run": True}
-                )
-            else:
-                success = await github_client.delete_repository(repo_name)
-                if success:
-                    self.console.print(
-                        f"  [green]✓[/green] Deleted GitHub repo: {repo_name}"
-                    )
-                    results["cleaned"].append(
-                        {"type": "github_repo", "id": resource.id}
-                    )
-                else:
-                    results["errors"].append(
-                        {
-                            "type": "github_repo",
-                            "id": resource.id,
-                            "error": "Deletion failed",
-                        }
-                    )
-        except Exception as e:
-            self.console.print(
-                f"  [red]✗[/red] Failed to delete GitHub repo {repo_name}: {e}"
-            )
-            results["errors"].append(
-                {"type": "github_repo", "id": resource.id, "error": str(e)}
-            )
+        Args:
+            tenants: Tenant names (duplicates are ignored)
 
-    async def _cleanup_component(
-        self, resource, cloudbees_client, results, dry_run: bool
-    ):
-        """Clean up a CloudBees component."""
-        if not cloudbees_client:
-            results["skipped"].append(
-                {
-                    "type": "cloudbees_component",
-                    "id": resource.id,
-                    "reason": "No CloudBees credentials configured",
-                }
-            )
-            return
+        Returns:
+            The GitHub client, and a mapping of tenant name to its CloudBees
+            client; a client is None when its credentials aren't configured
+        """
+        unique_tenants = list(dict.fromkeys(tenants))
+        github_pat, *cloudbees_pats = await asyncio.gather(
+            asyncio.to_thread(self.config_manager.get_github_pat),
+            *(
+                asyncio.to_thread(self.config_manager.get_cloudbees_pat, tenant)
+                for tenant in unique_tenants
+            ),
+        )
 
-        try:
-            if dry_run:
-                self.console.print(
-                    f"  [dim]Would delete component:[/dim] {resource.name} ({resource.id})"
-                )
-                results["cleaned"].append(
-                    {"type": "cloudbees_component", "id": resource.id, "dry_run": True}
+        cloudbees_clients: dict[str, UnifyAPIClient | None] = {}
+        for tenant, cloudbees_pat in zip(unique_tenants, cloudbees_pats, strict=True):
+            env_url = self.config_manager.get_tenant_url(tenant)
+            if cloudbees_pat and env_url:
+                cloudbees_clients[tenant] = UnifyAPIClient(
+                    base_url=env_url, api_key=cloudbees_pat
                 )
             else:
-                cloudbees_client.delete_component(resource.org_id, resource.id)
                 self.console.print(
-                    f"  [green]✓[/green] Deleted component: {resource.name}"
+                    f"[yellow]Warning:[/yellow] No credentials found for environment '{tenant}'. "
+                    "Skipping CloudBees resources."
                 )
-                results["cleaned"].append(
-                    {"type": "cloudbees_component", "id": resource.id}
-                )
-        except Exception as e:
-            self.console.print(
-                f"  [red]✗[/red] Failed to delete component {resource.name}: {e}"
-            )
-            results["errors"].append(
-                {"type": "cloudbees_component", "id": resource.id, "error": str(e)}
-            )
+                cloudbees_clients[tenant] = None
 
-    async def _cleanup_environment(
-        self, resource, cloudbees_client, results, dry_run: bool
+        github_client = GitHubClient(github_pat) if github_pat else None
+        return github_client, cloudbees_clients
+
+    @staticmethod
+    async def _close_clients(
+        github_client: GitHubClient | None,
+        cloudbees_clients: Iterable[UnifyAPIClient | None],
+    ) -> None:
+        """Close clients created by _open_clients."""
+        for cloudbees_client in cloudbees_clients:
+            if cloudbees_client:
+                cloudbees_client.close()
+        if github_client:
+            await github_client.aclose()
+
+    async def _cleanup_github_repos(
+        self, resources, github_client, results, dry_run: bool
     ):
-        """Clean up a CloudBees environment."""
-        if not cloudbees_client:
-            results["skipped"].append(
-                {
-                    "type": "cloudbees_environment",
-                    "id": resource.id,
-                    "reason": "No CloudBees credentials configured",
-                }
-            )
+        """Clean up GitHub repositories with a single batched delete."""
+        if not resources:
             return
 
-        try:
-            if dry_run:
-                self.console.print(
-                    f"  [dim]Would delete environment:[/dim] {resource.name} ({resource.id})"
-                )
+        # Output is collected and printed once per tier
+        lines: list[str] = []
+
+        if dry_run:
+            for resource in resources:
+                lines.append(f"  [dim]Would delete GitHub repo:[/dim] {resource.id}")
                 results["cleaned"].append(
+                    {"type": "github_repo", "id": resource.id, "dry_run": True}
+                )
+        elif not github_client:
+            for resource in resources:
+                results["skipped"].append(
                     {
-                        "type": "cloudbees_environment",
+                        "type": "github_repo",
                         "id": resource.id,
-                        "dry_run": True,
+                        "reason": "No GitHub credentials configured",
                     }
                 )
-            else:
-                cloudbees_client.delete_environment(resource.org_id, resource.id)
-                self.console.print(
-                    f"  [green]✓[/green] Deleted environment: {resource.name}"
-                )
-                results["cleaned"].append(
-                    {"type": "cloudbees_environment", "id": resource.id}
-                )
-        except Exception as e:
-            self.console.print(
-                f"  [red]✗[/red] Failed to delete environment {resource.name}: {e}"
-            )
-            results["errors"].append(
-                {"type": "cloudbees_environment", "id": resource.id, "error": str(e)}
+        else:
+            # Resource IDs are full repo names like "owner/repo"
+            outcomes = await github_client.delete_repositories(
+                [resource.id for resource in resources]
             )
+            for resource in resources:
+                self._record_github_repo_result(
+                    resource, outcomes[resource.id], results, lines
+                )
 
-    async def _cleanup_application(
-        self, resource, cloudbees_client, results, dry_run: bool
-    ):
-        """Clean up a CloudBees application (and its feature flags)."""
-        if not cloudbees_client:
-            results["skipped"].append(
-                {
-                    "type": "cloudbees_application",
-                    "id": resource.id,
-                    "reason": "No CloudBees credentials configured",
-                }
-            )
-            return
+        self._print_lines(lines)
 
-        # Skip deletion of shared applications
-        if resource.is_shared:
-            self.console.print(
-                f"  [dim]⏭️  Skipping shared application:[/dim] {resource.name}"
+    @staticmethod
+    def _record_github_repo_result(
+        resource, outcome: bool | BaseException, results, lines: list[str]
+    ) -> None:
+        """Record the outcome of deleting one GitHub repository."""
+        repo_name = resource.id
+
+        if isinstance(outcome, BaseException):
+            lines.append(
+                f"  [red]✗[/red] Failed to delete GitHub repo {repo_name}: {outcome}"
             )
-            results["skipped"].append(
+            results["errors"].append(
+                {"type": "github_repo", "id": resource.id, "error": str(outcome)}
+            )
+        elif outcome:
+            lines.append(f"  [green]✓[/green] Deleted GitHub repo: {repo_name}")
+            results["cleaned"].append({"type": "github_repo", "id": resource.id})
+        else:
+            results["errors"].append(
                 {
-                    "type": "cloudbees_application",
+                    "type": "github_repo",
                     "id": resource.id,
-                    "reason": "Application is marked as shared and won't be deleted",
+                    "error": "Deletion failed",
                 }
             )
-            return
 
-        try:
-            if dry_run:
-                self.console.print(
-                    f"  [dim]Would delete application:[/dim] {resource.name} ({resource.id})"
-                )
-                results["cleaned"].append(
+    async def _cleanup_cloudbees_tier(
+        self, kind: str, resources, cloudbees_client, results, dry_run: bool
+    ):
+        """Clean up one tier of CloudBees resources, one bulk delete per org."""
+        resource_type = f"cloudbees_{kind}"
+
+        # Output is collected and printed once per tier
+        lines: list[str] = []
+        by_org: defaultdict[str, list[Any]] = defaultdict(list)
+        for resource in resources:
+            # Skip deletion of shared applications
+            if getattr(resource, "is_shared", False):
+                lines.append(f"  [dim]⏭️  Skipping shared {kind}:[/dim] {resource.name}")
+                results["skipped"].append(
                     {
-                        "type": "cloudbees_application",
+                        "type": resource_type,
                         "id": resource.id,
-                        "dry_run": True,
+                        "reason": f"{kind.capitalize()} is marked as shared and won't be deleted",
                     }
                 )
-            else:
-                cloudbees_client.delete_application(resource.org_id, resource.id)
-                self.console.print(
-                    f"  [green]✓[/green] Deleted application: {resource.name}"
+            elif dry_run:
+                lines.append(
+                    f"  [dim]Would delete {kind}:[/dim] {resource.name} ({resource.id})"
                 )
                 results["cleaned"].append(
-                    {"type": "cloudbees_application", "id": resource.id}
+                    {"type": resource_type, "id": resource.id, "dry_run": True}
                 )
-        except Exception as e:
-            self.console.print(
-                f"  [red]✗[/red] Failed to delete application {resource.name}: {e}"
-            )
-            results["errors"].append(
-                {"type": "cloudbees_application", "id": resource.id, "error": str(e)}
-            )
+            elif not cloudbees_client:
+                results["skipped"].append(
+                    {
+                        "type": resource_type,
+                        "id": resource.id,
+                        "reason": "No CloudBees credentials configured",
+                    }
+                )
+            else:
+                by_org[resource.org_id].append(resource)
+
+        for org_id, group in by_org.items():
+            bulk_delete = getattr(cloudbees_client, f"bulk_delete_{kind}s")
+            errors = await bulk_delete(org_id, [resource.id for resource in group])
+            for resource in group:
+                error = errors[resource.id]
+                if error is None:
+                    lines.append(f"  [green]✓[/green] Deleted {kind}: {resource.name}")
+                    results["cleaned"].append(
+                        {"type": resource_type, "id": resource.id}
+                    )
+                else:
+                    lines.append(
+                        f"  [red]✗[/red] Failed to delete {kind} {resource.name}: {error}"
+                    )
+                    results["errors"].append(
+                        {"type": resource_type, "id": resource.id, "error": str(error)}
+                    )
+
+        self._print_lines(lines)
+
+    def _print_lines(self, lines: list[str]) -> None:
+        """Print buffered output lines with a single console call.
+
+        One render per tier is cheaper than one per resource, and keeps a
+        tier's lines together when several instances are cleaned up at once.
+        """
+        if lines:
+            self.console.print("\n".join(lines))
 
     async def cleanup_expired_sessions(
         self, dry_run: bool = False, auto_confirm: bool = False
@@ -351,9 +363,9 @@ class CleanupManager:
         Returns:
             Dictionary with cleanup results for all instances
         """
-        expired_instances = self.check_expired_sessions()
+        expired_count = self.instance_repository.count(expired_only=True)
 
-        if not expired_instances:
+        if not expired_count:
             return {
                 "total_sessions": 0,
                 "cleaned_sessions": 0,
@@ -362,7 +374,7 @@ class CleanupManager:
             }
 
         results = {
-            "total_sessions": len(expired_instances),
+            "total_sessions": expired_count,
             "cleaned_sessions": 0,
             "failed_sessions": 0,
             "sessions": [],
@@ -370,31 +382,67 @@ class CleanupManager:
 
         if not auto_confirm and not dry_run:
             self.console.print(
-                f"\n[yellow]Found {len(expired_instances)} expired instance(s)[/yellow]"
+                f"\n[yellow]Found {expired_count} expired instance(s)[/yellow]"
             )
             self.console.print()
 
-        # Clean up each expired instance
-        for instance in expired_instances:
-            try:
-                session_result = await self.cleanup_session(instance.id, dry_run)
-                results["sessions"].append(session_result)
-
-                if not session_result["errors"]:
-                    results["cleaned_sessions"] += 1
-                else:
+        # Clean up several expired instances at once (each one's deletes are
+        # already rate limited per API), removing the processed instance
+        # records from state in one write at the end
+        processed: list[dict[str, Any]] = []
+        semaphore = asyncio.Semaphore(settings.CLEANUP_CONCURRENCY)
+
+        async def clean(instance: Instance) -> None:
+            async with semaphore:
+                try:
+                    session_result = await self.cleanup_session(
+                        instance.id,
+                        dry_run,
+                        delete_instance=False,
+                        instance=instance,
+                        clients=(github_client, cloudbees_clients.get(instance.tenant)),
+                    )
+                except Exception as e:
+                    self.console.print(
+                        f"[red]Error cleaning up instance {instance.id}:[/red] {e}"
+                    )
                     results["failed_sessions"] += 1
+                    results["sessions"].append(
+                        {
+                            "session_id": instance.id,
+                            "error": str(e),
+                        }
+                    )
+                    return
 
-            except Exception as e:
-                self.console.print(
-                    f"[red]Error cleaning up instance {instance.id}:[/red] {e}"
-                )
+            results["sessions"].append(session_result)
+            if not dry_run:
+                processed.append(session_result)
+
+            if not session_result["errors"]:
+                results["cleaned_sessions"] += 1
+            else:
                 results["failed_sessions"] += 1
-                results["sessions"].append(
-                    {
-                        "session_id": instance.id,
-                        "error": str(e),
-                    }
-                )
+
+        instances = list(self.instance_repository.iter_expired())
+        # Share one client per API (and tenant) across the whole sweep, so
+        # credentials are looked up once and connections are kept alive. A dry
+        # run never calls the APIs, so it needs no clients at all.
+        github_client: GitHubClient | None = None
+        cloudbees_clients: dict[str, UnifyAPIClient | None] = {}
+        if not dry_run:
+            github_client, cloudbees_clients = await self._open_clients(
+                instance.tenant for instance in instances
+            )
+
+        try:
+            await asyncio.gather(*(clean(instance) for instance in instances))
+        finally:
+            await self._close_clients(github_client, cloudbees_clients.values())
+            self.instance_repository.delete_many(
+                [session_result["session_id"] for session_result in processed]
+            )
+            for session_result in processed:
+                session_result["session_deleted"] = True
 
         return results
@@ -8,7 +8,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..cleanup_manager import CleanupManager
 from ..config_manager import ConfigManager
 from ..instance_repository import InstanceRepository
 
@@ -180,6 +179,8 @@ def cleanup_run(
         mimic cleanup run --dry-run             # Preview cleanup interactively
         mimic cleanup run my-app --dry-run      # Preview specific instance cleanup
     """
+    from ..cleanup_manager import CleanupManager
+
     try:
         instance_repo = InstanceRepository()
 
@@ -358,6 +359,8 @@ def cleanup_expired(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
 ):
     """Clean up all expired instances."""
+    from ..cleanup_manager import CleanupManager
+
     try:
         cleanup_manager = CleanupManager(console=console)
 
@@ -1,14 +1,11 @@
 """Configuration management commands for Mimic CLI."""
 
 import typer
-from prompt_toolkit import prompt as pt_prompt
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ..config_manager import ConfigManager
-from ..input_helpers import select_or_new
-from ..unify import create_client_from_config
 
 # Shared instances
 console = Console()
@@ -145,6 +142,9 @@ def config_github_token():
 @config_app.command("properties")
 def config_properties():
     """Browse properties and secrets for an organization."""
+    from ..input_helpers import select_or_new
+    from ..unify import create_client_from_config
+
     console.print()
     console.print("[bold]Browse CloudBees Properties & Secrets[/bold]")
     console.print()
@@ -263,6 +263,11 @@ def config_properties():
 @config_app.command("add-property")
 def config_add_property():
     """Add a property or secret to an organization or component."""
+    from prompt_toolkit import prompt as pt_prompt
+
+    from ..input_helpers import select_or_new
+    from ..unify import create_client_from_config
+
     console.print()
     console.print("[bold]Add CloudBees Property or Secret[/bold]")
     console.print()
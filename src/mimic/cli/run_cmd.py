@@ -7,20 +7,6 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..config_manager import ConfigManager
-from ..input_helpers import prompt_cloudbees_org
-from .run_helpers import (
-    check_github_integration,
-    check_required_properties,
-    collect_parameters,
-    execute_scenario,
-    handle_dry_run,
-    handle_expiration_selection,
-    handle_opportunistic_cleanup,
-    parse_parameters,
-    select_scenario_interactive,
-    show_preview_and_confirm,
-    validate_credentials,
-)
 
 # Shared instances
 console = Console()
@@ -142,6 +128,11 @@ def run(
         "-v",
         help="Enable debug logging to see detailed API requests/responses",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-run the scenario even if an identical run already succeeded",
+    ),
 ):
     """Run a scenario with interactive parameter prompts or non-interactive mode.
 
@@ -160,8 +151,26 @@ def run(
         mimic run hackers-app -f params.json --set project_name=override
         mimic run hackers-app -f params.json --yes
         mimic run hackers-app -f params.json --yes -v  # With debug logging
+        mimic run hackers-app -f params.json --yes --force  # Re-run identical run
     """
+    # Import here so other commands don't pay for the interactive prompt
+    # libraries and the creation pipeline at startup
+    from ..input_helpers import prompt_cloudbees_org
+    from ..pipeline.creation_pipeline import configure_pipeline_logging
     from ..scenarios import initialize_scenarios_from_config
+    from .run_helpers import (
+        check_github_integration,
+        check_required_properties,
+        collect_parameters,
+        execute_scenario,
+        handle_dry_run,
+        handle_expiration_selection,
+        handle_opportunistic_cleanup,
+        parse_parameters,
+        select_scenario_interactive,
+        show_preview_and_confirm,
+        validate_credentials,
+    )
 
     # Set up logging based on verbose flag
     if verbose:
@@ -169,6 +178,10 @@ def run(
             level=logging.DEBUG, format="[%(levelname)s] %(name)s: %(message)s"
         )
         console.print("[dim]Debug logging enabled[/dim]\n")
+    else:
+        # Show pipeline progress on the console; with --verbose the root
+        # handler above already prints it
+        configure_pipeline_logging()
 
     config_manager = ConfigManager()
 
@@ -391,6 +404,7 @@ def run(
             cloudbees_pat=cloudbees_pat,
             env_url=env_url,
             github_pat=github_pat,
+            force=force,
         )
 
     except KeyboardInterrupt:
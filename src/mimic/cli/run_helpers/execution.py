@@ -26,9 +26,14 @@ def execute_scenario(
     cloudbees_pat: str,
     env_url: str,
     github_pat: str,
+    force: bool = False,
 ):
     """Execute the scenario and track resources in state.
 
+    An identical re-run (same scenario definition, tenant, organization,
+    parameters and expiration) reuses the instance from the last successful run
+    while it still exists, unless force is set.
+
     Args:
         config_manager: ConfigManager instance.
         scenario: Scenario object.
@@ -43,11 +48,48 @@ def execute_scenario(
         cloudbees_pat: CloudBees Personal Access Token.
         env_url: CloudBees Unify API URL.
         github_pat: GitHub Personal Access Token.
+        force: Run the pipeline even if an identical run already exists.
     """
     from datetime import datetime
 
     from ...instance_repository import InstanceRepository
     from ...pipeline import CreationPipeline
+    from ...run_cache import RunCache
+
+    # None means the instance never expires
+    lifetime_days = None if (no_expiration or expiration_days == 0) else expiration_days
+
+    # Get default GitHub username for repo invitations
+    invitee_username = config_manager.get_github_username()
+
+    # Get tenant properties
+    env_properties = config_manager.get_tenant_properties(current_env)
+
+    # Check if tenant uses legacy flags API
+    use_legacy_flags = config_manager.get_tenant_uses_legacy_flags(current_env)
+
+    run_cache = RunCache()
+    fingerprint = RunCache.fingerprint(
+        scenario_id,
+        current_env,
+        organization_id,
+        parameters,
+        scenario.model_dump(mode="json"),
+        lifetime_days,
+        {
+            "invitee_username": invitee_username,
+            "env_properties": env_properties,
+            "use_legacy_flags": use_legacy_flags,
+        },
+    )
+
+    # Fast path: nothing to do if this exact run already succeeded
+    if not force:
+        cached_id = run_cache.get(fingerprint)
+        cached = InstanceRepository().get_by_id(cached_id) if cached_id else None
+        if cached and (cached.expires_at is None or cached.expires_at > datetime.now()):
+            display_cached_instance(cached)
+            return
 
     # Generate session ID
     session_id = str(uuid.uuid4())[:8]
@@ -57,11 +99,7 @@ def execute_scenario(
 
     # Calculate expiration datetime
     now = datetime.now()
-    expires_at = (
-        None
-        if (no_expiration or expiration_days == 0)
-        else now + timedelta(days=expiration_days)
-    )
+    expires_at = None if lifetime_days is None else now + timedelta(days=lifetime_days)
 
     # Create and run pipeline
     console.print("[bold green]Starting scenario execution...[/bold green]")
@@ -70,15 +108,6 @@ def execute_scenario(
     console.print(f"[dim]Tenant: {current_env}[/dim]")
     console.print()
 
-    # Get default GitHub username for repo invitations
-    invitee_username = config_manager.get_github_username()
-
-    # Get tenant properties
-    env_properties = config_manager.get_tenant_properties(current_env)
-
-    # Check if tenant uses legacy flags API
-    use_legacy_flags = config_manager.get_tenant_uses_legacy_flags(current_env)
-
     pipeline = CreationPipeline(
         organization_id=organization_id,
         endpoint_id=endpoint_id,
@@ -104,6 +133,7 @@ def execute_scenario(
     if instance:
         repo = InstanceRepository()
         repo.save(instance)
+        run_cache.record(fingerprint, instance.id)
 
     # Build success message with resource details
     console.print()
@@ -116,3 +146,22 @@ def execute_scenario(
         summary=summary,
         pipeline=pipeline,
     )
+
+
+def display_cached_instance(instance) -> None:
+    """Report that an identical run already exists and reuse its instance.
+
+    Args:
+        instance: Instance created by the previous identical run.
+    """
+    console.print(
+        "[bold green]✓ Scenario already set up with these parameters[/bold green]"
+    )
+    console.print(f"Run Name: [bold cyan]{instance.name}[/bold cyan]")
+    console.print(f"Instance ID: [dim]{instance.id}[/dim]")
+    console.print(f"Tenant: [cyan]{instance.tenant}[/cyan]")
+    for repo in instance.repositories:
+        console.print(
+            f"  • [link={repo.url}]{repo.name}[/link] [dim]({repo.url})[/dim]"
+        )
+    console.print("\n[dim]Use --force to run the scenario again.[/dim]")
@@ -41,9 +41,13 @@ def validate_credentials(
         console.print(f"  [red]✗[/red] CloudBees API: {str(e)}")
 
     # Validate GitHub credentials
-    github_client = GitHubClient(github_pat)
+    async def check_github() -> tuple[bool, str | None]:
+        # Close the pooled client before asyncio.run shuts its loop down
+        async with GitHubClient(github_pat) as github_client:
+            return await github_client.validate_credentials()
+
     try:
-        success, error = asyncio.run(github_client.validate_credentials())
+        success, error = asyncio.run(check_github())
         if success:
             console.print("  [green]✓[/green] GitHub API")
             github_valid = True
@@ -258,9 +258,14 @@ def setup(
 
     # Validate GitHub credentials
     console.print("[dim]Validating GitHub credentials...[/dim]")
-    github_client = GitHubClient(github_pat)
+
+    async def check_github() -> tuple[bool, str | None]:
+        # Close the pooled client before asyncio.run shuts its loop down
+        async with GitHubClient(github_pat) as github_client:
+            return await github_client.validate_credentials()
+
     try:
-        success, error = asyncio.run(github_client.validate_credentials())
+        success, error = asyncio.run(check_github())
         if success:
             console.print("[green]✓[/green] GitHub API access verified\n")
             github_configured = True
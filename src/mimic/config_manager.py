@@ -1,12 +1,16 @@
 """Configuration and credential management for Mimic."""
 
+import copy
 import logging
+import time
 from datetime import UTC
-from typing import Any
+from pathlib import Path
+from typing import Any, ClassVar
 
 import keyring
 import yaml
 
+from . import settings
 from .exceptions import KeyringUnavailableError
 from .keyring_health import get_keyring_setup_instructions
 from .paths import get_config_dir
@@ -23,12 +27,19 @@ class ConfigManager:
     STATE_FILE = CONFIG_DIR / "state.json"
     PACKS_DIR = CONFIG_DIR / "scenario_packs"
 
+    # Parsed (and migrated) config per config file, shared by every manager in
+    # the process and keyed on the file's (mtime_ns, size) so external edits
+    # are picked up
+    _config_cache: ClassVar[dict[Path, tuple[tuple[int, int], dict[str, Any]]]] = {}
+
     def __init__(self):
         """Initialize the config manager."""
         self.config_dir = self.CONFIG_DIR
         self.config_file = self.CONFIG_FILE
         self.state_file = self.STATE_FILE
         self.packs_dir = self.PACKS_DIR
+        # Recent keyring lookups: keyring username -> (looked up at, secret)
+        self._secrets: dict[str, tuple[float, str | None]] = {}
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -38,18 +49,29 @@ class ConfigManager:
     def load_config(self) -> dict[str, Any]:
         """Load configuration from file.
 
+        The parsed config is kept in memory and reused until the file changes.
+        Callers get their own copy, so they can modify it freely.
+
         Returns:
             Configuration dictionary, or default empty config if file doesn't exist.
         """
-        if not self.config_file.exists():
+        stamp = self._file_stamp()
+        if stamp is None:
             return self._get_default_config()
 
+        cached = self._config_cache.get(self.config_file)
+        if cached is not None and cached[0] == stamp:
+            return copy.deepcopy(cached[1])
+
         with open(self.config_file) as f:
             config = yaml.safe_load(f) or self._get_default_config()
 
         # Run auto-migration to add missing fields
         config = self._migrate_config(config)
 
+        # If the migration saved the file, its stamp has moved on and the next
+        # load parses it once more
+        self._config_cache[self.config_file] = (stamp, copy.deepcopy(config))
         return config
 
     def save_config(self, config: dict[str, Any]) -> None:
@@ -61,6 +83,18 @@ class ConfigManager:
         with open(self.config_file, "w") as f:
             yaml.dump(config, f, default_flow_style=False, sort_keys=False)
 
+        stamp = self._file_stamp()
+        if stamp is not None:
+            self._config_cache[self.config_file] = (stamp, copy.deepcopy(config))
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        """Return the config file's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _migrate_config(self, config: dict[str, Any]) -> dict[str, Any]:
         """Auto-migrate config to add missing fields and rename old keys.
 
@@ -412,6 +446,23 @@ class ConfigManager:
             self.save_config(config)
 
     # Credential management (keyring)
+    def _get_secret(self, username: str) -> str | None:
+        """Read a secret from the keyring, reusing a recent lookup.
+
+        Lookups are cached for settings.KEYRING_CACHE_TTL seconds; this
+        manager's setters and deleters update the cache directly.
+        """
+        cached = self._secrets.get(username)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < settings.KEYRING_CACHE_TTL
+        ):
+            return cached[1]
+
+        secret = keyring.get_password(self.KEYRING_SERVICE, username)
+        self._secrets[username] = (time.monotonic(), secret)
+        return secret
+
     def set_cloudbees_pat(self, tenant_name: str, pat: str) -> None:
         """Store CloudBees PAT securely in keyring.
 
@@ -424,6 +475,7 @@ class ConfigManager:
         """
         try:
             keyring.set_password(self.KEYRING_SERVICE, f"cloudbees:{tenant_name}", pat)
+            self._secrets[f"cloudbees:{tenant_name}"] = (time.monotonic(), pat)
         except Exception as e:
             instructions = get_keyring_setup_instructions()
             raise KeyringUnavailableError(
@@ -450,9 +502,7 @@ class ConfigManager:
             return None
 
         try:
-            return keyring.get_password(
-                self.KEYRING_SERVICE, f"cloudbees:{tenant_name}"
-            )
+            return self._get_secret(f"cloudbees:{tenant_name}")
         except Exception as e:
             instructions = get_keyring_setup_instructions()
             raise KeyringUnavailableError(
@@ -466,6 +516,7 @@ class ConfigManager:
         Args:
             tenant_name: Tenant name.
         """
+        self._secrets.pop(f"cloudbees:{tenant_name}", None)
         try:
             keyring.delete_password(self.KEYRING_SERVICE, f"cloudbees:{tenant_name}")
         except Exception:
@@ -482,6 +533,7 @@ class ConfigManager:
         """
         try:
             keyring.set_password(self.KEYRING_SERVICE, "github", pat)
+            self._secrets["github"] = (time.monotonic(), pat)
         except Exception as e:
             instructions = get_keyring_setup_instructions()
             raise KeyringUnavailableError(
@@ -499,7 +551,7 @@ class ConfigManager:
             KeyringUnavailableError: If keyring backend is not available.
         """
         try:
-            return keyring.get_password(self.KEYRING_SERVICE, "github")
+            return self._get_secret("github")
         except Exception as e:
             instructions = get_keyring_setup_instructions()
             raise KeyringUnavailableError(
@@ -509,6 +561,7 @@ class ConfigManager:
 
     def delete_github_pat(self) -> None:
         """Delete GitHub PAT from keyring."""
+        self._secrets.pop("github", None)
         try:
             keyring.delete_password(self.KEYRING_SERVICE, "github")
         except Exception:
@@ -67,6 +67,16 @@ class UnifyAPIError(MimicError):
         self.response_text = response_text
 
 
+class BatchError(MimicError):
+    """A batch of concurrent operations stopped after one of them failed."""
+
+    def __init__(self, message: str, results: list[Any], error: Exception):
+        super().__init__(message)
+        # One entry per operation that ran; failed ones hold their exception
+        self.results = results
+        self.error = error
+
+
 class CredentialError(MimicError):
     """Credential validation errors."""
 
@@ -1,14 +1,29 @@
+import asyncio
 import base64
 import logging
 import re
 from typing import Any
 
 import httpx
+import orjson
+from nacl import encoding, public
 
+from mimic import settings
 from mimic.exceptions import GitHubError
+from mimic.rate_limit import TokenBucket, retry_delay
 
 logger = logging.getLogger(__name__)
 
+# GitHub remote URL forms accepted by parse_github_url, compiled once
+_HTTPS_URL_PATTERN = re.compile(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$")
+_SSH_URL_PATTERN = re.compile(r"git@github\.com:([^/]+)/(.+?)(?:\.git)?$")
+_SSH_PROTOCOL_URL_PATTERN = re.compile(
+    r"ssh://git@github\.com(?::\d+)?/([^/]+)/(.+?)(?:\.git)?$"
+)
+
+# Shared by every client so concurrent pipeline steps stay under one rate
+_RATE_LIMITER = TokenBucket(settings.GITHUB_REQUESTS_PER_SECOND)
+
 
 def parse_github_url(url: str) -> tuple[str, str] | None:
     """Parse GitHub URL to extract owner and repo name.
@@ -26,19 +41,17 @@ def parse_github_url(url: str) -> tuple[str, str] | None:
         Tuple of (owner, repo) or None if not a valid GitHub URL
     """
     # HTTPS pattern: https://github.com/owner/repo[.git]
-    https_match = re.match(r"https?://github\.com/([^/]+)/([^/]+?)(?:\.git)?/?$", url)
+    https_match = _HTTPS_URL_PATTERN.match(url)
     if https_match:
         return (https_match.group(1), https_match.group(2))
 
     # SSH pattern: git@github.com:owner/repo[.git]
-    ssh_match = re.match(r"git@github\.com:([^/]+)/(.+?)(?:\.git)?$", url)
+    ssh_match = _SSH_URL_PATTERN.match(url)
     if ssh_match:
         return (ssh_match.group(1), ssh_match.group(2))
 
     # SSH URL pattern: ssh://git@github.com[:port]/owner/repo[.git]
-    ssh_url_match = re.match(
-        r"ssh://git@github\.com(?::\d+)?/([^/]+)/(.+?)(?:\.git)?$", url
-    )
+    ssh_url_match = _SSH_PROTOCOL_URL_PATTERN.match(url)
     if ssh_url_match:
         return (ssh_url_match.group(1), ssh_url_match.group(2))
 
@@ -56,6 +69,57 @@ class GitHubClient:
             "Accept": "application/vnd.github.v3+json",
             "X-GitHub-Api-Version": "2022-11-28",
         }
+        # Pooled HTTP client, reused for every request made on the same event loop
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        # Actions secrets public keys per (owner, repo); they rotate rarely
+        self._public_key_cache: dict[tuple[str, str], dict[str, Any]] = {}
+
+    async def __aenter__(self) -> "GitHubClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_loop = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating one for the running event loop.
+
+        Connections are tied to the loop that opened them, so a client used
+        from a new loop (e.g. a later asyncio.run) gets a fresh pool. The old
+        pool is closed on its own loop when that loop is still running; callers
+        should otherwise close the client (async with) before their loop ends.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is not None and self._http_loop is not loop:
+            old_client, old_loop = self._http_client, self._http_loop
+            self._http_client = None
+            if (
+                not old_client.is_closed
+                and old_loop is not None
+                and old_loop.is_running()
+            ):
+                asyncio.run_coroutine_threadsafe(old_client.aclose(), old_loop)
+            elif not old_client.is_closed:
+                logger.debug("Discarding HTTP client left open by a finished loop")
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=settings.GITHUB_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=settings.GITHUB_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.GITHUB_MAX_KEEPALIVE,
+                ),
+            )
+            self._http_loop = loop
+        return self._http_client
 
     async def validate_credentials(self) -> tuple[bool, str | None]:
         """Validate GitHub credentials by making a lightweight API call.
@@ -83,14 +147,29 @@ class GitHubClient:
 
     async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
         """Make an authenticated request to the GitHub API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
-                method=method,
-                url=f"{self.base_url}{endpoint}",
-                headers=self.headers,
-                **kwargs,
+        # Serialize JSON bodies once with orjson rather than on every attempt;
+        # base64 file contents make these bodies large
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Type": "application/json",
+            }
+
+        client = self._get_http_client()
+        attempt = 0
+        while True:
+            await _RATE_LIMITER.acquire_async()
+            response = await client.request(method, endpoint, **kwargs)
+            delay = retry_delay(response, method, attempt)
+            if delay is None:
+                return response
+            logger.warning(
+                f"GitHub {method} {endpoint} returned {response.status_code}, "
+                f"retrying in {delay:.1f}s"
             )
-            return response
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def _parse_error_response(
         self,
@@ -124,7 +203,8 @@ class GitHubClient:
 
     async def repo_exists(self, owner: str, repo: str) -> bool:
         """Check if a repository exists."""
-        response = await self._request("GET", f"/repos/{owner}/{repo}")
+        # HEAD returns the same status as GET without the repository body
+        response = await self._request("HEAD", f"/repos/{owner}/{repo}")
         return response.status_code == 200
 
     async def get_repo(self, owner: str, repo: str) -> dict[str, Any] | None:
@@ -174,17 +254,24 @@ class GitHubClient:
         return response.json()
 
     async def get_file_in_repo(
-        self, owner: str, repo: str, path: str
+        self, owner: str, repo: str, path: str, decode: bool = True
     ) -> dict[str, Any] | None:
         """Get file contents and metadata from repo.
 
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            path: File path in the repository
+            decode: Add the UTF-8 text as decoded_content. Pass False when only
+                metadata (e.g. the sha) is needed to skip decoding the file.
+
         Raises:
             GitHubError: If file cannot be decoded as UTF-8
         """
         response = await self._request("GET", f"/repos/{owner}/{repo}/contents/{path}")
         if response.status_code == 200:
             data = response.json()
-            if "content" in data:
+            if decode and "content" in data:
                 # Content is base64 encoded, decode it
                 try:
                     content_bytes = base64.b64decode(data["content"])
@@ -208,13 +295,19 @@ class GitHubClient:
             repo: Repository name
 
         Returns:
-            Public key data including key_id and key
+            Public key data including key_id and key (cached per repository)
         """
+        cached = self._public_key_cache.get((owner, repo))
+        if cached is not None:
+            return cached
+
         response = await self._request(
             "GET", f"/repos/{owner}/{repo}/actions/secrets/public-key"
         )
         if response.status_code == 200:
-            return response.json()
+            key_data = response.json()
+            self._public_key_cache[(owner, repo)] = key_data
+            return key_data
         return None
 
     async def create_or_update_secret(
@@ -232,14 +325,54 @@ class GitHubClient:
         Returns:
             True if successful, False otherwise
         """
-        from nacl import encoding, public
+        results = await self.create_or_update_secrets(
+            owner, repo, {secret_name: secret_value}
+        )
+        return results[secret_name]
+
+    async def create_or_update_secrets(
+        self, owner: str, repo: str, secrets: dict[str, str]
+    ) -> dict[str, bool]:
+        """
+        Create or update several GitHub Actions secrets on one repository.
+
+        The repository's public key is fetched once and the secrets are
+        uploaded concurrently.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            secrets: Mapping of secret name to value (values will be encrypted)
+
+        Returns:
+            Mapping of secret name to whether it was stored successfully
+        """
+        if not secrets:
+            return {}
 
         # Get the repository's public key
         public_key_data = await self.get_repo_public_key(owner, repo)
         if not public_key_data:
             logger.error(f"Failed to get public key for {owner}/{repo}")
-            return False
+            return dict.fromkeys(secrets, False)
+
+        results = await asyncio.gather(
+            *(
+                self._put_secret(owner, repo, name, value, public_key_data)
+                for name, value in secrets.items()
+            )
+        )
+        return dict(zip(secrets, results, strict=True))
 
+    async def _put_secret(
+        self,
+        owner: str,
+        repo: str,
+        secret_name: str,
+        secret_value: str,
+        public_key_data: dict[str, Any],
+    ) -> bool:
+        """Encrypt a secret with the repository public key and upload it."""
         # Encrypt the secret value
         public_key = public.PublicKey(
             public_key_data["key"].encode("utf-8"), encoding.Base64Encoder
@@ -258,6 +391,8 @@ class GitHubClient:
         if response.status_code in [201, 204]:
             return True
         else:
+            # The key may have rotated; fetch a fresh one next time
+            self._public_key_cache.pop((owner, repo), None)
             logger.error(
                 f"Error creating/updating secret: {response.status_code} - {response.text}"
             )
@@ -291,11 +426,11 @@ class GitHubClient:
         Raises:
             GitHubError: If the API request fails
         """
-        # Encode content to base64
-        content_bytes = content.encode("utf-8")
-        content_base64 = base64.b64encode(content_bytes).decode("ascii")
-
-        data = {"message": message, "content": content_base64, "sha": sha}
+        data = {
+            "message": message,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
+            "sha": sha,
+        }
 
         if branch:
             data["branch"] = branch
@@ -343,12 +478,9 @@ class GitHubClient:
         Raises:
             GitHubError: If the API request fails
         """
-        # Base64 encode the content
-        encoded_content = base64.b64encode(content.encode()).decode()
-
         data = {
             "message": message,
-            "content": encoded_content,
+            "content": base64.b64encode(content.encode("utf-8")).decode("ascii"),
         }
 
         if branch:
@@ -422,12 +554,132 @@ class GitHubClient:
                 response_text=response.text,
             )
 
+    async def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Run a GraphQL query/mutation and return its data.
+
+        Raises:
+            GitHubError: If the request fails or GraphQL reports errors
+        """
+        response = await self._request(
+            "POST", "/graphql", json={"query": query, "variables": variables}
+        )
+        if response.status_code != 200:
+            raise GitHubError(
+                f"GraphQL request failed: {response.status_code} - {response.text}",
+                status_code=response.status_code,
+                response_text=response.text,
+            )
+
+        body = response.json()
+        if body.get("errors"):
+            messages = "; ".join(e.get("message", str(e)) for e in body["errors"])
+            raise GitHubError(
+                f"GraphQL request failed: {messages}",
+                status_code=response.status_code,
+                response_text=response.text,
+            )
+        return body.get("data") or {}
+
+    async def commit_file_changes(
+        self,
+        owner: str,
+        repo: str,
+        message: str,
+        additions: dict[str, str] | None = None,
+        deletions: list[str] | None = None,
+        branch: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Add, update and delete several files in a single commit.
+
+        Uses the GraphQL createCommitOnBranch mutation, so the whole change set
+        lands atomically instead of one commit per file.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            message: Commit message (headline)
+            additions: Mapping of file path -> new file content (will be base64 encoded)
+            deletions: File paths to delete
+            branch: Branch to commit to (defaults to the default branch)
+
+        Returns:
+            Commit data (oid, url)
+
+        Raises:
+            GitHubError: If the branch cannot be resolved or the commit fails
+        """
+        # Resolve the branch head; createCommitOnBranch needs the expected head oid
+        if branch:
+            data = await self._graphql(
+                """
+                query($owner: String!, $repo: String!, $ref: String!) {
+                  repository(owner: $owner, name: $repo) {
+                    ref(qualifiedName: $ref) { name target { oid } }
+                  }
+                }
+                """,
+                {"owner": owner, "repo": repo, "ref": f"refs/heads/{branch}"},
+            )
+            ref = (data.get("repository") or {}).get("ref")
+        else:
+            data = await self._graphql(
+                """
+                query($owner: String!, $repo: String!) {
+                  repository(owner: $owner, name: $repo) {
+                    defaultBranchRef { name target { oid } }
+                  }
+                }
+                """,
+                {"owner": owner, "repo": repo},
+            )
+            ref = (data.get("repository") or {}).get("defaultBranchRef")
+
+        if not ref:
+            raise GitHubError(
+                f"Failed to resolve branch {branch or '(default)'} in {owner}/{repo}"
+            )
+
+        file_changes: dict[str, Any] = {}
+        if additions:
+            file_changes["additions"] = [
+                {
+                    "path": path,
+                    "contents": base64.b64encode(content.encode("utf-8")).decode(
+                        "ascii"
+                    ),
+                }
+                for path, content in additions.items()
+            ]
+        if deletions:
+            file_changes["deletions"] = [{"path": path} for path in deletions]
+
+        data = await self._graphql(
+            """
+            mutation($input: CreateCommitOnBranchInput!) {
+              createCommitOnBranch(input: $input) { commit { oid url } }
+            }
+            """,
+            {
+                "input": {
+                    "branch": {
+                        "repositoryNameWithOwner": f"{owner}/{repo}",
+                        "branchName": ref["name"],
+                    },
+                    "expectedHeadOid": ref["target"]["oid"],
+                    "message": {"headline": message},
+                    "fileChanges": file_changes,
+                }
+            },
+        )
+        return (data.get("createCommitOnBranch") or {}).get("commit") or {}
+
     async def check_user_collaboration(
         self, owner: str, repo: str, username: str
     ) -> bool:
         """Check if a user is already a collaborator on a repository."""
         response = await self._request(
-            "GET", f"/repos/{owner}/{repo}/collaborators/{username}"
+            "HEAD", f"/repos/{owner}/{repo}/collaborators/{username}"
         )
         return response.status_code == 204
 
@@ -484,6 +736,28 @@ class GitHubClient:
                 f"Failed to delete repository {repo_full_name}: {response.status_code} - {response.text}"
             )
 
+    async def delete_repositories(
+        self, repo_full_names: list[str]
+    ) -> dict[str, bool | BaseException]:
+        """
+        Delete several GitHub repositories.
+
+        GitHub has no batch delete, so the deletes are sent concurrently (still
+        paced by the shared rate limiter).
+
+        Args:
+            repo_full_names: Full repository names in format "owner/repo"
+
+        Returns:
+            Mapping of repository name to the delete_repository result, or the
+            exception it raised
+        """
+        results = await asyncio.gather(
+            *(self.delete_repository(name) for name in repo_full_names),
+            return_exceptions=True,
+        )
+        return dict(zip(repo_full_names, results, strict=True))
+
     async def list_branches(self, owner: str, repo: str) -> list[dict[str, Any]]:
         """List all branches for a repository.
 
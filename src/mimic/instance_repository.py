@@ -4,10 +4,17 @@ This module implements the Repository pattern for managing Instance objects,
 providing a clean abstraction over persistence details.
 """
 
-import json
+import bisect
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
+
+import orjson
 
 from .models import Instance
 from .paths import get_config_dir
@@ -27,6 +34,18 @@ class InstanceRepository:
         >>> all_instances = repo.find_all()
     """
 
+    # Parsed state per state file, shared by every repository in the process and
+    # keyed on the file's (mtime_ns, size) so external edits are picked up
+    _state_cache: ClassVar[dict[Path, tuple[tuple[int, int], dict[str, Any]]]] = {}
+
+    # Lookup indexes (by field, and by expiry), built lazily per state
+    # snapshot. Snapshots are never mutated in place, so an index stays valid
+    # for as long as the snapshot it was built from is current
+    _index_cache: ClassVar[dict[Path, tuple[dict[str, Any], dict[str, Any]]]] = {}
+
+    # One writer at a time per state file; readers never take the lock
+    _write_locks: ClassVar[dict[Path, threading.Lock]] = {}
+
     def __init__(self, state_file: Path | str | None = None):
         """
         Initialize the instance repository.
@@ -43,17 +62,32 @@ class InstanceRepository:
         if not self.state_file.exists():
             self._save_state({"instances": {}})
 
+    def _file_stamp(self) -> tuple[int, int] | None:
+        """Return the state file's (mtime_ns, size), or None if it doesn't exist."""
+        try:
+            stat = self.state_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_state(self) -> dict[str, Any]:
         """Load state from JSON file with auto-migration.
 
+        The parsed state is kept in memory and reused until the file changes.
+
         Returns:
             Dictionary containing instances data
         """
-        if not self.state_file.exists():
+        stamp = self._file_stamp()
+        if stamp is None:
             return {"instances": {}}
 
-        with open(self.state_file) as f:
-            state = json.load(f)
+        cached = self._state_cache.get(self.state_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        with open(self.state_file, "rb") as f:
+            state = orjson.loads(f.read())
 
         # MIGRATE: environment → tenant in all instances
         needs_save = False
@@ -64,17 +98,47 @@ class InstanceRepository:
 
         if needs_save:
             self._save_state(state)
+        else:
+            self._state_cache[self.state_file] = (stamp, state)
 
         return state
 
     def _save_state(self, state: dict[str, Any]) -> None:
         """Save state to JSON file.
 
+        The state is serialized in one go and written to a temporary file that
+        atomically replaces the state file, so readers never see a partial write.
+
         Args:
             state: Dictionary containing instances data
         """
-        with open(self.state_file, "w") as f:
-            json.dump(state, f, indent=2, default=str)
+        data = orjson.dumps(
+            state,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+        tmp_file = self.state_file.with_name(f".{self.state_file.name}.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.state_file)
+
+        stamp = self._file_stamp()
+        if stamp is not None:
+            self._state_cache[self.state_file] = (stamp, state)
+
+    @contextmanager
+    def _writer(self) -> Iterator[dict[str, Any]]:
+        """Yield a private copy of the state to modify, saving it on exit.
+
+        Writers are serialized per state file. Readers keep using the current
+        snapshot (which is never mutated in place) until the new state is saved.
+        Nothing is written if the block raises.
+        """
+        with self._write_locks.setdefault(self.state_file, threading.Lock()):
+            state = self._load_state()
+            new_state = {**state, "instances": dict(state["instances"])}
+            yield new_state
+            self._save_state(new_state)
 
     def save(self, instance: Instance) -> None:
         """Persist an instance with all its resources.
@@ -87,9 +151,8 @@ class InstanceRepository:
             >>> instance = Instance(id="abc-123", ...)
             >>> repo.save(instance)
         """
-        state = self._load_state()
-        state["instances"][instance.id] = instance.model_dump(mode="json")
-        self._save_state(state)
+        with self._writer() as state:
+            state["instances"][instance.id] = instance.model_dump(mode="json")
 
     def get_by_id(self, instance_id: str) -> Instance | None:
         """Load and hydrate an instance by ID.
@@ -129,13 +192,92 @@ class InstanceRepository:
             >>> if instance:
             ...     print(f"Found instance: {instance.id}")
         """
+        matches = self._lookup("name", name)
+        return Instance(**matches[0]) if matches else None
+
+    def _lookup(self, field: str, value: Any) -> list[dict[str, Any]]:
+        """Return the raw data of stored instances whose field equals value.
+
+        Uses an index on the field that is built once per state snapshot.
+        """
+
+        def build(instances: dict[str, Any]) -> dict[Any, list[str]]:
+            index: dict[Any, list[str]] = {}
+            for instance_id, instance_data in instances.items():
+                index.setdefault(instance_data.get(field), []).append(instance_id)
+            return index
+
+        instances, index = self._snapshot_index(f"field:{field}", build)
+        return [instances[i] for i in index.get(value, [])]
+
+    def _snapshot_index(
+        self, name: str, build: Callable[[dict[str, Any]], Any]
+    ) -> tuple[dict[str, Any], Any]:
+        """Return the current instances and the named index built over them.
+
+        The index is built with build(instances) the first time it is needed
+        for a state snapshot and reused until the state changes.
+        """
         state = self._load_state()
+        cached = self._index_cache.get(self.state_file)
+        if cached is None or cached[0] is not state:
+            cached = (state, {})
+            self._index_cache[self.state_file] = cached
+
+        indexes = cached[1]
+        if name not in indexes:
+            indexes[name] = build(state["instances"])
+        return state["instances"], indexes[name]
+
+    def _expired_data(self) -> list[dict[str, Any]]:
+        """Return the raw data of expired instances, soonest-expired first.
+
+        Walks an index of only the instances that have an expiry, sorted by
+        expires_at, so never-expiring instances are skipped entirely and the
+        walk stops at the first instance that hasn't expired yet.
+        """
+
+        def build(instances: dict[str, Any]) -> tuple[list[datetime], list[str]]:
+            entries = sorted(
+                (expires_at, instance_id)
+                for instance_id, instance_data in instances.items()
+                if (expires_at := self._expires_at(instance_data)) is not None
+            )
+            return [e[0] for e in entries], [e[1] for e in entries]
+
+        instances, (times, ids) = self._snapshot_index("expiry", build)
+        expired_ids = ids[: bisect.bisect_right(times, datetime.now())]
+        return [instances[instance_id] for instance_id in expired_ids]
+
+    @staticmethod
+    def _hydrate(instances_data: Iterable[dict[str, Any]]) -> list[Instance]:
+        """Hydrate raw instance data, sorted by creation date (newest first)."""
+        instances = [Instance(**instance_data) for instance_data in instances_data]
+        instances.sort(key=attrgetter("created_at"), reverse=True)
+        return instances
 
-        for instance_data in state["instances"].values():
-            if instance_data.get("name") == name:
-                return Instance(**instance_data)
+    def _find(self, predicate: Callable[[dict[str, Any]], bool]) -> list[Instance]:
+        """Hydrate only the stored instances whose raw data matches predicate.
 
-        return None
+        Returns:
+            Matching Instance objects, sorted by creation date (newest first)
+        """
+        state = self._load_state()
+        return self._hydrate(
+            instance_data
+            for instance_data in state["instances"].values()
+            if predicate(instance_data)
+        )
+
+    @staticmethod
+    def _expires_at(instance_data: dict[str, Any]) -> datetime | None:
+        """Read expires_at from stored instance data without hydrating it."""
+        expires_at = instance_data.get("expires_at")
+        if expires_at is None:
+            return None
+        if isinstance(expires_at, datetime):
+            return expires_at
+        return datetime.fromisoformat(expires_at)
 
     def find_all(self, include_expired: bool = True) -> list[Instance]:
         """Load all instances.
@@ -151,27 +293,17 @@ class InstanceRepository:
             >>> all_instances = repo.find_all()
             >>> active_only = repo.find_all(include_expired=False)
         """
-        state = self._load_state()
-        instances = []
+        if include_expired:
+            return self._find(lambda _: True)
+
+        # Include instance if it never expires or hasn't expired yet
         now = datetime.now()
 
-        for instance_data in state["instances"].values():
-            instance = Instance(**instance_data)
-
-            # Include instance if:
-            # - include_expired is True, OR
-            # - instance never expires (expires_at is None), OR
-            # - instance hasn't expired yet
-            if (
-                include_expired
-                or instance.expires_at is None
-                or instance.expires_at > now
-            ):
-                instances.append(instance)
-
-        # Sort by creation date, newest first
-        instances.sort(key=lambda i: i.created_at, reverse=True)
-        return instances
+        def is_active(instance_data: dict[str, Any]) -> bool:
+            expires_at = self._expires_at(instance_data)
+            return expires_at is None or expires_at > now
+
+        return self._find(is_active)
 
     def find_by_scenario(self, scenario_id: str) -> list[Instance]:
         """Find instances by scenario ID.
@@ -187,8 +319,7 @@ class InstanceRepository:
             >>> instances = repo.find_by_scenario("feature-flags-demo")
             >>> print(f"Found {len(instances)} instances")
         """
-        all_instances = self.find_all(include_expired=True)
-        return [i for i in all_instances if i.scenario_id == scenario_id]
+        return self._hydrate(self._lookup("scenario_id", scenario_id))
 
     def find_by_tenant(self, tenant: str) -> list[Instance]:
         """Find instances by CloudBees tenant.
@@ -203,8 +334,7 @@ class InstanceRepository:
             >>> repo = InstanceRepository()
             >>> prod_instances = repo.find_by_tenant("prod")
         """
-        all_instances = self.find_all(include_expired=True)
-        return [i for i in all_instances if i.tenant == tenant]
+        return self._hydrate(self._lookup("tenant", tenant))
 
     def find_expired(self) -> list[Instance]:
         """Find all expired instances.
@@ -219,11 +349,40 @@ class InstanceRepository:
             >>> expired = repo.find_expired()
             >>> print(f"Found {len(expired)} expired instances")
         """
-        now = datetime.now()
-        all_instances = self.find_all(include_expired=True)
-        return [
-            i for i in all_instances if i.expires_at is not None and i.expires_at <= now
-        ]
+        return self._hydrate(self._expired_data())
+
+    def iter_expired(self) -> Iterator[Instance]:
+        """Yield expired instances one at a time, soonest-expired first.
+
+        Unlike find_expired(), only the instance currently being processed is
+        hydrated. Iteration runs over the state as it was when it started, so
+        saving or deleting instances along the way is safe.
+
+        Examples:
+            >>> repo = InstanceRepository()
+            >>> for instance in repo.iter_expired():
+            ...     print(instance.id)
+        """
+        for instance_data in self._expired_data():
+            yield Instance(**instance_data)
+
+    def count(self, expired_only: bool = False) -> int:
+        """Count stored instances without loading them into Instance objects.
+
+        Args:
+            expired_only: Only count instances that have expired
+
+        Returns:
+            Number of matching instances
+
+        Examples:
+            >>> repo = InstanceRepository()
+            >>> repo.count(), repo.count(expired_only=True)
+            (12, 3)
+        """
+        if expired_only:
+            return len(self._expired_data())
+        return len(self._load_state()["instances"])
 
     def delete(self, instance_id: str) -> None:
         """Delete an instance from storage.
@@ -238,13 +397,37 @@ class InstanceRepository:
             >>> repo = InstanceRepository()
             >>> repo.delete("abc-123")
         """
-        state = self._load_state()
+        with self._writer() as state:
+            if instance_id not in state["instances"]:
+                raise ValueError(f"Instance {instance_id} not found")
+
+            del state["instances"][instance_id]
+
+    def delete_many(self, instance_ids: list[str]) -> int:
+        """Delete several instances from storage with a single write.
 
-        if instance_id not in state["instances"]:
-            raise ValueError(f"Instance {instance_id} not found")
+        IDs that aren't stored are ignored.
 
-        del state["instances"][instance_id]
-        self._save_state(state)
+        Args:
+            instance_ids: The IDs of the instances to delete
+
+        Returns:
+            Number of instances deleted
+
+        Examples:
+            >>> repo = InstanceRepository()
+            >>> repo.delete_many(["abc-123", "def-456"])
+            2
+        """
+        if not instance_ids:
+            return 0
+
+        with self._writer() as state:
+            deleted = 0
+            for instance_id in instance_ids:
+                if state["instances"].pop(instance_id, None) is not None:
+                    deleted += 1
+        return deleted
 
     def exists(self, instance_id: str) -> bool:
         """Check if an instance exists.
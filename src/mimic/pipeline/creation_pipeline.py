@@ -4,14 +4,17 @@ Orchestrates the setup of a complete scenario including repos, components, envir
 """
 
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Any
+from functools import partial
+from typing import Any, TypeVar
 
 from rich.console import Console
 from rich.progress import (
     BarColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TaskProgressColumn,
     TextColumn,
 )
@@ -30,11 +33,46 @@ from mimic.models import (
 from mimic.pipeline.repository_manager import RepositoryManager
 from mimic.pipeline.resource_manager import ResourceManager
 from mimic.scenarios import Scenario
+from mimic.utils import gather_or_cancel
 
 logger = logging.getLogger(__name__)
 console = Console()
 
 
+class ConsoleLogHandler(logging.Handler):
+    """Logging handler that writes plain messages through the shared Rich console.
+
+    Going through the console keeps log lines above the live progress bar
+    instead of tearing it.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record)
+            if record.levelno >= logging.WARNING:
+                message = f"[{record.levelname}] {message}"
+            console.print(message, markup=False, highlight=False, soft_wrap=True)
+        except Exception:
+            self.handleError(record)
+
+
+def configure_pipeline_logging() -> None:
+    """Send pipeline progress (INFO and up) to the console.
+
+    Called once at CLI startup; the web server leaves pipeline records to its
+    own (root/uvicorn) handlers. Calling it again is a no-op.
+    """
+    pipeline_logger = logging.getLogger("mimic.pipeline")
+    if any(isinstance(h, ConsoleLogHandler) for h in pipeline_logger.handlers):
+        return
+
+    pipeline_logger.addHandler(ConsoleLogHandler())
+    pipeline_logger.setLevel(logging.INFO)
+
+
+T = TypeVar("T")
+
+
 class CreationPipeline:
     """Orchestrates the creation of a complete CloudBees scenario."""
 
@@ -76,12 +114,12 @@ class CreationPipeline:
         self.expires_at = expires_at
         self.created_at = datetime.now()
 
-        # Initialize GitHub client
-        github_client = GitHubClient(github_pat)
+        # Initialize GitHub client (one pooled session for the whole run)
+        self.github_client = GitHubClient(github_pat)
 
         # Initialize managers
         self.repo_manager = RepositoryManager(
-            github_client,
+            self.github_client,
             invitee_username,
             organization_id,
             unify_base_url,
@@ -186,226 +224,144 @@ class CreationPipeline:
                 main_task = progress.add_task(
                     "[cyan]Executing scenario...", total=total_steps
                 )
-                completed_steps = 0
-
-                # Step 1: Create repositories
-                self.current_step = "repository_creation"
-                await self._emit_event(
-                    "task_start",
-                    {
-                        "task_id": "repositories",
-                        "description": "Creating GitHub repositories",
-                        "total": len(resolved_scenario.repositories),
-                    },
-                )
-                progress.update(
-                    main_task, description="[cyan]Creating GitHub repositories..."
-                )
-                created_repositories = await self.repo_manager.create_repositories(
-                    resolved_scenario.repositories, processed_parameters
-                )
-                completed_steps += 1
-                progress.update(
-                    main_task,
-                    completed=completed_steps,
-                    description=f"[green]✓[/green] Created {len(created_repositories)} repositories",
-                )
-                await self._emit_event(
-                    "task_complete",
-                    {
-                        "task_id": "repositories",
-                        "success": True,
-                        "message": f"Created {len(created_repositories)} repositories",
-                    },
-                )
 
-                # Step 2: Create components
-                self.current_step = "component_creation"
                 component_repos = [
                     r for r in resolved_scenario.repositories if r.create_component
                 ]
-                if component_repos:
-                    await self._emit_event(
-                        "task_start",
-                        {
-                            "task_id": "components",
-                            "description": "Creating CloudBees components",
-                            "total": len(component_repos),
-                        },
-                    )
-                    progress.update(
-                        main_task, description="[cyan]Creating CloudBees components..."
-                    )
-                    created_components = await self.resource_manager.create_components(
-                        resolved_scenario.repositories, created_repositories
-                    )
-                    completed_steps += 1
-                    progress.update(
-                        main_task,
-                        completed=completed_steps,
-                        description=f"[green]✓[/green] Created {len(created_components)} components",
-                    )
-                    await self._emit_event(
-                        "task_complete",
-                        {
-                            "task_id": "components",
-                            "success": True,
-                            "message": f"Created {len(created_components)} components",
-                        },
-                    )
+                fm_envs = [
+                    e for e in resolved_scenario.environments if e.create_fm_token_var
+                ]
+
+                # Steps run as a dependency graph rather than a strict sequence:
+                #   repositories -> components --+
+                #                                 +--> applications -> SDK keys -> flags
+                #   environments ----------------+
+                # Flag definitions are local bookkeeping, so they are stored up front.
 
                 # Step 3: Define feature flags
-                self.current_step = "flag_creation"
                 if resolved_scenario.flags:
-                    await self._emit_event(
-                        "task_start",
-                        {
-                            "task_id": "flags",
-                            "description": "Defining feature flags",
-                            "total": len(resolved_scenario.flags),
-                        },
-                    )
-                    progress.update(
-                        main_task, description="[cyan]Defining feature flags..."
-                    )
-                    await self.resource_manager.define_flags(resolved_scenario.flags)
-                    completed_steps += 1
-                    progress.update(
+                    await self._run_step(
+                        progress,
                         main_task,
-                        completed=completed_steps,
-                        description=f"[green]✓[/green] Defined {len(self.resource_manager.flag_definitions)} flags",
-                    )
-                    await self._emit_event(
-                        "task_complete",
-                        {
-                            "task_id": "flags",
-                            "success": True,
-                            "message": f"Defined {len(self.resource_manager.flag_definitions)} flags",
-                        },
+                        step="flag_creation",
+                        description="Defining feature flags",
+                        operation=partial(
+                            self.resource_manager.define_flags,
+                            resolved_scenario.flags,
+                        ),
+                        done_message=lambda flags: f"Defined {len(flags)} flags",
+                        task_id="flags",
+                        total=len(resolved_scenario.flags),
                     )
 
-                # Step 4: Create environments
-                self.current_step = "environment_creation"
-                if resolved_scenario.environments:
-                    await self._emit_event(
-                        "task_start",
-                        {
-                            "task_id": "environments",
-                            "description": "Creating environments",
-                            "total": len(resolved_scenario.environments),
-                        },
-                    )
-                    progress.update(
-                        main_task, description="[cyan]Creating environments..."
-                    )
-                    created_environments = (
-                        await self.resource_manager.create_environments(
-                            resolved_scenario.environments
-                        )
-                    )
-                    completed_steps += 1
-                    progress.update(
+                async def repositories_then_components() -> None:
+                    # Step 1: Create repositories
+                    created_repositories = await self._run_step(
+                        progress,
                         main_task,
-                        completed=completed_steps,
-                        description=f"[green]✓[/green] Created {len(created_environments)} environments",
-                    )
-                    await self._emit_event(
-                        "task_complete",
-                        {
-                            "task_id": "environments",
-                            "success": True,
-                            "message": f"Created {len(created_environments)} environments",
-                        },
+                        step="repository_creation",
+                        description="Creating GitHub repositories",
+                        operation=partial(
+                            self.repo_manager.create_repositories,
+                            resolved_scenario.repositories,
+                            processed_parameters,
+                        ),
+                        done_message=lambda repos: f"Created {len(repos)} repositories",
+                        task_id="repositories",
+                        total=len(resolved_scenario.repositories),
                     )
 
-                # Step 5: Create applications
-                self.current_step = "application_creation"
-                await self._emit_event(
-                    "task_start",
-                    {
-                        "task_id": "applications",
-                        "description": "Creating applications",
-                        "total": len(resolved_scenario.applications),
-                    },
-                )
-                progress.update(main_task, description="[cyan]Creating applications...")
-                created_applications = await self.resource_manager.create_applications(
-                    resolved_scenario.applications
-                )
-                completed_steps += 1
-                progress.update(
+                    # Step 2: Create components
+                    if component_repos:
+                        await self._run_step(
+                            progress,
+                            main_task,
+                            step="component_creation",
+                            description="Creating CloudBees components",
+                            operation=partial(
+                                self.resource_manager.create_components,
+                                resolved_scenario.repositories,
+                                created_repositories,
+                            ),
+                            done_message=lambda comps: (
+                                f"Created {len(comps)} components"
+                            ),
+                            task_id="components",
+                            total=len(component_repos),
+                        )
+
+                async def environments() -> None:
+                    # Step 4: Create environments
+                    if resolved_scenario.environments:
+                        await self._run_step(
+                            progress,
+                            main_task,
+                            step="environment_creation",
+                            description="Creating environments",
+                            operation=partial(
+                                self.resource_manager.create_environments,
+                                resolved_scenario.environments,
+                            ),
+                            done_message=lambda envs: (
+                                f"Created {len(envs)} environments"
+                            ),
+                            task_id="environments",
+                            total=len(resolved_scenario.environments),
+                        )
+
+                await gather_or_cancel(repositories_then_components(), environments())
+
+                # Step 5: Create applications (needs component and environment IDs)
+                await self._run_step(
+                    progress,
                     main_task,
-                    completed=completed_steps,
-                    description=f"[green]✓[/green] Created {len(created_applications)} applications",
-                )
-                await self._emit_event(
-                    "task_complete",
-                    {
-                        "task_id": "applications",
-                        "success": True,
-                        "message": f"Created {len(created_applications)} applications",
-                    },
+                    step="application_creation",
+                    description="Creating applications",
+                    operation=partial(
+                        self.resource_manager.create_applications,
+                        resolved_scenario.applications,
+                    ),
+                    done_message=lambda apps: f"Created {len(apps)} applications",
+                    task_id="applications",
+                    total=len(resolved_scenario.applications),
                 )
 
                 # Step 5.5: Update environments with FM_TOKEN
-                self.current_step = "environment_fm_token_update"
-                fm_envs = [
-                    e for e in resolved_scenario.environments if e.create_fm_token_var
-                ]
                 if fm_envs:
-                    progress.update(
-                        main_task,
-                        description="[cyan]Adding SDK keys to environments...",
-                    )
-
                     # Build mapping of environment_name -> application_name
                     env_to_app_mapping = {}
                     for app_config in resolved_scenario.applications:
                         for env_name in app_config.environments:
                             env_to_app_mapping[env_name] = app_config.name
 
-                    await self.resource_manager.update_environments_with_fm_tokens(
-                        resolved_scenario.environments,
-                        self.use_legacy_flags,
-                        env_to_app_mapping,
-                    )
-                    completed_steps += 1
-                    progress.update(
+                    await self._run_step(
+                        progress,
                         main_task,
-                        completed=completed_steps,
-                        description="[green]✓[/green] SDK keys configured",
+                        step="environment_fm_token_update",
+                        description="Adding SDK keys to environments",
+                        operation=partial(
+                            self.resource_manager.update_environments_with_fm_tokens,
+                            resolved_scenario.environments,
+                            self.use_legacy_flags,
+                            env_to_app_mapping,
+                        ),
+                        done_message=lambda _: "SDK keys configured",
                     )
 
                 # Step 6: Configure flags
-                self.current_step = "flag_configuration"
                 if resolved_scenario.flags:
-                    await self._emit_event(
-                        "task_start",
-                        {
-                            "task_id": "flag_configuration",
-                            "description": "Configuring feature flags",
-                            "total": len(resolved_scenario.flags),
-                        },
-                    )
-                    progress.update(
-                        main_task, description="[cyan]Configuring feature flags..."
-                    )
-                    await self.resource_manager.configure_flags_in_environments(
-                        resolved_scenario
-                    )
-                    completed_steps += 1
-                    progress.update(
+                    await self._run_step(
+                        progress,
                         main_task,
-                        completed=completed_steps,
-                        description="[green]✓[/green] Feature flags configured",
-                    )
-                    await self._emit_event(
-                        "task_complete",
-                        {
-                            "task_id": "flag_configuration",
-                            "success": True,
-                            "message": "Feature flags configured",
-                        },
+                        step="flag_configuration",
+                        description="Configuring feature flags",
+                        operation=partial(
+                            self.resource_manager.configure_flags_in_environments,
+                            resolved_scenario,
+                        ),
+                        done_message=lambda _: "Feature flags configured",
+                        task_id="flag_configuration",
+                        total=len(resolved_scenario.flags),
                     )
 
                 self.current_step = "completed"
@@ -461,6 +417,58 @@ class CreationPipeline:
                     self.current_step,
                     {"scenario": scenario.name, "error_type": type(e).__name__},
                 ) from e
+            finally:
+                # Release the HTTP sessions shared across all steps
+                self.resource_manager.close()
+                await self.github_client.aclose()
+
+    async def _run_step(
+        self,
+        progress: Progress,
+        main_task: TaskID,
+        step: str,
+        description: str,
+        operation: Callable[[], Awaitable[T]],
+        done_message: Callable[[T], str],
+        task_id: str | None = None,
+        total: int = 0,
+    ) -> T:
+        """Run one pipeline step, reporting progress and SSE events around it.
+
+        Args:
+            progress: Rich progress display
+            main_task: Progress task tracking the whole scenario
+            step: Step name recorded in current_step (used in error reporting)
+            description: Human-readable description of the step
+            operation: Async callable performing the step
+            done_message: Builds the completion message from the step result
+            task_id: SSE task ID; no events are emitted when omitted
+            total: Number of items the step processes (for SSE clients)
+        """
+        self.current_step = step
+        if task_id:
+            await self._emit_event(
+                "task_start",
+                {"task_id": task_id, "description": description, "total": total},
+            )
+        progress.update(main_task, description=f"[cyan]{description}...")
+
+        try:
+            result = await operation()
+        except Exception:
+            # Steps may run concurrently, so pin the failing one for error reporting
+            self.current_step = step
+            raise
+
+        message = done_message(result)
+        progress.update(main_task, description=f"[green]✓[/green] {message}")
+        progress.advance(main_task)
+        if task_id:
+            await self._emit_event(
+                "task_complete",
+                {"task_id": task_id, "success": True, "message": message},
+            )
+        return result
 
     def _generate_summary(self) -> dict[str, Any]:
         """Generate a summary of what was created."""
@@ -523,6 +531,11 @@ class CreationPipeline:
             )
             flags.append(flag)
 
+        # Flag IDs associated with every environment. This is a simplified
+        # approach - in reality we'd need to track which flags were configured
+        # for which environments
+        all_flag_ids = [flag.id for flag in flags]
+
         # Convert environments
         environments = []
         for name, env_data in self.resource_manager.created_environments.items():
@@ -536,44 +549,33 @@ class CreationPipeline:
                 )
                 variables.append(var)
 
-            # Find flags associated with this environment
-            flag_ids = []
-            for flag_data in self.resource_manager.created_flags.values():
-                # This is a simplified approach - in reality we'd need to track
-                # which flags were configured for which environments
-                flag_ids.append(flag_data.get("id", ""))
-
             environment = CloudBeesEnvironment(
                 id=env_data.get("id", ""),
                 name=name,
                 org_id=self.organization_id,
                 variables=variables,
-                flag_ids=flag_ids,
+                flag_ids=list(all_flag_ids),
                 created_at=self.created_at,
             )
             environments.append(environment)
 
+        # Whether each application is marked as shared in the scenario
+        # (first definition wins)
+        shared_apps: dict[str, bool] = {}
+        for app_config in resolved_scenario.applications:
+            shared_apps.setdefault(app_config.name, app_config.is_shared)
+
         # Convert applications
         applications = []
         for name, app_data in self.resource_manager.created_applications.items():
-            # Get component IDs
-            component_ids = []
-            for comp in components:
-                if comp.id in app_data.get("components", []):
-                    component_ids.append(comp.id)
-
-            # Get environment IDs
-            environment_ids = []
-            for env in environments:
-                if env.id in app_data.get("environments", []):
-                    environment_ids.append(env.id)
-
-            # Find if this application is marked as shared in the scenario
-            is_shared = False
-            for app_config in resolved_scenario.applications:
-                if app_config.name == name:
-                    is_shared = app_config.is_shared
-                    break
+            # Get component and environment IDs linked to this application
+            linked_components = set(app_data.get("components", []))
+            component_ids = [c.id for c in components if c.id in linked_components]
+            linked_environments = set(app_data.get("environments", []))
+            environment_ids = [
+                e.id for e in environments if e.id in linked_environments
+            ]
+            is_shared = shared_apps.get(name, False)
 
             application = CloudBeesApplication(
                 id=app_data.get("id", ""),
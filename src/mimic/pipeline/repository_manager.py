@@ -6,6 +6,8 @@ Handles creation, modification, and collaboration management for GitHub reposito
 
 import asyncio
 import logging
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 from mimic import settings
@@ -13,10 +15,34 @@ from mimic.exceptions import GitHubError
 from mimic.gh import GitHubClient
 from mimic.pipeline.retry_handler import RetryHandler
 from mimic.unify import UnifyAPIClient
+from mimic.utils import apply_replacements
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RepoChangePlan:
+    """File changes for one repository, collected and pushed as a single commit."""
+
+    additions: dict[str, str] = field(default_factory=dict)  # path -> new content
+    deletions: list[str] = field(default_factory=list)
+
+    def add(self, path: str, content: str) -> None:
+        """Create or overwrite a file."""
+        self.additions[path] = content
+        if path in self.deletions:
+            self.deletions.remove(path)
+
+    def delete(self, path: str, exists_in_repo: bool) -> None:
+        """Remove a file, whether it is committed already or only planned."""
+        self.additions.pop(path, None)
+        if exists_in_repo and path not in self.deletions:
+            self.deletions.append(path)
+
+    def is_empty(self) -> bool:
+        return not self.additions and not self.deletions
+
+
 class RepositoryManager:
     """Manages GitHub repository operations for scenario execution."""
 
@@ -48,6 +74,9 @@ class RepositoryManager:
         self.event_callback = event_callback
         self.created_repositories: dict[str, dict[str, Any]] = {}
 
+        # Per-run cache of file contents, keyed on (owner, repo, path); None = missing
+        self._file_cache: dict[tuple[str, str, str], dict[str, Any] | None] = {}
+
     async def _emit_event(self, event_type: str, data: dict[str, Any]) -> None:
         """Emit an event if callback is configured.
 
@@ -76,7 +105,10 @@ class RepositoryManager:
         Returns:
             Dictionary mapping repo names to created repository data
         """
-        print("\n📁 Step 1: Creating repositories...")
+        logger.info("\n📁 Step 1: Creating repositories...")
+
+        # (owner, repo) pairs to invite the collaborator to, in creation order
+        invite_targets: dict[tuple[str, str], None] = {}
 
         for repo_config in repositories:
             source_parts = repo_config.source.split("/")
@@ -89,7 +121,7 @@ class RepositoryManager:
 
             # Check if repository already exists
             if await self.github.repo_exists(target_org, repo_name):
-                print(
+                logger.info(
                     f"   ⏭️  Repository {target_org}/{repo_name} already exists, skipping creation"
                 )
                 await self._emit_event(
@@ -107,7 +139,7 @@ class RepositoryManager:
                     "existed": True,
                 }
             else:
-                print(
+                logger.info(
                     f"   Creating {target_org}/{repo_name} from {repo_config.source}..."
                 )
                 await self._emit_event(
@@ -127,7 +159,7 @@ class RepositoryManager:
                     description=f"Created from {repo_config.source}",
                 )
 
-                print(f"   ✅ Repository created: {new_repo['html_url']}")
+                logger.info(f"   ✅ Repository created: {new_repo['html_url']}")
                 await self._emit_event(
                     "task_progress",
                     {
@@ -147,28 +179,50 @@ class RepositoryManager:
                     "existed": False,
                 }
 
-                # Wait for repo to be ready
-                await asyncio.sleep(3)
-
-            # Apply content replacements to specified files
+                # Wait for the template contents to land on a branch
+                if not await RetryHandler.wait_until(
+                    partial(self._repo_has_branches, target_org, repo_name)
+                ):
+                    logger.warning(
+                        f"Repository {target_org}/{repo_name} has no branches yet, continuing"
+                    )
+
+            # Plan content replacements and conditional file operations, then
+            # push them all as one commit
+            plan = RepoChangePlan()
+
+            # Fetch the files to modify concurrently up front
+            await asyncio.gather(
+                *(
+                    self._get_file(target_org, repo_name, file_path)
+                    for file_path in repo_config.files_to_modify
+                )
+            )
             for file_path in repo_config.files_to_modify:
                 await self._apply_file_replacements(
-                    target_org, repo_name, file_path, repo_config.replacements
+                    target_org, repo_name, file_path, repo_config.replacements, plan
                 )
 
-            # Apply conditional file operations
             await self._apply_conditional_file_operations(
                 target_org,
                 repo_name,
                 repo_config.conditional_file_operations,
                 parameters,
+                plan,
             )
 
-            # Invite collaborator if specified
-            if self.invitee_username:
-                await self._invite_collaborator(
-                    target_org, repo_name, self.invitee_username
+            await self._commit_plan(target_org, repo_name, plan)
+
+            invite_targets[(target_org, repo_name)] = None
+
+        # Invite collaborator to every repository concurrently if specified
+        if self.invitee_username:
+            await asyncio.gather(
+                *(
+                    self._invite_collaborator(owner, repo, self.invitee_username)
+                    for owner, repo in invite_targets
                 )
+            )
 
         # Smart delay based on whether we need component creation
         needs_component_creation = any(repo.create_component for repo in repositories)
@@ -198,30 +252,60 @@ class RepositoryManager:
                             self.event_callback,
                         )
                 else:
-                    print("   ⏭️  All repositories already existed, no sync needed")
+                    logger.info(
+                        "   ⏭️  All repositories already existed, no sync needed"
+                    )
             else:
                 # Fallback to basic delay if CloudBees credentials not available
-                print(
+                logger.info(
                     f"   ⏸️  Waiting {settings.REPO_BASIC_DELAY}s for repositories to be ready..."
                 )
                 await asyncio.sleep(settings.REPO_BASIC_DELAY)
-        else:
-            print(
-                f"   Waiting {settings.REPO_BASIC_DELAY}s for repositories to be ready..."
-            )
-            await asyncio.sleep(settings.REPO_BASIC_DELAY)
 
         return self.created_repositories
 
+    async def _repo_has_branches(self, owner: str, repo: str) -> bool:
+        """Check whether a freshly generated repository has its content yet."""
+        return bool(await self.github.list_branches(owner, repo))
+
+    async def _get_file(
+        self, owner: str, repo: str, path: str
+    ) -> dict[str, Any] | None:
+        """Fetch a file from GitHub at most once per run."""
+        key = (owner, repo, path)
+        if key not in self._file_cache:
+            file_data = await self.github.get_file_in_repo(owner, repo, path)
+            if file_data:
+                # Only decoded_content is used; don't keep the base64 copy too
+                file_data.pop("content", None)
+            self._file_cache[key] = file_data
+        return self._file_cache[key]
+
+    async def _read_planned(
+        self, owner: str, repo: str, path: str, plan: RepoChangePlan
+    ) -> str | None:
+        """Read a file as it will look once the plan is committed (None if absent)."""
+        if path in plan.additions:
+            return plan.additions[path]
+        if path in plan.deletions:
+            return None
+        file_data = await self._get_file(owner, repo, path)
+        return file_data.get("decoded_content", "") if file_data else None
+
     async def _apply_file_replacements(
-        self, owner: str, repo: str, file_path: str, replacements: dict[str, str]
+        self,
+        owner: str,
+        repo: str,
+        file_path: str,
+        replacements: dict[str, str],
+        plan: RepoChangePlan,
     ):
-        """Apply content replacements to a file in the repository.
+        """Plan content replacements for a file in the repository.
 
         Raises:
-            GitHubError: If replacement operations fail
+            GitHubError: If the file cannot be read
         """
-        print(f"     Applying replacements to {file_path}...")
+        logger.info(f"     Applying replacements to {file_path}...")
         await self._emit_event(
             "task_progress",
             {
@@ -231,42 +315,7 @@ class RepositoryManager:
         )
 
         try:
-            # Get file content from GitHub
-            file_data = await self.github.get_file_in_repo(owner, repo, file_path)
-            if not file_data:
-                logger.warning(f"File {file_path} not found in {owner}/{repo}")
-                print(f"     Warning: File {file_path} not found")
-                return
-
-            original_content = file_data.get("decoded_content", "")
-
-            # Apply replacements
-            modified_content = original_content
-            for find_str, replace_str in replacements.items():
-                modified_content = modified_content.replace(find_str, replace_str)
-
-            # Only update if content actually changed
-            if modified_content != original_content:
-                await self.github.replace_file(
-                    owner=owner,
-                    repo=repo,
-                    path=file_path,
-                    content=modified_content,
-                    message=f"Apply scenario replacements to {file_path}",
-                    sha=file_data["sha"],
-                )
-                logger.info(f"Successfully updated {file_path} in {owner}/{repo}")
-                print(f"     ✅ Updated {file_path}")
-                await self._emit_event(
-                    "task_progress",
-                    {
-                        "task_id": "repositories",
-                        "message": f"Updated {file_path} in {owner}/{repo}",
-                    },
-                )
-            else:
-                print(f"     No changes needed for {file_path}")
-
+            original_content = await self._read_planned(owner, repo, file_path, plan)
         except GitHubError as e:
             error_msg = f"Failed to apply replacements to {file_path}: {e}"
             logger.error(error_msg)
@@ -282,14 +331,29 @@ class RepositoryManager:
             # Re-raise to halt execution - don't continue with broken replacements
             raise
 
+        if original_content is None:
+            logger.warning(f"File {file_path} not found in {owner}/{repo}")
+            return
+
+        # Apply replacements
+        modified_content = apply_replacements(original_content, replacements)
+
+        # Only update if content actually changed
+        if modified_content != original_content:
+            plan.add(file_path, modified_content)
+            logger.info(f"     Staged replacements for {file_path}")
+        else:
+            logger.info(f"     No changes needed for {file_path}")
+
     async def _apply_conditional_file_operations(
         self,
         owner: str,
         repo: str,
         conditional_operations: list,
         parameters: dict[str, Any],
+        plan: RepoChangePlan,
     ):
-        """Apply conditional file operations (move/copy files based on parameters)."""
+        """Plan conditional file operations (move files based on parameters)."""
         for operation in conditional_operations:
             condition_param = operation.condition_parameter
             condition_value = parameters.get(condition_param, False)
@@ -302,78 +366,94 @@ class RepositoryManager:
             if not operations_to_apply:
                 continue
 
-            print(
+            logger.info(
                 f"     Applying conditional file operations (condition: {condition_param}={condition_value})..."
             )
 
             for source_path, destination_path in operations_to_apply.items():
-                await self._move_file_in_repo(
-                    owner, repo, source_path, destination_path
-                )
+                logger.info(f"       Moving {source_path} -> {destination_path}...")
 
-    async def _move_file_in_repo(
-        self, owner: str, repo: str, source_path: str, destination_path: str
-    ):
-        """Move a file from source_path to destination_path in the repository.
+                # Sees earlier replacements and moves in this plan
+                content = await self._read_planned(owner, repo, source_path, plan)
+                if content is None:
+                    logger.warning(
+                        f"Source file {source_path} not found in {owner}/{repo}"
+                    )
+                    continue
+
+                source_in_repo = await self._get_file(owner, repo, source_path)
+                plan.delete(source_path, exists_in_repo=source_in_repo is not None)
+                plan.add(destination_path, content)
+                logger.info(f"       ✅ Moved {source_path} to {destination_path}")
+
+    async def _commit_plan(self, owner: str, repo: str, plan: RepoChangePlan):
+        """Push all planned file changes for a repository as one commit.
 
         Raises:
-            GitHubError: If file operations fail
+            GitHubError: If the commit fails
         """
-        print(f"       Moving {source_path} -> {destination_path}...")
+        if plan.is_empty():
+            return
 
         try:
-            # Get source file content
-            source_file_data = await self.github.get_file_in_repo(
-                owner, repo, source_path
-            )
-            if not source_file_data:
-                logger.warning(f"Source file {source_path} not found in {owner}/{repo}")
-                print(f"       Warning: Source file {source_path} not found")
-                return
-
-            # Create destination file
-            await self.github.create_file(
-                owner=owner,
-                repo=repo,
-                path=destination_path,
-                content=source_file_data["decoded_content"],
-                message=f"Move {source_path} to {destination_path}",
-            )
-
-            # Delete source file
-            await self.github.delete_file(
+            await self.github.commit_file_changes(
                 owner=owner,
                 repo=repo,
-                path=source_path,
-                message=f"Remove {source_path} after move to {destination_path}",
-                sha=source_file_data["sha"],
+                message="Apply scenario file changes",
+                additions=plan.additions,
+                deletions=plan.deletions,
             )
-
-            logger.info(f"Successfully moved {source_path} to {destination_path}")
-            print(f"       ✅ Moved {source_path} to {destination_path}")
-
         except GitHubError as e:
-            error_msg = f"Failed to move {source_path} to {destination_path}: {e}"
+            error_msg = f"Failed to commit file changes to {owner}/{repo}: {e}"
             logger.error(error_msg)
+            await self._emit_event(
+                "task_error",
+                {
+                    "task_id": "repositories",
+                    "message": error_msg,
+                },
+            )
             # Re-raise to halt execution
             raise
 
+        # Blob shas of the new files are unknown, so drop them from the cache
+        for path in plan.additions:
+            self._file_cache.pop((owner, repo, path), None)
+        for path in plan.deletions:
+            self._file_cache[(owner, repo, path)] = None
+
+        change_count = len(plan.additions) + len(plan.deletions)
+        logger.info(
+            f"     ✅ Committed {change_count} file change(s) to {owner}/{repo}"
+        )
+        await self._emit_event(
+            "task_progress",
+            {
+                "task_id": "repositories",
+                "message": f"Committed {change_count} file change(s) to {owner}/{repo}",
+            },
+        )
+
     async def _invite_collaborator(self, owner: str, repo: str, username: str):
         """Invite a GitHub user as collaborator to a repository with idempotency."""
-        print(f"     Checking collaboration status for {username}...")
+        logger.info(f"     Checking collaboration status for {username}...")
 
         # Check if user is already a collaborator
         is_collaborator = await self.github.check_user_collaboration(
             owner, repo, username
         )
         if is_collaborator:
-            print(f"     ⏭️  {username} is already a collaborator on {owner}/{repo}")
+            logger.info(
+                f"     ⏭️  {username} is already a collaborator on {owner}/{repo}"
+            )
         else:
-            print(f"     Inviting {username} as admin collaborator...")
+            logger.info(f"     Inviting {username} as admin collaborator...")
             success = await self.github.invite_collaborator(
                 owner, repo, username, "admin"
             )
             if success:
-                print(f"     ✅ {username} invited as collaborator to {owner}/{repo}")
+                logger.info(
+                    f"     ✅ {username} invited as collaborator to {owner}/{repo}"
+                )
             else:
-                print(f"     ❌ Failed to invite {username} to {owner}/{repo}")
+                logger.warning(f"     ❌ Failed to invite {username} to {owner}/{repo}")
@@ -7,12 +7,16 @@ applications, and feature flags.
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import Any
 
-from mimic.exceptions import UnifyAPIError
+from mimic import settings
+from mimic.exceptions import BatchError, UnifyAPIError
 from mimic.pipeline.retry_handler import RetryHandler
 from mimic.scenarios import Scenario
 from mimic.unify import UnifyAPIClient
+from mimic.utils import batched_gather
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +24,14 @@ logger = logging.getLogger(__name__)
 class ResourceManager:
     """Manages CloudBees Unify resource operations for scenario execution."""
 
+    # List kind -> (UnifyAPIClient method, response key holding the items)
+    _LIST_METHODS = {
+        "components": ("list_components", "service"),
+        "environments": ("list_environments", "endpoints"),
+        "applications": ("list_applications", "service"),
+        "flags": ("list_flags", "flags"),
+    }
+
     def __init__(
         self,
         organization_id: str,
@@ -47,6 +59,27 @@ class ResourceManager:
         self.flag_definitions: dict[str, Any] = {}
         self.created_flags: dict[str, dict[str, Any]] = {}
 
+        # Per-run cache of list_* responses, keyed on (kind, *args)
+        self._list_cache: dict[tuple, list[dict[str, Any]]] = {}
+
+        # Shared Unify session, opened on first use and reused across steps
+        self._client: UnifyAPIClient | None = None
+
+    @property
+    def client(self) -> UnifyAPIClient:
+        """Unify API client shared by every step so connections are pooled."""
+        if self._client is None:
+            self._client = UnifyAPIClient(
+                base_url=self.unify_base_url, api_key=self.unify_pat
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared Unify API client."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     async def create_components(
         self, repositories: list, created_repositories: dict[str, dict]
     ) -> dict[str, dict[str, Any]]:
@@ -60,42 +93,56 @@ class ResourceManager:
         Returns:
             Dictionary mapping component names to created component data
         """
-        print("\n🧩 Step 2: Creating components...")
-
-        with UnifyAPIClient(
-            base_url=self.unify_base_url, api_key=self.unify_pat
-        ) as client:
-            # Get existing components first
-            existing_components_response = client.list_components(self.organization_id)
-            existing_components = existing_components_response.get("service", [])
-
-            for repo_config in repositories:
-                if not repo_config.create_component:
-                    continue
+        logger.info("\n🧩 Step 2: Creating components...")
 
-                repo_name = repo_config.repo_name_template
-                target_org = repo_config.target_org
-                repo_url = f"https://github.com/{target_org}/{repo_name}.git"
-
-                # Check if component already exists
-                existing_component = self._find_by_name(existing_components, repo_name)
-                if existing_component:
-                    print(
-                        f"   ⏭️  Component {repo_name} already exists, skipping creation"
-                    )
-                    self.created_components[repo_name] = existing_component
-                else:
-                    print(f"   Creating component for {repo_name}...")
-
-                    # Create component with retry logic for indexing delays
-                    component_result = await self._create_component_with_retry(
-                        client, repo_name, repo_url
-                    )
-
-                    self.created_components[repo_name] = component_result.get(
-                        "service", {}
-                    )
-                    print(f"   ✅ Component created: {repo_name}")
+        client = self.client
+        # Get existing components first
+        existing_components = await self._cached_list(
+            client, "components", self.organization_id
+        )
+        components_by_name = self._index_by_name(existing_components)
+
+        # Collect components that still need to be created
+        pending: list[tuple[str, str]] = []
+        for repo_config in repositories:
+            if not repo_config.create_component:
+                continue
+
+            repo_name = repo_config.repo_name_template
+            target_org = repo_config.target_org
+            repo_url = f"https://github.com/{target_org}/{repo_name}.git"
+
+            # Check if component already exists
+            existing_component = components_by_name.get(repo_name)
+            if existing_component:
+                logger.info(
+                    f"   ⏭️  Component {repo_name} already exists, skipping creation"
+                )
+                self.created_components[repo_name] = existing_component
+            else:
+                logger.info(f"   Creating component for {repo_name}...")
+                pending.append((repo_name, repo_url))
+
+        # Create in concurrent batches, each with retry logic for indexing delays
+        results, error = await self._settle_batch(
+            batched_gather(
+                [
+                    partial(self._create_component_with_retry, client, name, url)
+                    for name, url in pending
+                ],
+                batch_size=settings.UNIFY_BATCH_SIZE,
+                inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+            )
+        )
+        # After a failure, results stop at the end of the failed batch
+        for (repo_name, _), component_result in zip(pending, results, strict=False):
+            if isinstance(component_result, Exception):
+                continue
+            self.created_components[repo_name] = component_result.get("service", {})
+            existing_components.append(self.created_components[repo_name])
+            logger.info(f"   ✅ Component created: {repo_name}")
+        if error:
+            raise error
 
         return self.created_components
 
@@ -111,58 +158,69 @@ class ResourceManager:
         Returns:
             Dictionary mapping environment names to created environment data
         """
-        print("\n🌍 Step 4: Creating environments...")
-
-        with UnifyAPIClient(
-            base_url=self.unify_base_url, api_key=self.unify_pat
-        ) as client:
-            # Get existing environments first
-            existing_environments_response = client.list_environments(
-                self.organization_id
-            )
-            existing_environments = existing_environments_response.get("endpoints", [])
+        logger.info("\n🌍 Step 4: Creating environments...")
 
-            for env_config in environments:
-                env_name = env_config.name
-
-                # Check if environment already exists
-                existing_environment = self._find_by_name(
-                    existing_environments, env_name
+        client = self.client
+        # Get existing environments first
+        existing_environments = await self._cached_list(
+            client, "environments", self.organization_id
+        )
+        environments_by_name = self._index_by_name(existing_environments)
+
+        # Collect environments that still need to be created
+        pending: list[dict[str, Any]] = []
+        for env_config in environments:
+            env_name = env_config.name
+
+            # Check if environment already exists
+            existing_environment = environments_by_name.get(env_name)
+            if existing_environment:
+                logger.info(
+                    f"   ⏭️  Environment {env_name} already exists, skipping creation"
                 )
-                if existing_environment:
-                    print(
-                        f"   ⏭️  Environment {env_name} already exists, skipping creation"
+                self.created_environments[env_name] = existing_environment
+            else:
+                logger.info(f"   Creating environment: {env_name}...")
+
+                # Build environment properties
+                properties = [{"name": "approvers", "bool": False, "isSecret": False}]
+
+                # Add custom environment variables
+                for env_var in env_config.env:
+                    properties.append(
+                        {
+                            "name": env_var.name,
+                            "string": env_var.value,
+                            "isSecret": False,
+                        }
                     )
-                    self.created_environments[env_name] = existing_environment
-                else:
-                    print(f"   Creating environment: {env_name}...")
-
-                    # Build environment properties
-                    properties = [
-                        {"name": "approvers", "bool": False, "isSecret": False}
-                    ]
-
-                    # Add custom environment variables
-                    for env_var in env_config.env:
-                        properties.append(
-                            {
-                                "name": env_var.name,
-                                "string": env_var.value,
-                                "isSecret": False,
-                            }
-                        )
 
-                    # Note: FM_TOKEN will be added later after applications are created
+                # Note: FM_TOKEN will be added later after applications are created
 
-                    env_result = client.create_basic_environment(
-                        org_id=self.organization_id,
-                        name=env_name,
-                        description=f"Environment for {env_name}",
-                        properties=properties,
-                    )
+                pending.append(
+                    {
+                        "name": env_name,
+                        "description": f"Environment for {env_name}",
+                        "properties": properties,
+                    }
+                )
 
-                    self.created_environments[env_name] = env_result
-                    print(f"   ✅ Environment created: {env_name}")
+        results, error = await self._settle_batch(
+            client.bulk_create_environments(self.organization_id, pending)
+        )
+        for spec, env_result in zip(pending, results, strict=False):
+            if isinstance(env_result, Exception):
+                continue
+            # Keep the full body we sent so later updates never need a refetch
+            env_data = {
+                **UnifyAPIClient.basic_environment_body(self.organization_id, **spec),
+                **env_result,
+            }
+            self.created_environments[spec["name"]] = env_data
+            existing_environments.append(env_data)
+            logger.info(f"   ✅ Environment created: {spec['name']}")
+        if error:
+            raise error
 
         return self.created_environments
 
@@ -178,153 +236,173 @@ class ResourceManager:
         Returns:
             Dictionary mapping application names to created application data
         """
-        print("\n📱 Step 5: Creating applications...")
-
-        with UnifyAPIClient(
-            base_url=self.unify_base_url, api_key=self.unify_pat
-        ) as client:
-            # Get existing applications first
-            existing_applications_response = client.list_applications(
-                self.organization_id
-            )
-            existing_applications = existing_applications_response.get("service", [])
+        logger.info("\n📱 Step 5: Creating applications...")
 
-            for app_config in applications:
-                app_name = app_config.name
-                is_shared = app_config.is_shared
-
-                # Check if application already exists
-                existing_application = self._find_by_name(
-                    existing_applications, app_name
-                )
+        client = self.client
+        # Get existing applications first
+        existing_applications = await self._cached_list(
+            client, "applications", self.organization_id
+        )
+        applications_by_name = self._index_by_name(existing_applications)
+
+        # Collect applications that still need to be created
+        pending: list[dict[str, Any]] = []
+        for app_config in applications:
+            app_name = app_config.name
+            is_shared = app_config.is_shared
+
+            # Check if application already exists
+            existing_application = applications_by_name.get(app_name)
+
+            if existing_application:
+                if is_shared:
+                    # Shared app exists - add new environments to it
+                    logger.info(
+                        f"   🔗 Application {app_name} already exists (shared), adding environments"
+                    )
 
-                if existing_application:
-                    if is_shared:
-                        # Shared app exists - add new environments to it
-                        print(
-                            f"   🔗 Application {app_name} already exists (shared), adding environments"
-                        )
+                    # Get environment IDs to add
+                    new_environment_ids = []
+                    for env_name in app_config.environments:
+                        if env_name in self.created_environments:
+                            new_environment_ids.append(
+                                self.created_environments[env_name]["id"]
+                            )
 
-                        # Get environment IDs to add
-                        new_environment_ids = []
-                        for env_name in app_config.environments:
-                            if env_name in self.created_environments:
-                                new_environment_ids.append(
-                                    self.created_environments[env_name]["id"]
-                                )
-
-                        # Merge with existing environment IDs
-                        existing_env_ids = existing_application.get(
-                            "linkedEnvironmentIds", []
-                        )
-                        all_environment_ids = list(
-                            set(existing_env_ids + new_environment_ids)
-                        )
+                    # Merge with existing environment IDs
+                    existing_env_ids = existing_application.get(
+                        "linkedEnvironmentIds", []
+                    )
+                    all_environment_ids = list(
+                        set(existing_env_ids + new_environment_ids)
+                    )
 
-                        # Update the application with new environments (don't modify components)
-                        update_data = {
-                            "service": {
-                                "id": existing_application["id"],
-                                "name": existing_application["name"],
-                                "description": existing_application.get(
-                                    "description", ""
-                                ),
-                                "repositoryUrl": existing_application.get(
-                                    "repositoryUrl", ""
-                                ),
-                                "repositoryHref": existing_application.get(
-                                    "repositoryHref", ""
-                                ),
-                                "endpointId": existing_application.get(
-                                    "endpointId", ""
-                                ),
-                                "defaultBranch": existing_application.get(
-                                    "defaultBranch", "main"
-                                ),
-                                "linkedComponentIds": existing_application.get(
-                                    "linkedComponentIds", []
-                                ),
-                                "linkedEnvironmentIds": all_environment_ids,
-                                "components": existing_application.get(
-                                    "components", []
-                                ),
-                                "environments": existing_application.get(
-                                    "environments", []
-                                ),
-                                "organizationId": self.organization_id,
-                                "serviceType": "APPLICATION",
-                            }
+                    # Update the application with new environments (don't modify components)
+                    update_data = {
+                        "service": {
+                            "id": existing_application["id"],
+                            "name": existing_application["name"],
+                            "description": existing_application.get("description", ""),
+                            "repositoryUrl": existing_application.get(
+                                "repositoryUrl", ""
+                            ),
+                            "repositoryHref": existing_application.get(
+                                "repositoryHref", ""
+                            ),
+                            "endpointId": existing_application.get("endpointId", ""),
+                            "defaultBranch": existing_application.get(
+                                "defaultBranch", "main"
+                            ),
+                            "linkedComponentIds": existing_application.get(
+                                "linkedComponentIds", []
+                            ),
+                            "linkedEnvironmentIds": all_environment_ids,
+                            "components": existing_application.get("components", []),
+                            "environments": existing_application.get(
+                                "environments", []
+                            ),
+                            "organizationId": self.organization_id,
+                            "serviceType": "APPLICATION",
                         }
+                    }
 
-                        client.update_service(
-                            self.organization_id,
-                            existing_application["id"],
-                            update_data,
-                        )
+                    await asyncio.to_thread(
+                        client.update_service,
+                        self.organization_id,
+                        existing_application["id"],
+                        update_data,
+                    )
 
-                        self.created_applications[app_name] = existing_application
-                        print(
-                            f"   ✅ Added {len(new_environment_ids)} environment(s) to shared application: {app_name}"
-                        )
-                    else:
-                        # Non-shared app exists - skip creation
-                        print(
-                            f"   ⏭️  Application {app_name} already exists, skipping creation"
-                        )
-                        self.created_applications[app_name] = existing_application
+                    self.created_applications[app_name] = existing_application
+                    logger.info(
+                        f"   ✅ Added {len(new_environment_ids)} environment(s) to shared application: {app_name}"
+                    )
                 else:
-                    # Application doesn't exist - create it
-                    # Get component IDs
-                    component_ids = []
-                    for component_name in app_config.components:
-                        if component_name in self.created_components:
-                            component_ids.append(
-                                self.created_components[component_name]["id"]
-                            )
+                    # Non-shared app exists - skip creation
+                    logger.info(
+                        f"   ⏭️  Application {app_name} already exists, skipping creation"
+                    )
+                    self.created_applications[app_name] = existing_application
+            else:
+                # Application doesn't exist - create it
+                # Get component IDs
+                component_ids = []
+                for component_name in app_config.components:
+                    if component_name in self.created_components:
+                        component_ids.append(
+                            self.created_components[component_name]["id"]
+                        )
 
-                    # Get environment IDs
-                    environment_ids = []
-                    for env_name in app_config.environments:
-                        if env_name in self.created_environments:
-                            environment_ids.append(
-                                self.created_environments[env_name]["id"]
-                            )
+                # Get environment IDs
+                environment_ids = []
+                for env_name in app_config.environments:
+                    if env_name in self.created_environments:
+                        environment_ids.append(
+                            self.created_environments[env_name]["id"]
+                        )
 
-                    # Build repository URLs if repository is specified
-                    repository_url = ""
-                    endpoint_id = ""
-                    default_branch = ""
+                # Build repository URLs if repository is specified
+                repository_url = ""
+                endpoint_id = ""
+                default_branch = ""
+
+                if app_config.repository:
+                    repository_url = f"https://github.com/{app_config.repository}.git"
+                    endpoint_id = self.endpoint_id
+                    default_branch = "main"
+
+                shared_indicator = " (shared)" if is_shared else ""
+                logger.info(f"   Creating application: {app_name}{shared_indicator}")
+                logger.info(f"     Components: {len(component_ids)}")
+                logger.info(f"     Environments: {len(environment_ids)}")
+                if repository_url:
+                    logger.info(f"     Repository: {repository_url}")
+
+                pending.append(
+                    {
+                        "name": app_name,
+                        "description": f"Application for {app_name}",
+                        "repository_url": repository_url,
+                        "endpoint_id": endpoint_id,
+                        "default_branch": default_branch,
+                        "linked_component_ids": component_ids,
+                        "linked_environment_ids": environment_ids,
+                    }
+                )
 
-                    if app_config.repository:
-                        repository_url = (
-                            f"https://github.com/{app_config.repository}.git"
+        results, error = await self._settle_batch(
+            client.bulk_create_applications(self.organization_id, pending)
+        )
+        for spec, app_result in zip(pending, results, strict=False):
+            if isinstance(app_result, Exception):
+                continue
+            self.created_applications[spec["name"]] = app_result.get("service", {})
+            existing_applications.append(self.created_applications[spec["name"]])
+            logger.info(f"   ✅ Application created: {spec['name']}")
+        if error:
+            raise error
+
+        new_app_ids = [
+            app_result.get("service", {}).get("id")
+            for app_result in results
+            if app_result.get("service", {}).get("id")
+        ]
+        if new_app_ids:
+            logger.info("   Waiting for applications to be indexed...")
+
+            async def applications_ready() -> bool:
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(
+                            client.get_service, self.organization_id, app_id
                         )
-                        endpoint_id = self.endpoint_id
-                        default_branch = "main"
-
-                    shared_indicator = " (shared)" if is_shared else ""
-                    print(f"   Creating application: {app_name}{shared_indicator}")
-                    print(f"     Components: {len(component_ids)}")
-                    print(f"     Environments: {len(environment_ids)}")
-                    if repository_url:
-                        print(f"     Repository: {repository_url}")
-
-                    app_result = client.create_application(
-                        org_id=self.organization_id,
-                        name=app_name,
-                        description=f"Application for {app_name}",
-                        repository_url=repository_url,
-                        endpoint_id=endpoint_id,
-                        default_branch=default_branch,
-                        linked_component_ids=component_ids,
-                        linked_environment_ids=environment_ids,
+                        for app_id in new_app_ids
                     )
+                )
+                return True
 
-                    self.created_applications[app_name] = app_result.get("service", {})
-                    print(f"   ✅ Application created: {app_name}")
-
-        print("   Waiting for applications to be indexed...")
-        await asyncio.sleep(2)
+            if not await RetryHandler.wait_until(applications_ready):
+                logger.warning("Applications not yet readable, continuing anyway")
 
         return self.created_applications
 
@@ -338,13 +416,13 @@ class ResourceManager:
         Returns:
             Dictionary mapping flag names to flag definitions
         """
-        print("\n🚩 Step 3: Storing feature flag definitions...")
+        logger.info("\n🚩 Step 3: Storing feature flag definitions...")
 
         for flag_config in flags:
             flag_name = flag_config.name
             flag_type = flag_config.type
 
-            print(f"   Planning flag: {flag_name} ({flag_type})")
+            logger.info(f"   Planning flag: {flag_name} ({flag_type})")
             # Store definitions for later creation after applications exist
             self.flag_definitions[flag_name] = flag_config
 
@@ -359,12 +437,15 @@ class ResourceManager:
         """
         Update environments with FM_TOKEN SDK keys after applications are created.
 
+        SDK keys are fetched concurrently first, then each environment gets a
+        single update using the environment data cached at creation time.
+
         Args:
             environments: List of EnvironmentConfig objects
             use_legacy_flags: If True, use org-based API; if False, use app-based API
             env_to_app_mapping: Mapping of environment_name -> application_name (required for new API)
         """
-        print("\n🔑 Step 5.5: Adding FM_TOKEN SDK keys to environments...")
+        logger.info("\n🔑 Step 5.5: Adding FM_TOKEN SDK keys to environments...")
 
         if not use_legacy_flags and not env_to_app_mapping:
             logger.warning(
@@ -372,115 +453,83 @@ class ResourceManager:
             )
             return
 
-        with UnifyAPIClient(
-            base_url=self.unify_base_url, api_key=self.unify_pat
-        ) as client:
-            for env_config in environments:
-                if env_config.create_fm_token_var:
-                    env_name = env_config.name
-
-                    if env_name not in self.created_environments:
-                        print(
-                            f"   ⚠️  Environment {env_name} not found, skipping FM_TOKEN"
-                        )
-                        continue
-
-                    env_data = self.created_environments[env_name]
-                    env_id = env_data["id"]
-
-                    try:
-                        print(f"   Getting SDK key for environment: {env_name}")
-
-                        # Choose API based on flag
-                        if use_legacy_flags:
-                            # Legacy org-based API
-                            # Note: The 'app_id' parameter is actually the organization ID in legacy API
-                            sdk_response = client.get_environment_sdk_key(
-                                self.organization_id, env_id
-                            )
-                        else:
-                            # New app-based API
-                            app_name = (
-                                env_to_app_mapping.get(env_name)
-                                if env_to_app_mapping
-                                else None
-                            )
-                            if not app_name:
-                                print(
-                                    f"   ⚠️  No application mapping found for environment {env_name}, skipping"
-                                )
-                                continue
-
-                            if app_name not in self.created_applications:
-                                print(
-                                    f"   ⚠️  Application {app_name} not found for environment {env_name}, skipping"
-                                )
-                                continue
-
-                            app_id = self.created_applications[app_name]["id"]
-                            sdk_response = client.get_application_environment_sdk_key(
-                                app_id, env_id
-                            )
-
-                        sdk_key = sdk_response.get("sdkKey")
-
-                        if not sdk_key:
-                            print(
-                                f"   ⚠️  No SDK key returned for environment {env_name}"
-                            )
-                            continue
-
-                        # Fetch full environment data (creation response might be incomplete)
-                        if len(env_data.keys()) == 1:  # Only has 'id' key
-                            print(f"   Fetching full environment data for: {env_name}")
-                            env_response = client.get_environment(
-                                self.organization_id, env_id
-                            )
-                            # Extract environment data from 'endpoint' wrapper if present
-                            env_data = env_response.get("endpoint", env_response)
-                            self.created_environments[env_name] = (
-                                env_data  # Update cached data
-                            )
+        client = self.client
+        # (env_name, env_data, SDK key request) for environments needing a token
+        targets: list[tuple[str, dict[str, Any], Callable[[], dict[str, Any]]]] = []
+        for env_config in environments:
+            if not env_config.create_fm_token_var:
+                continue
+
+            env_name = env_config.name
+            if env_name not in self.created_environments:
+                logger.info(
+                    f"   ⚠️  Environment {env_name} not found, skipping FM_TOKEN"
+                )
+                continue
+
+            env_data = self.created_environments[env_name]
+            env_id = env_data["id"]
+
+            if any(
+                prop.get("name") == "FM_TOKEN"
+                for prop in env_data.get("properties", [])
+            ):
+                logger.info(f"   ⏭️  FM_TOKEN already exists in environment: {env_name}")
+                continue
+
+            # Choose API based on flag
+            if use_legacy_flags:
+                # Legacy org-based API
+                # Note: The 'app_id' parameter is actually the organization ID in legacy API
+                fetch_sdk_key = partial(
+                    client.get_environment_sdk_key, self.organization_id, env_id
+                )
+            else:
+                # New app-based API
+                app_name = (
+                    env_to_app_mapping.get(env_name) if env_to_app_mapping else None
+                )
+                if not app_name:
+                    logger.info(
+                        f"   ⚠️  No application mapping found for environment {env_name}, skipping"
+                    )
+                    continue
 
-                        # Get current environment properties and add FM_TOKEN
-                        current_properties = env_data.get("properties", [])
+                if app_name not in self.created_applications:
+                    logger.info(
+                        f"   ⚠️  Application {app_name} not found for environment {env_name}, skipping"
+                    )
+                    continue
 
-                        # Check if FM_TOKEN already exists
-                        fm_token_exists = any(
-                            prop.get("name") == "FM_TOKEN"
-                            for prop in current_properties
-                        )
+                app_id = self.created_applications[app_name]["id"]
+                fetch_sdk_key = partial(
+                    client.get_application_environment_sdk_key, app_id, env_id
+                )
 
-                        if not fm_token_exists:
-                            # Add FM_TOKEN property
-                            current_properties.append(
-                                {
-                                    "name": "FM_TOKEN",
-                                    "string": sdk_key,
-                                    "isSecret": False,
-                                }
-                            )
+            targets.append((env_name, env_data, fetch_sdk_key))
 
-                            # Try to update environment with retry logic for concurrent modifications
-                            await self._update_environment_with_retry(
-                                client, env_name, env_id, env_data, current_properties
-                            )
-                            print(f"   ✅ Added FM_TOKEN to environment: {env_name}")
-                        else:
-                            print(
-                                f"   ⏭️  FM_TOKEN already exists in environment: {env_name}"
-                            )
+        # Fetch every SDK key concurrently
+        sdk_keys = await batched_gather(
+            [
+                partial(self._fetch_sdk_key, env_name, fetch_sdk_key)
+                for env_name, _, fetch_sdk_key in targets
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
 
-                    except UnifyAPIError as e:
-                        logger.error(
-                            f"Failed to add FM_TOKEN to environment {env_name}: {e}"
-                        )
-                        # Don't raise - this is not critical for the pipeline
-                    except Exception as e:
-                        logger.error(
-                            f"Unexpected error adding FM_TOKEN to environment {env_name}: {e}"
-                        )
-                        # Don't raise - this is not critical for the pipeline
+        # Then apply one update per environment, also concurrently
+        await batched_gather(
+            [
+                partial(self._add_fm_token, client, env_name, env_data, sdk_key)
+                for (env_name, env_data, _), sdk_key in zip(
+                    targets, sdk_keys, strict=True
+                )
+                if sdk_key
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
 
     async def configure_flags_in_environments(
         self, resolved_scenario: Scenario
@@ -491,62 +540,90 @@ class ResourceManager:
         Args:
             resolved_scenario: Scenario with resolved template variables
         """
-        print("\n⚙️  Step 6: Creating and configuring flags...")
-
-        with UnifyAPIClient(
-            base_url=self.unify_base_url, api_key=self.unify_pat
-        ) as client:
-            # Create flags for each application
-            for app_name, app_data in self.created_applications.items():
-                app_id = app_data["id"]
-                print(f"   Creating flags for application: {app_name}")
-
-                # Get existing flags for this application
-                existing_flags_response = client.list_flags(app_id)
-                existing_flags = existing_flags_response.get("flags", [])
-
-                for flag_name, _flag_config in self.flag_definitions.items():
-                    # Check if flag already exists
-                    existing_flag = self._find_by_name(existing_flags, flag_name)
-                    if existing_flag:
-                        print(
-                            f"     ⏭️  Flag {flag_name} already exists, using existing"
-                        )
-                        flag_id = existing_flag["id"]
-                        # Store the existing flag data
-                        self.created_flags[flag_name] = existing_flag
-                    else:
-                        print(f"     Creating flag: {flag_name}")
-
-                        # Create the flag and get its ID
-                        flag_result = client.create_boolean_flag(
-                            app_id=app_id,
-                            name=flag_name,
-                            description=f"Flag {flag_name} for {app_name}",
-                        )
-                        flag_id = flag_result.get("flag", {}).get("id")
-                        # Store the created flag data
-                        created_flag_data = flag_result.get("flag", {})
-                        self.created_flags[flag_name] = created_flag_data
-
-                    # Configure flag in each environment mentioned in the scenario
-                    # (Always do this to refresh configuration, even if flag existed)
-                    for env_config in resolved_scenario.environments:
-                        if flag_name in env_config.flags:
-                            env_name = env_config.name
-                            if env_name in self.created_environments:
-                                env_id = self.created_environments[env_name]["id"]
-                                print(f"       Enabling in environment: {env_name}")
-
-                                # Enable flag in this environment (set to false initially)
-                                client.enable_flag_in_environment(
-                                    app_id=app_id,
-                                    flag_id=flag_id,
-                                    env_id=env_id,
-                                    enabled=False,
-                                )
-
-        print("   Flags configured across environments")
+        logger.info("\n⚙️  Step 6: Creating and configuring flags...")
+
+        client = self.client
+        # (app_id, flag_id, env_id) configurations to apply once every flag exists
+        enables: list[dict[str, Any]] = []
+
+        # Created environment IDs each flag should be configured in
+        flag_env_ids: dict[str, list[str]] = {}
+        for env_config in resolved_scenario.environments:
+            created_env = self.created_environments.get(env_config.name)
+            if created_env is None:
+                continue
+            for flag_name in dict.fromkeys(env_config.flags):
+                flag_env_ids.setdefault(flag_name, []).append(created_env["id"])
+
+        # Create flags for each application
+        for app_name, app_data in self.created_applications.items():
+            app_id = app_data["id"]
+            logger.info(f"   Creating flags for application: {app_name}")
+
+            # Get existing flags for this application
+            existing_flags = await self._cached_list(client, "flags", app_id)
+            flags_by_name = self._index_by_name(existing_flags)
+
+            missing_flags: list[str] = []
+            for flag_name in self.flag_definitions:
+                if flag_name in flags_by_name:
+                    logger.info(
+                        f"     ⏭️  Flag {flag_name} already exists, using existing"
+                    )
+                else:
+                    logger.info(f"     Creating flag: {flag_name}")
+                    missing_flags.append(flag_name)
+
+            # Create the missing flags concurrently
+            flag_results, error = await self._settle_batch(
+                client.bulk_create_boolean_flags(
+                    app_id,
+                    [
+                        {
+                            "name": flag_name,
+                            "description": f"Flag {flag_name} for {app_name}",
+                        }
+                        for flag_name in missing_flags
+                    ],
+                )
+            )
+            for flag_name, flag_result in zip(
+                missing_flags, flag_results, strict=False
+            ):
+                if isinstance(flag_result, Exception):
+                    continue
+                created_flag_data = flag_result.get("flag", {})
+                flags_by_name[flag_name] = created_flag_data
+                existing_flags.append(created_flag_data)
+                self.created_flags[flag_name] = created_flag_data
+            if error:
+                raise error
+
+            for flag_name in self.flag_definitions:
+                flag_data = flags_by_name[flag_name]
+                self.created_flags[flag_name] = flag_data
+
+                # Configure flag in each environment mentioned in the scenario
+                # (Always do this to refresh configuration, even if flag existed)
+                for env_id in flag_env_ids.get(flag_name, []):
+                    enables.append(
+                        {
+                            "app_id": app_id,
+                            "flag_id": flag_data.get("id"),
+                            "env_id": env_id,
+                            "enabled": False,
+                        }
+                    )
+
+        # Enable every flag/environment pair concurrently (set to false initially)
+        logger.info(f"   Enabling {len(enables)} flag/environment configuration(s)...")
+        _, error = await self._settle_batch(
+            client.bulk_enable_flags_in_environments(enables)
+        )
+        if error:
+            raise error
+
+        logger.info("   Flags configured across environments")
 
     async def _create_component_with_retry(
         self, client: UnifyAPIClient, repo_name: str, repo_url: str
@@ -554,7 +631,8 @@ class ResourceManager:
         """Create a component with retry logic for GitHub indexing delays."""
 
         async def create_operation() -> dict:
-            return client.create_component(
+            return await asyncio.to_thread(
+                client.create_component,
                 org_id=self.organization_id,
                 name=repo_name,
                 repository_url=repo_url,
@@ -566,6 +644,58 @@ class ResourceManager:
             create_operation, repo_name
         )
 
+    async def _fetch_sdk_key(
+        self, env_name: str, fetch_sdk_key: Callable[[], dict[str, Any]]
+    ) -> str | None:
+        """Fetch an environment's SDK key, logging (not raising) on failure."""
+        logger.info(f"   Getting SDK key for environment: {env_name}")
+        try:
+            sdk_response = await asyncio.to_thread(fetch_sdk_key)
+        except UnifyAPIError as e:
+            logger.error(f"Failed to add FM_TOKEN to environment {env_name}: {e}")
+            return None
+        except Exception as e:
+            logger.error(
+                f"Unexpected error adding FM_TOKEN to environment {env_name}: {e}"
+            )
+            return None
+
+        sdk_key = sdk_response.get("sdkKey")
+        if not sdk_key:
+            logger.info(f"   ⚠️  No SDK key returned for environment {env_name}")
+        return sdk_key
+
+    async def _add_fm_token(
+        self,
+        client: UnifyAPIClient,
+        env_name: str,
+        env_data: dict[str, Any],
+        sdk_key: str,
+    ) -> None:
+        """Add the FM_TOKEN property to an environment, logging (not raising) on failure."""
+        properties = [
+            *env_data.get("properties", []),
+            {"name": "FM_TOKEN", "string": sdk_key, "isSecret": False},
+        ]
+        try:
+            # Update with retry logic for concurrent modifications
+            await self._update_environment_with_retry(
+                client, env_name, env_data["id"], env_data, properties
+            )
+        except UnifyAPIError as e:
+            logger.error(f"Failed to add FM_TOKEN to environment {env_name}: {e}")
+            # Don't raise - this is not critical for the pipeline
+            return
+        except Exception as e:
+            logger.error(
+                f"Unexpected error adding FM_TOKEN to environment {env_name}: {e}"
+            )
+            # Don't raise - this is not critical for the pipeline
+            return
+
+        env_data["properties"] = properties
+        logger.info(f"   ✅ Added FM_TOKEN to environment: {env_name}")
+
     async def _update_environment_with_retry(
         self,
         client: UnifyAPIClient,
@@ -577,7 +707,9 @@ class ResourceManager:
         """Update environment with retry logic for concurrent modification errors."""
 
         async def fetch_fresh_data() -> dict:
-            env_response = client.get_environment(self.organization_id, env_id)
+            env_response = await asyncio.to_thread(
+                client.get_environment, self.organization_id, env_id
+            )
             return env_response.get("endpoint", env_response)
 
         async def update_operation(fresh_env_data: dict | None) -> None:
@@ -601,16 +733,53 @@ class ResourceManager:
             if data_to_use.get("parentId"):
                 update_data["parentId"] = data_to_use["parentId"]
 
-            client.update_environment(self.organization_id, env_id, update_data)
+            await asyncio.to_thread(
+                client.update_environment, self.organization_id, env_id, update_data
+            )
 
         await RetryHandler.with_environment_update_retry(
             update_operation, fetch_fresh_data, env_name
         )
 
+    async def _cached_list(
+        self, client: UnifyAPIClient, kind: str, *args: str
+    ) -> list[dict[str, Any]]:
+        """Return the items from a list_* call, fetching at most once per run.
+
+        The fetch runs on a worker thread, so a rate-limit wait or retry backoff
+        in the sync client doesn't stall the event loop. Callers append locally
+        created items to the returned list so later lookups stay consistent
+        without refetching.
+        """
+        key = (kind, *args)
+        if key not in self._list_cache:
+            method_name, response_key = self._LIST_METHODS[kind]
+            response = await asyncio.to_thread(getattr(client, method_name), *args)
+            # Keep the first list if a concurrent caller fetched it meanwhile
+            self._list_cache.setdefault(key, response.get(response_key, []))
+        return self._list_cache[key]
+
+    @staticmethod
+    async def _settle_batch(
+        batch: Awaitable[list[Any]],
+    ) -> tuple[list[Any], Exception | None]:
+        """
+        Await a batched operation, keeping partial results if one step failed.
+
+        Returns the results (failed slots hold their exception) and the first
+        error, so callers can record what was created before re-raising it.
+        """
+        try:
+            return await batch, None
+        except BatchError as e:
+            return e.results, e.error
+
     @staticmethod
-    def _find_by_name(items: list[dict], name: str, key: str = "name") -> dict | None:
-        """Find an item in a list by its name field."""
+    def _index_by_name(items: list[dict], key: str = "name") -> dict[str, dict]:
+        """Index a list of items by their name field (first occurrence wins)."""
+        index: dict[str, dict] = {}
         for item in items:
-            if item.get(key) == name:
-                return item
-        return None
+            name = item.get(key)
+            if name is not None:
+                index.setdefault(name, item)
+        return index
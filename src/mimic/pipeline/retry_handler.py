@@ -58,7 +58,7 @@ class RetryHandler:
 
                 if is_indexing_error and not is_last_attempt:
                     wait_time = settings.RETRY_BACKOFF_BASE * (2**attempt)
-                    print(
+                    logger.info(
                         f"     Repository not indexed yet (attempt {attempt + 1}/{settings.MAX_RETRY_ATTEMPTS}), retrying in {wait_time}s..."
                     )
                     await asyncio.sleep(wait_time)
@@ -94,7 +94,7 @@ class RetryHandler:
             try:
                 # If this is a retry, fetch fresh environment data
                 if attempt > 0:
-                    print(
+                    logger.info(
                         f"     Retrying environment update (attempt {attempt + 1}/{settings.MAX_RETRY_ATTEMPTS})..."
                     )
                     env_data = await fetch_fresh_data()
@@ -109,7 +109,7 @@ class RetryHandler:
 
                 if is_concurrent_error and not is_last_attempt:
                     wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-                    print(
+                    logger.info(
                         f"     Concurrent modification detected, retrying in {wait_time}s..."
                     )
                     await asyncio.sleep(wait_time)
@@ -122,6 +122,45 @@ class RetryHandler:
             f"Failed to update environment {env_name} after {settings.MAX_RETRY_ATTEMPTS} attempts"
         )
 
+    @staticmethod
+    async def wait_until(
+        predicate: Callable[[], Awaitable[bool]],
+        timeout: float = settings.READINESS_TIMEOUT,
+        initial: float = settings.READINESS_INITIAL_INTERVAL,
+        factor: float = settings.READINESS_BACKOFF_FACTOR,
+    ) -> bool:
+        """
+        Poll a readiness check with exponential backoff, returning as soon as it passes.
+
+        Exceptions raised by the predicate count as "not ready yet".
+
+        Args:
+            predicate: Async callable returning True once the resource is ready
+            timeout: Maximum seconds to keep polling
+            initial: Delay before the second check (seconds)
+            factor: Multiplier applied to the delay after each check
+
+        Returns:
+            True if the predicate passed, False if the timeout elapsed first
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = initial
+
+        while True:
+            try:
+                if await predicate():
+                    return True
+            except Exception as e:
+                logger.debug(f"Readiness check not yet passing: {e}")
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+
+            await asyncio.sleep(min(interval, remaining))
+            interval *= factor
+
     @staticmethod
     async def wait_for_repository_sync(
         unify_client: Any,  # UnifyAPIClient
@@ -155,7 +194,7 @@ class RetryHandler:
                 except Exception as e:
                     logger.error(f"Error emitting event {event_type}: {e}")
 
-        print(
+        logger.info(
             f"   ⏳ Waiting for {len(repo_urls)} repository(ies) to sync to CloudBees..."
         )
         await emit_event(
@@ -192,7 +231,10 @@ class RetryHandler:
 
             try:
                 # Query CloudBees for list of repositories
-                response = unify_client.list_repositories(org_id)
+                # Off the event loop: the sync client may sleep on rate limits
+                response = await asyncio.to_thread(
+                    unify_client.list_repositories, org_id
+                )
                 synced_repos = response.get("repository", [])
 
                 # Extract URLs from synced repos and normalize them
@@ -204,7 +246,7 @@ class RetryHandler:
                 missing_repos = normalized_target_urls - synced_urls
 
                 if not missing_repos:
-                    print(
+                    logger.info(
                         f"   ✅ All repositories synced after {elapsed:.1f}s ({attempts} checks)"
                     )
                     await emit_event(
@@ -228,7 +270,7 @@ class RetryHandler:
                     f"Waiting for {len(missing_repos)} repo(s) to sync... "
                     f"(checking again in {next_interval}s, {remaining_time:.0f}s remaining)"
                 )
-                print(f"     {sync_message}")
+                logger.info(f"     {sync_message}")
                 await emit_event(
                     "task_progress",
                     {
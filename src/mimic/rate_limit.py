@@ -0,0 +1,98 @@
+"""Client-side rate limiting and retry backoff for outbound API calls.
+
+Both the GitHub and Unify clients share one token bucket per API so concurrent
+pipeline steps are smoothed to a steady request rate, and both retry
+throttled or transiently failing responses with jittered exponential backoff.
+"""
+
+import asyncio
+import random
+import threading
+import time
+
+import httpx
+
+from mimic import settings
+
+# Statuses worth retrying: throttling, plus transient server/gateway errors
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Methods that are safe to repeat after a server error
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by sync (threaded) and async callers.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. A
+    caller that finds the bucket empty still takes a token (going into debt)
+    and is told how long to wait, so waiters are served in arrival order.
+
+    Examples:
+        >>> bucket = TokenBucket(rate=10)
+        >>> bucket.acquire()  # blocks only once the burst is used up
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block the current thread until a token is available."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+def retry_delay(response: httpx.Response, method: str, attempt: int) -> float | None:
+    """Return how long to wait before retrying a response, or None to give up.
+
+    429s are always retried; 5xx errors only for idempotent methods, since a
+    non-idempotent request may already have been applied. GitHub's secondary
+    rate limit (403 with Retry-After) is treated like a 429.
+
+    Args:
+        response: The response that was received
+        method: HTTP method of the request
+        attempt: Zero-based number of retries already made
+    """
+    if attempt >= settings.API_MAX_RETRIES:
+        return None
+
+    status = response.status_code
+    retry_after = response.headers.get("Retry-After")
+    throttled = status == 429 or (status == 403 and retry_after is not None)
+    transient = (
+        status in RETRYABLE_STATUS_CODES and method.upper() in IDEMPOTENT_METHODS
+    )
+    if not (throttled or transient):
+        return None
+
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), settings.API_RETRY_MAX_DELAY)
+
+    # Jittered exponential backoff so concurrent callers don't retry in lockstep
+    delay = min(
+        settings.API_RETRY_MAX_DELAY, settings.API_RETRY_BASE_DELAY * 2**attempt
+    )
+    return delay / 2 + random.uniform(0, delay / 2)
@@ -0,0 +1,100 @@
+"""Cache of completed scenario runs, keyed on a fingerprint of their inputs.
+
+Lets an identical re-run of a scenario (same scenario, tenant, organization and
+parameters) reuse the instance created by the last successful run instead of
+re-checking every resource against GitHub and CloudBees.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+from .paths import get_config_dir
+
+
+class RunCache:
+    """Maps run fingerprints to the ID of the instance they produced.
+
+    Examples:
+        >>> cache = RunCache()
+        >>> key = RunCache.fingerprint(
+        ...     "hackers-app", "prod", "org-1", {"x": "1"}, scenario.model_dump(), 7
+        ... )
+        >>> cache.record(key, "abc-123")
+        >>> cache.get(key)
+        'abc-123'
+    """
+
+    def __init__(self, cache_file: Path | str | None = None):
+        """
+        Initialize the run cache.
+
+        Args:
+            cache_file: Path to cache JSON file. Defaults to $MIMIC_CONFIG_DIR/run-cache.json or ~/.mimic/run-cache.json
+        """
+        if cache_file is None:
+            cache_file = get_config_dir() / "run-cache.json"
+        self.cache_file = Path(cache_file)
+
+    @staticmethod
+    def fingerprint(
+        scenario_id: str,
+        tenant: str,
+        organization_id: str,
+        parameters: dict[str, Any],
+        definition: dict[str, Any],
+        expiration_days: int | None,
+        run_options: dict[str, Any],
+    ) -> str:
+        """Build a stable fingerprint for a run's inputs.
+
+        Args:
+            scenario_id: Scenario being run
+            tenant: CloudBees tenant name
+            organization_id: CloudBees organization ID
+            parameters: Parameter values supplied for the run
+            definition: The scenario definition as loaded, so a pack update that
+                changes the scenario invalidates earlier runs
+            expiration_days: Requested lifetime in days, or None for no expiry
+            run_options: Other settings that shape what gets created (e.g. the
+                GitHub invitee and tenant properties)
+
+        Returns:
+            Hex SHA-256 digest of the inputs
+        """
+        payload = json.dumps(
+            [
+                scenario_id,
+                tenant,
+                organization_id,
+                sorted(parameters.items()),
+                definition,
+                expiration_days,
+                run_options,
+            ],
+            default=str,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _load(self) -> dict[str, str]:
+        """Load the cache, treating a missing or unreadable file as empty."""
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, fingerprint: str) -> str | None:
+        """Return the instance ID recorded for a fingerprint, if any."""
+        return self._load().get(fingerprint)
+
+    def record(self, fingerprint: str, instance_id: str) -> None:
+        """Record the instance produced by a successful run."""
+        data = self._load()
+        data[fingerprint] = instance_id
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, "w") as f:
+            json.dump(data, f, indent=2)
@@ -1,6 +1,7 @@
 """Scenario pack management for loading scenarios from git repositories."""
 
 import logging
+import os
 import re
 import subprocess
 from pathlib import Path
@@ -9,6 +10,9 @@ from mimic.exceptions import ScenarioError
 
 logger = logging.getLogger(__name__)
 
+# HTTP(S), SSH (git@host:... or ssh://...) and git:// locations
+_GIT_URL_PATTERN = re.compile(r"^(?:https?://|git@|ssh://|git://)")
+
 
 def is_git_url(location: str) -> bool:
     """Check if location is a valid Git URL.
@@ -19,13 +23,7 @@ def is_git_url(location: str) -> bool:
     Returns:
         True if the location is a Git URL, False otherwise.
     """
-    git_patterns = [
-        r"^https?://",  # HTTP(S)
-        r"^git@",  # SSH (git@github.com:...)
-        r"^ssh://",  # SSH (ssh://...)
-        r"^git://",  # Git protocol
-    ]
-    return any(re.match(pattern, location) for pattern in git_patterns)
+    return _GIT_URL_PATTERN.match(location) is not None
 
 
 def is_local_path(location: str) -> bool:
@@ -344,15 +342,16 @@ class ScenarioPackManager:
         Returns:
             List of pack names (directory names in packs_dir).
         """
-        if not self.packs_dir.exists():
+        try:
+            with os.scandir(self.packs_dir) as entries:
+                return [
+                    entry.name
+                    for entry in entries
+                    if not entry.name.startswith(".") and entry.is_dir()
+                ]
+        except FileNotFoundError:
             return []
 
-        return [
-            d.name
-            for d in self.packs_dir.iterdir()
-            if d.is_dir() and not d.name.startswith(".")
-        ]
-
     def get_current_branch(self, name: str) -> str | None:
         """Get the current checked out branch for a pack.
 
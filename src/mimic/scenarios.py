@@ -1,12 +1,18 @@
 import logging
+import os
 import re
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
 from mimic.exceptions import ScenarioError, ValidationError
+from mimic.utils import TEMPLATE_VAR_PATTERN
+
+if TYPE_CHECKING:
+    from mimic.config_manager import ConfigManager
 
 logger = logging.getLogger(__name__)
 
@@ -146,8 +152,6 @@ class Scenario(BaseModel):
         Returns:
             A copy of the scenario with all template variables resolved
         """
-        import json
-
         # Create a copy of values and add computed variables
         resolved_values = values.copy()
         env_props = env_properties or {}
@@ -164,8 +168,6 @@ class Scenario(BaseModel):
                 resolved_values[var_name] = resolved_values[computed_var.default_from]
             else:
                 # Use the fallback template - need to resolve it first
-                fallback_pattern = re.compile(r"\$\{([^}]+)\}")
-
                 def fallback_replacer(match, current_var_name=var_name):
                     fallback_var_name = match.group(1)
                     if fallback_var_name not in resolved_values:
@@ -174,15 +176,12 @@ class Scenario(BaseModel):
                         )
                     return str(resolved_values[fallback_var_name])
 
-                resolved_values[var_name] = fallback_pattern.sub(
+                resolved_values[var_name] = TEMPLATE_VAR_PATTERN.sub(
                     fallback_replacer, computed_var.fallback_template
                 )
 
         # Convert scenario to dict for easier manipulation
-        scenario_dict = json.loads(self.model_dump_json())
-
-        # Pattern to match ${variable_name} or ${env.property_name}
-        pattern = re.compile(r"\$\{([^}]+)\}")
+        scenario_dict = self.model_dump(mode="json")
 
         def replace_in_value(value: Any) -> Any:
             """Recursively replace template variables in any value."""
@@ -208,7 +207,7 @@ class Scenario(BaseModel):
                             )
                         return str(resolved_values[var_name])
 
-                return pattern.sub(replacer, value)
+                return TEMPLATE_VAR_PATTERN.sub(replacer, value)
             elif isinstance(value, dict):
                 return {k: replace_in_value(v) for k, v in value.items()}
             elif isinstance(value, list):
@@ -393,6 +392,17 @@ class Scenario(BaseModel):
 class ScenarioManager:
     """Manages loading and accessing scenarios."""
 
+    # Parsed scenarios per (file, pack), shared by every manager in the process
+    # and keyed on the file's (mtime_ns, size) so edits are picked up. Each
+    # entry also holds the scenario's API views, built the first time they're
+    # needed and then reused by every manager that loads the same file
+    _file_cache: ClassVar[
+        dict[
+            tuple[Path, str],
+            tuple[tuple[int, int], Scenario, dict[str, dict[str, Any]]],
+        ]
+    ] = {}
+
     def __init__(
         self,
         scenarios_dirs: list[tuple[Path | str, str]] | None = None,
@@ -410,6 +420,9 @@ class ScenarioManager:
         )
         self.local_dir = Path(local_dir) if local_dir else None
         self.scenarios: list[Scenario] = []
+        # Scenarios don't change once loaded, so their API views are built once
+        self._scenario_info: list[dict[str, Any]] = []
+        self._views: dict[int, dict[str, dict[str, Any]]] = {}
         self.load_scenarios()
 
     def load_scenarios(self) -> None:
@@ -430,6 +443,11 @@ class ScenarioManager:
         if self.local_dir and self.local_dir.exists():
             self._load_from_directory(self.local_dir, "local")
 
+        self._scenario_info = [
+            self._view(scenario, "info", self._build_info)
+            for scenario in self.scenarios
+        ]
+
     def _load_from_directory(self, directory: Path, pack_name: str) -> None:
         """Load scenarios from a specific directory.
 
@@ -437,93 +455,127 @@ class ScenarioManager:
             directory: Directory to load scenarios from.
             pack_name: Name of the pack (for tracking source).
         """
-        if not directory.exists():
+        # One scandir pass instead of two globs plus a stat per file: DirEntry
+        # answers is_file() from the directory listing itself
+        try:
+            with os.scandir(directory) as entries:
+                yaml_files = [
+                    (Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Scenarios directory not found: {directory}")
             return
 
-        yaml_files = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
-
         if not yaml_files:
             logger.debug(f"No scenario files found in {directory}")
             return
 
-        for yaml_file in yaml_files:
-            try:
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f)
-
-                # Parse parameter schema if present
-                if "parameter_schema" in data and data["parameter_schema"]:
-                    # Convert nested dicts to proper models
-                    properties = {}
-                    for prop_name, prop_data in (
-                        data["parameter_schema"].get("properties", {}).items()
-                    ):
-                        properties[prop_name] = ParameterProperty(**prop_data)
+        for yaml_file, stat in yaml_files:
+            scenario, views = self._load_file(
+                yaml_file, pack_name, (stat.st_mtime_ns, stat.st_size)
+            )
 
-                    data["parameter_schema"] = ParameterSchema(
-                        properties=properties,
-                        required=data["parameter_schema"].get("required", []),
-                    )
+            # Add scenario to list (duplicates are allowed)
+            self.scenarios.append(scenario)
+            self._views[id(scenario)] = views
+
+    def _load_file(
+        self, yaml_file: Path, pack_name: str, stamp: tuple[int, int]
+    ) -> tuple[Scenario, dict[str, dict[str, Any]]]:
+        """Load a single scenario file, reusing the parsed result if it's unchanged.
+
+        Args:
+            yaml_file: Scenario YAML file to load.
+            pack_name: Name of the pack (for tracking source).
+            stamp: The file's (mtime_ns, size), used to detect changes.
+
+        Returns:
+            The parsed scenario and its (shared) cache of API views.
+        """
+        key = (yaml_file, pack_name)
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+
+        try:
+            with open(yaml_file) as f:
+                data = yaml.safe_load(f)
+
+            # Parse parameter schema if present
+            if "parameter_schema" in data and data["parameter_schema"]:
+                # Convert nested dicts to proper models
+                properties = {}
+                for prop_name, prop_data in (
+                    data["parameter_schema"].get("properties", {}).items()
+                ):
+                    properties[prop_name] = ParameterProperty(**prop_data)
+
+                data["parameter_schema"] = ParameterSchema(
+                    properties=properties,
+                    required=data["parameter_schema"].get("required", []),
+                )
 
-                # Parse computed variables if present
-                if "computed_variables" in data and data["computed_variables"]:
-                    computed_vars = {}
-                    for var_name, var_data in data["computed_variables"].items():
-                        computed_vars[var_name] = ComputedVariable(**var_data)
-                    data["computed_variables"] = computed_vars
-
-                # Parse repository configs
-                repos = []
-                for repo_data in data.get("repositories", []):
-                    # Parse conditional file operations if present
-                    if "conditional_file_operations" in repo_data:
-                        conditional_ops = []
-                        for op_data in repo_data["conditional_file_operations"]:
-                            conditional_ops.append(ConditionalFileOperation(**op_data))
-                        repo_data["conditional_file_operations"] = conditional_ops
-
-                    repos.append(RepositoryConfig(**repo_data))
-                data["repositories"] = repos
-
-                # Parse application configs
-                apps = []
-                for app_data in data.get("applications", []):
-                    apps.append(ApplicationConfig(**app_data))
-                data["applications"] = apps
-
-                # Parse environment configs
-                envs = []
-                for env_data in data.get("environments", []):
-                    # Convert nested env vars
-                    env_vars = []
-                    for var_data in env_data.get("env", []):
-                        env_vars.append(EnvironmentVariable(**var_data))
-                    env_data["env"] = env_vars
-                    envs.append(EnvironmentConfig(**env_data))
-                data["environments"] = envs
-
-                # Parse flag configs
-                flags = []
-                for flag_data in data.get("flags", []):
-                    flags.append(FlagConfig(**flag_data))
-                data["flags"] = flags
-
-                # Create and validate scenario
-                scenario = Scenario(**data)
-                scenario.pack_source = pack_name
-
-                # Add scenario to list (duplicates are allowed)
-                self.scenarios.append(scenario)
-
-            except yaml.YAMLError as e:
-                error_msg = f"YAML parsing error in {yaml_file.name}: {e}"
-                logger.error(error_msg)
-                raise ScenarioError(error_msg) from e
-            except Exception as e:
-                error_msg = f"Failed to load scenario {yaml_file.name}: {e}"
-                logger.error(error_msg)
-                raise ScenarioError(error_msg) from e
+            # Parse computed variables if present
+            if "computed_variables" in data and data["computed_variables"]:
+                computed_vars = {}
+                for var_name, var_data in data["computed_variables"].items():
+                    computed_vars[var_name] = ComputedVariable(**var_data)
+                data["computed_variables"] = computed_vars
+
+            # Parse repository configs
+            repos = []
+            for repo_data in data.get("repositories", []):
+                # Parse conditional file operations if present
+                if "conditional_file_operations" in repo_data:
+                    conditional_ops = []
+                    for op_data in repo_data["conditional_file_operations"]:
+                        conditional_ops.append(ConditionalFileOperation(**op_data))
+                    repo_data["conditional_file_operations"] = conditional_ops
+
+                repos.append(RepositoryConfig(**repo_data))
+            data["repositories"] = repos
+
+            # Parse application configs
+            apps = []
+            for app_data in data.get("applications", []):
+                apps.append(ApplicationConfig(**app_data))
+            data["applications"] = apps
+
+            # Parse environment configs
+            envs = []
+            for env_data in data.get("environments", []):
+                # Convert nested env vars
+                env_vars = []
+                for var_data in env_data.get("env", []):
+                    env_vars.append(EnvironmentVariable(**var_data))
+                env_data["env"] = env_vars
+                envs.append(EnvironmentConfig(**env_data))
+            data["environments"] = envs
+
+            # Parse flag configs
+            flags = []
+            for flag_data in data.get("flags", []):
+                flags.append(FlagConfig(**flag_data))
+            data["flags"] = flags
+
+            # Create and validate scenario
+            scenario = Scenario(**data)
+            scenario.pack_source = pack_name
+
+            views: dict[str, dict[str, Any]] = {}
+            self._file_cache[key] = (stamp, scenario, views)
+            return scenario, views
+
+        except yaml.YAMLError as e:
+            error_msg = f"YAML parsing error in {yaml_file.name}: {e}"
+            logger.error(error_msg)
+            raise ScenarioError(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to load scenario {yaml_file.name}: {e}"
+            logger.error(error_msg)
+            raise ScenarioError(error_msg) from e
 
     def get_scenario(
         self, scenario_id: str, pack_source: str | None = None
@@ -553,37 +605,89 @@ class ScenarioManager:
         Returns all scenarios, including duplicates with the same ID from different packs.
         Each scenario includes its pack_source to distinguish between duplicates.
         """
-        result: list[dict[str, Any]] = []
-        for scenario in self.scenarios:
-            scenario_info: dict[str, Any] = {
-                "id": scenario.id,
-                "name": scenario.name,
-                "summary": scenario.summary,
-                "details": scenario.details,
-                "pack_source": scenario.pack_source,
-                "scenario_pack": scenario.pack_source,  # For frontend compatibility
-                "wip": scenario.wip,
-                "required_properties": scenario.required_properties,
-                "required_secrets": scenario.required_secrets,
-            }
-
-            # Include parameter schema if present
-            if scenario.parameter_schema:
-                schema_dict = {}
-                for prop_name, prop in scenario.parameter_schema.properties.items():
-                    schema_dict[prop_name] = {
-                        "type": prop.type,
-                        "description": prop.description,
-                        "placeholder": prop.placeholder,
-                        "pattern": prop.pattern,
-                        "enum": prop.enum,
-                        "required": prop_name in scenario.parameter_schema.required,
-                    }
-                scenario_info["parameters"] = schema_dict
-
-            result.append(scenario_info)
-
-        return result
+        return list(self._scenario_info)
+
+    def get_scenario_detail(
+        self, scenario_id: str, pack_source: str | None = None
+    ) -> dict[str, Any] | None:
+        """Get a scenario's full details, including its parameter schema.
+
+        Args:
+            scenario_id: The scenario ID to search for.
+            pack_source: Optional pack name to filter by.
+
+        Returns:
+            Scenario details as a dict, or None if not found.
+        """
+        scenario = self.get_scenario(scenario_id, pack_source)
+        if scenario is None:
+            return None
+
+        return self._view(scenario, "detail", self._build_detail)
+
+    def _view(
+        self,
+        scenario: Scenario,
+        name: str,
+        build: Callable[[Scenario], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return a cached API view of a scenario, building it on first use."""
+        views = self._views.setdefault(id(scenario), {})
+        if name not in views:
+            views[name] = build(scenario)
+        return views[name]
+
+    @staticmethod
+    def _build_detail(scenario: Scenario) -> dict[str, Any]:
+        """Build the detail dict for a scenario returned by get_scenario_detail()."""
+        return {
+            "id": scenario.id,
+            "name": scenario.name,
+            "summary": scenario.summary,
+            "details": scenario.details,
+            "wip": scenario.wip,
+            "pack_source": scenario.pack_source,
+            "scenario_pack": scenario.pack_source,  # For frontend compatibility
+            "parameter_schema": (
+                scenario.parameter_schema.model_dump()
+                if scenario.parameter_schema
+                else None
+            ),
+            "required_properties": scenario.required_properties,
+            "required_secrets": scenario.required_secrets,
+        }
+
+    @staticmethod
+    def _build_info(scenario: Scenario) -> dict[str, Any]:
+        """Build the summary dict for a scenario returned by list_scenarios()."""
+        scenario_info: dict[str, Any] = {
+            "id": scenario.id,
+            "name": scenario.name,
+            "summary": scenario.summary,
+            "details": scenario.details,
+            "pack_source": scenario.pack_source,
+            "scenario_pack": scenario.pack_source,  # For frontend compatibility
+            "wip": scenario.wip,
+            "required_properties": scenario.required_properties,
+            "required_secrets": scenario.required_secrets,
+        }
+
+        # Include parameter schema if present
+        if scenario.parameter_schema:
+            schema_dict = {}
+            required = set(scenario.parameter_schema.required)
+            for prop_name, prop in scenario.parameter_schema.properties.items():
+                schema_dict[prop_name] = {
+                    "type": prop.type,
+                    "description": prop.description,
+                    "placeholder": prop.placeholder,
+                    "pattern": prop.pattern,
+                    "enum": prop.enum,
+                    "required": prop_name in required,
+                }
+            scenario_info["parameters"] = schema_dict
+
+        return scenario_info
 
 
 # Global instance to be created at startup
@@ -624,18 +728,24 @@ def get_scenario_manager() -> ScenarioManager:
     return scenario_manager
 
 
-def initialize_scenarios_from_config() -> ScenarioManager:
+def initialize_scenarios_from_config(
+    config_manager: "ConfigManager | None" = None,
+) -> ScenarioManager:
     """Initialize scenario manager from config file.
 
     Loads scenarios from enabled packs defined in config.yaml.
 
+    Args:
+        config_manager: ConfigManager to read packs from. If None, creates a new one.
+
     Returns:
         Initialized ScenarioManager instance.
     """
     from mimic.config_manager import ConfigManager
     from mimic.scenario_pack_manager import ScenarioPackManager
 
-    config_manager = ConfigManager()
+    if config_manager is None:
+        config_manager = ConfigManager()
     pack_manager = ScenarioPackManager(config_manager.packs_dir)
 
     # Get enabled scenario packs
@@ -19,6 +19,11 @@ VERSION = get_version()
 # Timing configuration for resource creation
 REPO_BASIC_DELAY = 3  # Seconds to wait for basic repo availability
 
+# Readiness polling after resource creation (replaces fixed sleeps)
+READINESS_TIMEOUT = 10  # Maximum seconds to poll for a new resource
+READINESS_INITIAL_INTERVAL = 0.2  # First delay between readiness checks (seconds)
+READINESS_BACKOFF_FACTOR = 1.5  # Multiplier applied to the delay after each check
+
 # Repository sync polling configuration
 REPO_SYNC_INITIAL_INTERVAL = 5  # Initial interval between sync checks (seconds)
 REPO_SYNC_MAX_INTERVAL = 30  # Maximum interval between sync checks (seconds)
@@ -28,6 +33,27 @@ REPO_SYNC_TIMEOUT = 900  # Maximum time to wait for repository sync (15 minutes)
 MAX_RETRY_ATTEMPTS = 3  # Maximum retry attempts for component creation
 RETRY_BACKOFF_BASE = 5  # Base seconds for exponential backoff on retries
 
+# Client-side rate limiting and retries for GitHub/Unify API calls
+GITHUB_REQUESTS_PER_SECOND = 10  # Sustained GitHub request rate (also the burst size)
+UNIFY_REQUESTS_PER_SECOND = 10  # Sustained Unify request rate (also the burst size)
+GITHUB_TIMEOUT = 30  # Seconds before a GitHub request times out
+GITHUB_MAX_CONNECTIONS = 20  # Pooled connections to api.github.com
+GITHUB_MAX_KEEPALIVE = 10  # Idle connections kept open for reuse
+API_MAX_RETRIES = 4  # Retries for throttled (429) or transient 5xx responses
+API_RETRY_BASE_DELAY = 0.5  # Seconds before the first retry, doubled each time
+API_RETRY_MAX_DELAY = 30  # Upper bound on any single retry delay (seconds)
+
+# Client-side batching for Unify create calls (Unify has no bulk endpoints)
+UNIFY_BATCH_SIZE = 10  # Maximum concurrent create requests per batch
+UNIFY_BATCH_DELAY = 0.5  # Seconds to pause between batches
+
+# Expired-instance sweeps
+CLEANUP_CONCURRENCY = 4  # Expired instances cleaned up at the same time
+
+# Keyring lookups can be slow (e.g. a D-Bus round trip), and the web UI re-reads
+# credential status every time it regains focus
+KEYRING_CACHE_TTL = 5  # Seconds a keyring lookup is reused before asking again
+
 # Default CloudBees endpoint ID (can be overridden in environment config)
 DEFAULT_CLOUDBEES_ENDPOINT_ID = "9a3942be-0e86-415e-94c5-52512be1138d"
 
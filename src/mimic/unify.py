@@ -3,17 +3,27 @@ Minimal CloudBees Unify API client
 Built from api-platform.json spec but only implementing what we need
 """
 
-import json
+import asyncio
 import logging
+import time
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 import httpx
+import orjson
 
+from mimic import settings
 from mimic.config_manager import ConfigManager
 from mimic.exceptions import UnifyAPIError
+from mimic.rate_limit import TokenBucket, retry_delay
+from mimic.utils import batched_gather
 
 logger = logging.getLogger(__name__)
 
+# Shared by every client so concurrent pipeline steps stay under one rate
+_RATE_LIMITER = TokenBucket(settings.UNIFY_REQUESTS_PER_SECOND)
+
 
 class UnifyAPIClient:
     """Simple API client for CloudBees Unify API"""
@@ -77,16 +87,24 @@ class UnifyAPIClient:
     def _make_request(self, method: str, url: str, **kwargs) -> dict[str, Any]:
         """Make an HTTP request with error handling"""
         try:
-            # Debug log the request
-            logger.debug(f"Making {method} request to {url}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+
+            # Serialize JSON bodies with orjson (Content-Type is set on the client)
             if "json" in kwargs:
-                logger.debug(f"Request body: {json.dumps(kwargs['json'], indent=2)}")
+                kwargs["content"] = orjson.dumps(kwargs.pop("json"))
 
-            response = self.client.request(method, url, **kwargs)
+            # Debug log the request
+            if debug:
+                logger.debug(f"Making {method} request to {url}")
+                if "content" in kwargs:
+                    logger.debug(f"Request body: {kwargs['content'].decode()}")
+
+            response = self._send(method, url, **kwargs)
 
             # Debug log the response
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response body: {response.text[:500]}")  # First 500 chars
+            if debug:
+                logger.debug(f"Response status: {response.status_code}")
+                logger.debug(f"Response body: {response.text[:500]}")  # First 500 chars
 
             response.raise_for_status()
 
@@ -94,14 +112,13 @@ class UnifyAPIClient:
             if not response.content:
                 return {}
 
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP {e.response.status_code} error for {method} {url}"
             try:
-                error_detail = e.response.json()
-                logger.error(
-                    f"API error response: {json.dumps(error_detail, indent=2)}"
-                )
+                error_detail = orjson.loads(e.response.content)
+                pretty = orjson.dumps(error_detail, option=orjson.OPT_INDENT_2)
+                logger.error(f"API error response: {pretty.decode()}")
                 if "message" in error_detail:
                     error_msg += f": {error_detail['message']}"
                 elif "error" in error_detail:
@@ -118,6 +135,22 @@ class UnifyAPIClient:
         except Exception as e:
             raise UnifyAPIError(f"Unexpected error: {str(e)}") from e
 
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a rate-limited request, retrying throttled/transient failures."""
+        attempt = 0
+        while True:
+            _RATE_LIMITER.acquire()
+            response = self.client.request(method, url, **kwargs)
+            delay = retry_delay(response, method, attempt)
+            if delay is None:
+                return response
+            logger.warning(
+                f"Unify {method} {url} returned {response.status_code}, "
+                f"retrying in {delay:.1f}s"
+            )
+            time.sleep(delay)
+            attempt += 1
+
     # Services API
     def list_services(self, org_id: str) -> dict[str, Any]:
         """List services for an organization"""
@@ -258,6 +291,12 @@ class UnifyAPIClient:
         """List all applications for an organization"""
         return self.list_services_by_type(org_id, "APPLICATION")
 
+    def get_service(self, org_id: str, service_id: str) -> dict[str, Any]:
+        """Get a single service (component or application) by ID"""
+        return self._make_request(
+            "GET", f"/v1/organizations/{org_id}/services/{service_id}"
+        )
+
     def update_service(
         self, org_id: str, service_id: str, service_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -360,7 +399,7 @@ class UnifyAPIClient:
         # Debug logging
         logger.debug(f"Creating application with name: {name}")
         logger.debug(f"Organization ID: {org_id}")
-        logger.debug(f"Request payload: {json.dumps(service_data, indent=2)}")
+        logger.debug(f"Request payload: {service_data}")
 
         return self.create_service(org_id, service_data)
 
@@ -372,7 +411,18 @@ class UnifyAPIClient:
         properties: list[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """Create a basic environment with optional properties"""
-        env_data = {
+        env_data = self.basic_environment_body(org_id, name, description, properties)
+        return self.create_environment(org_id, env_data)
+
+    @staticmethod
+    def basic_environment_body(
+        org_id: str,
+        name: str,
+        description: str = "",
+        properties: list[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        """Build the request body used by create_basic_environment"""
+        return {
             "resourceId": org_id,
             "contributionId": "cb.configuration.basic-environment",
             "contributionType": "cb.platform.environment",
@@ -382,7 +432,6 @@ class UnifyAPIClient:
             "properties": properties
             or [{"name": "approvers", "bool": False, "isSecret": False}],
         }
-        return self.create_environment(org_id, env_data)
 
     def create_boolean_flag(
         self,
@@ -403,6 +452,142 @@ class UnifyAPIClient:
         }
         return self.create_feature_flag(app_id, flag_data)
 
+    # Bulk helpers - Unify has no batch endpoints, so these fan out the single-item
+    # calls in small concurrent batches on worker threads
+    async def bulk_create_environments(
+        self, org_id: str, specs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create several environments, returning results in spec order.
+
+        Args:
+            org_id: Organization ID
+            specs: Keyword arguments for create_basic_environment (name, description, properties)
+        """
+        return await batched_gather(
+            [
+                partial(
+                    asyncio.to_thread, self.create_basic_environment, org_id, **spec
+                )
+                for spec in specs
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
+
+    async def bulk_create_applications(
+        self, org_id: str, specs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create several applications, returning results in spec order.
+
+        Args:
+            org_id: Organization ID
+            specs: Keyword arguments for create_application
+        """
+        return await batched_gather(
+            [
+                partial(asyncio.to_thread, self.create_application, org_id, **spec)
+                for spec in specs
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
+
+    async def bulk_create_boolean_flags(
+        self, app_id: str, specs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Create several boolean flags on an application, returning results in spec order.
+
+        Args:
+            app_id: Application ID
+            specs: Keyword arguments for create_boolean_flag (name, description, ...)
+        """
+        return await batched_gather(
+            [
+                partial(asyncio.to_thread, self.create_boolean_flag, app_id, **spec)
+                for spec in specs
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
+
+    async def bulk_enable_flags_in_environments(
+        self, specs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Set flag state in several environments, returning results in spec order.
+
+        Args:
+            specs: Keyword arguments for enable_flag_in_environment
+                (app_id, flag_id, env_id, enabled)
+        """
+        return await batched_gather(
+            [
+                partial(asyncio.to_thread, self.enable_flag_in_environment, **spec)
+                for spec in specs
+            ],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
+
+    async def bulk_delete_components(
+        self, org_id: str, component_ids: list[str]
+    ) -> dict[str, Exception | None]:
+        """Delete several components, returning each one's error (None on success).
+
+        Args:
+            org_id: Organization ID
+            component_ids: Component UUIDs to delete
+        """
+        return await self._bulk_delete(self.delete_component, org_id, component_ids)
+
+    async def bulk_delete_environments(
+        self, org_id: str, env_ids: list[str]
+    ) -> dict[str, Exception | None]:
+        """Delete several environments, returning each one's error (None on success).
+
+        Args:
+            org_id: Organization ID
+            env_ids: Environment IDs to delete
+        """
+        return await self._bulk_delete(self.delete_environment, org_id, env_ids)
+
+    async def bulk_delete_applications(
+        self, org_id: str, app_ids: list[str]
+    ) -> dict[str, Exception | None]:
+        """Delete several applications, returning each one's error (None on success).
+
+        Args:
+            org_id: Organization ID
+            app_ids: Application IDs to delete
+        """
+        return await self._bulk_delete(self.delete_application, org_id, app_ids)
+
+    async def _bulk_delete(
+        self,
+        delete: Callable[[str, str], None],
+        org_id: str,
+        resource_ids: list[str],
+    ) -> dict[str, Exception | None]:
+        """Fan out single deletes, collecting failures instead of raising them."""
+
+        async def attempt(resource_id: str) -> tuple[bool, Exception | None]:
+            # The error travels inside an (ok, error) tuple so batched_gather
+            # treats it as a result rather than a failed operation
+            try:
+                await asyncio.to_thread(delete, org_id, resource_id)
+            except Exception as e:
+                return False, e
+            return True, None
+
+        outcomes = await batched_gather(
+            [partial(attempt, resource_id) for resource_id in resource_ids],
+            batch_size=settings.UNIFY_BATCH_SIZE,
+            inter_batch_delay=settings.UNIFY_BATCH_DELAY,
+        )
+        return {
+            resource_id: error
+            for resource_id, (_, error) in zip(resource_ids, outcomes, strict=True)
+        }
+
     def get_environment_sdk_key(self, app_id: str, env_id: str) -> dict[str, Any]:
         """Get SDK key for an application environment.
 
@@ -1,11 +1,33 @@
+import asyncio
 import re
-from typing import Any
+from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from mimic.exceptions import BatchError
+
+T = TypeVar("T")
+
+# Matches ${variable_name} (and ${env.property_name}) template references
+TEMPLATE_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+@lru_cache(maxsize=128)
+def _replacement_pattern(find_strs: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile an alternation of literal find strings, longest first."""
+    return re.compile(
+        "|".join(re.escape(s) for s in sorted(find_strs, key=len, reverse=True))
+    )
 
 
 def apply_replacements(content: str, replacements: dict[str, str]) -> str:
     """
     Apply a dictionary of find/replace operations to a string.
 
+    All find strings are matched in a single pass over the content using a
+    compiled (and cached) pattern. Where find strings overlap, the longest
+    match wins; replacement values are never re-scanned.
+
     Args:
         content: The original string content
         replacements: Dictionary where keys are strings to find and values are replacements
@@ -13,10 +35,12 @@ def apply_replacements(content: str, replacements: dict[str, str]) -> str:
     Returns:
         The modified string with all replacements applied
     """
-    result = content
-    for find_str, replace_str in replacements.items():
-        result = result.replace(find_str, replace_str)
-    return result
+    find_strs = tuple(find_str for find_str in replacements if find_str)
+    if not find_strs:
+        return content
+
+    pattern = _replacement_pattern(find_strs)
+    return pattern.sub(lambda match: replacements[match.group(0)], content)
 
 
 def resolve_run_name(scenario: Any, parameters: dict[str, Any], session_id: str) -> str:
@@ -43,9 +67,6 @@ def resolve_run_name(scenario: Any, parameters: dict[str, Any], session_id: str)
     values["scenario_id"] = scenario.id
     values["session_id"] = session_id
 
-    # Pattern to match ${variable_name}
-    pattern = re.compile(r"\$\{([^}]+)\}")
-
     def replacer(match):
         var_name = match.group(1)
         if var_name not in values:
@@ -54,7 +75,73 @@ def resolve_run_name(scenario: Any, parameters: dict[str, Any], session_id: str)
         return str(values[var_name])
 
     try:
-        return pattern.sub(replacer, template)
+        return TEMPLATE_VAR_PATTERN.sub(replacer, template)
     except Exception:
         # If resolution fails, fall back to session_id
         return session_id
+
+
+async def batched_gather(
+    operations: Sequence[Callable[[], Awaitable[T]]],
+    batch_size: int = 10,
+    inter_batch_delay: float = 0.5,
+) -> list[T]:
+    """
+    Run async operations concurrently in fixed-size batches.
+
+    Each batch is awaited with asyncio.gather before the next one starts, with a
+    short pause in between so we don't flood the remote API. If an operation
+    fails, the rest of its batch still finishes, no further batches start, and
+    a BatchError carries every result so far so callers can record what did
+    succeed before re-raising the original error.
+
+    Args:
+        operations: Zero-argument callables returning awaitables (called lazily)
+        batch_size: Maximum number of operations running at once
+        inter_batch_delay: Seconds to sleep between batches
+
+    Returns:
+        Results in the same order as operations
+
+    Raises:
+        BatchError: If any operation raised
+    """
+    step = max(batch_size, 1)
+    results: list[Any] = []
+    for start in range(0, len(operations), step):
+        if start:
+            await asyncio.sleep(inter_batch_delay)
+        batch = operations[start : start + step]
+        results.extend(
+            await asyncio.gather(
+                *(operation() for operation in batch), return_exceptions=True
+            )
+        )
+        for result in results[start:]:
+            if isinstance(result, Exception):
+                raise BatchError(str(result), results, result) from result
+            if isinstance(result, BaseException):
+                raise result
+    return results
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> list[Any]:
+    """
+    Await several awaitables concurrently, cancelling the rest if one fails.
+
+    Unlike a bare asyncio.gather, siblings don't keep running in the background
+    after the first failure, and that failure propagates unwrapped.
+
+    Args:
+        *aws: Coroutines or futures to run concurrently
+
+    Returns:
+        Results in argument order
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
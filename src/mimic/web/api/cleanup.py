@@ -2,10 +2,12 @@
 
 import logging
 from datetime import datetime
+from operator import attrgetter
 
 from fastapi import APIRouter, HTTPException, Query, status
 
 from mimic.cleanup_manager import CleanupManager
+from mimic.config_manager import ConfigManager
 from mimic.instance_repository import InstanceRepository
 
 from ..dependencies import ConfigDep
@@ -23,6 +25,32 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/cleanup", tags=["cleanup"])
 
 
+def _tenant_links(config: ConfigManager, tenant: str) -> tuple[str | None, str | None]:
+    """Resolve the CloudBees UI base URL and org slug for a tenant.
+
+    Args:
+        config: Config manager
+        tenant: Tenant name
+
+    Returns:
+        Tuple of (base_url, org_slug), either of which may be None
+    """
+    api_url = config.get_tenant_url(tenant)
+    ui_url = config.get_tenant_ui_url(tenant)
+    org_slug = config.get_tenant_org_slug(tenant)
+
+    # Determine the base URL to use (custom UI URL or derived from API URL)
+    base_url = None
+    if ui_url:
+        # Use custom UI URL (e.g., https://ui.demo1.cloudbees.io)
+        base_url = ui_url
+    elif api_url:
+        # Convert API URL to UI URL: https://api.cloudbees.io -> https://cloudbees.io
+        base_url = api_url.replace("//api.", "//")
+
+    return base_url, org_slug
+
+
 @router.get("/sessions", response_model=SessionListResponse)
 async def list_sessions(
     config: ConfigDep,
@@ -51,26 +79,24 @@ async def list_sessions(
     if tenant:
         instances = [i for i in instances if i.tenant == tenant]
 
-    # Convert to SessionInfo
+    # Convert to SessionInfo. Every field comes from already-validated
+    # Instance models, so skip re-validating each row with model_construct.
     now = datetime.now()
     sessions = []
+    # Resolve a tenant's UI links once rather than repeating the config
+    # lookups and URL building for every one of its instances
+    tenant_links: dict[str, tuple[str | None, str | None]] = {}
 
     for instance in instances:
         is_expired = instance.expires_at is not None and instance.expires_at < now
 
         # Get base URL and org slug for this instance's tenant
-        api_url = config.get_tenant_url(instance.tenant)
-        ui_url = config.get_tenant_ui_url(instance.tenant)
-        org_slug = config.get_tenant_org_slug(instance.tenant)
-
-        # Determine the base URL to use (custom UI URL or derived from API URL)
-        base_url = None
-        if ui_url:
-            # Use custom UI URL (e.g., https://ui.demo1.cloudbees.io)
-            base_url = ui_url
-        elif api_url:
-            # Convert API URL to UI URL: https://api.cloudbees.io -> https://cloudbees.io
-            base_url = api_url.replace("//api.", "//")
+        links = tenant_links.get(instance.tenant)
+        if links is None:
+            links = tenant_links[instance.tenant] = _tenant_links(
+                config, instance.tenant
+            )
+        base_url, org_slug = links
 
         # Build resources list
         resources = []
@@ -78,7 +104,7 @@ async def list_sessions(
         # Add repositories
         for repo in instance.repositories:
             resources.append(
-                Resource(
+                Resource.model_construct(
                     type="repository",
                     id=repo.id,
                     name=repo.name,
@@ -90,7 +116,7 @@ async def list_sessions(
         # Add components
         for comp in instance.components:
             resources.append(
-                Resource(
+                Resource.model_construct(
                     type="component",
                     id=comp.id,
                     name=comp.name,
@@ -104,7 +130,7 @@ async def list_sessions(
         # Add environments
         for env in instance.environments:
             resources.append(
-                Resource(
+                Resource.model_construct(
                     type="environment",
                     id=env.id,
                     name=env.name,
@@ -118,7 +144,7 @@ async def list_sessions(
         # Add flags
         for flag in instance.flags:
             resources.append(
-                Resource(
+                Resource.model_construct(
                     type="flag",
                     id=flag.id,
                     name=flag.name,
@@ -132,7 +158,7 @@ async def list_sessions(
         # Add applications
         for app in instance.applications:
             resources.append(
-                Resource(
+                Resource.model_construct(
                     type="application",
                     id=app.id,
                     name=app.name,
@@ -144,7 +170,7 @@ async def list_sessions(
             )
 
         sessions.append(
-            SessionInfo(
+            SessionInfo.model_construct(
                 session_id=instance.id,
                 instance_name=instance.name,
                 scenario_id=instance.scenario_id,
@@ -158,9 +184,9 @@ async def list_sessions(
         )
 
     # Sort by creation date (newest first)
-    sessions.sort(key=lambda s: s.created_at, reverse=True)
+    sessions.sort(key=attrgetter("created_at"), reverse=True)
 
-    return SessionListResponse(sessions=sessions)
+    return SessionListResponse.model_construct(sessions=sessions)
 
 
 @router.post("/run", response_model=CleanupResponse)
@@ -254,16 +280,15 @@ async def cleanup_expired(request: CleanupSessionRequest, config: ConfigDep):
     cleanup_manager = CleanupManager(config_manager=config)
     repo = InstanceRepository()
 
-    expired_instances = repo.find_expired()
-
     all_results = []
     total_cleaned = 0
 
-    for instance in expired_instances:
+    for instance in repo.iter_expired():
         try:
             result = await cleanup_manager.cleanup_session(
                 session_id=instance.id,
                 dry_run=request.dry_run,
+                instance=instance,
             )
 
             # Convert to API response format
@@ -1,5 +1,6 @@
 """API endpoints for configuration management."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, status
@@ -39,22 +40,10 @@ async def get_github_config(config: ConfigDep):
     Returns:
         GitHub username and token status
     """
-    try:
-        username = config.get_github_username()
-        has_token = config.get_github_pat() is not None
-
-        return GitHubConfigResponse(username=username, has_token=has_token)
+    username = config.get_github_username()
+    has_token = config.get_github_pat() is not None
 
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    return GitHubConfigResponse(username=username, has_token=has_token)
 
 
 @router.post("/github/token", response_model=StatusResponse)
@@ -75,16 +64,9 @@ async def set_github_token(request: SetGitHubTokenRequest, config: ConfigDep):
         logger.info("GitHub PAT updated via web API")
         return StatusResponse(status="success", message="GitHub token saved securely")
 
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    except KeyringUnavailableError:
+        # Handled by the app-level keyring error handler
+        raise
 
     except Exception as e:
         logger.error(f"Failed to save GitHub token: {e}")
@@ -122,28 +104,16 @@ async def get_cloudbees_config(config: ConfigDep):
     Returns:
         List of environments with their credential status
     """
-    try:
-        environments = config.list_tenants()
-        env_credentials = []
-
-        for env_name in environments:
-            has_token = config.get_cloudbees_pat(env_name) is not None
-            env_credentials.append(
-                CloudBeesTenantCredentials(name=env_name, has_token=has_token)
-            )
+    environments = config.list_tenants()
+    env_credentials = []
 
-        return CloudBeesConfigResponse(tenants=env_credentials)
+    for env_name in environments:
+        has_token = config.get_cloudbees_pat(env_name) is not None
+        env_credentials.append(
+            CloudBeesTenantCredentials(name=env_name, has_token=has_token)
+        )
 
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    return CloudBeesConfigResponse(tenants=env_credentials)
 
 
 @router.post("/cloudbees/token", response_model=StatusResponse)
@@ -175,16 +145,9 @@ async def set_cloudbees_token(request: SetCloudBeesTokenRequest, config: ConfigD
             message=f"CloudBees token saved securely for {request.tenant}",
         )
 
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    except KeyringUnavailableError:
+        # Handled by the app-level keyring error handler
+        raise
 
     except Exception as e:
         logger.error(f"Failed to save CloudBees token for {request.tenant}: {e}")
@@ -273,7 +236,7 @@ async def fetch_org_name(
     try:
         # Fetch org name from API
         with UnifyAPIClient(base_url=cloudbees_url, api_key=cloudbees_pat) as client:
-            org_data = client.get_organization(request.org_id)
+            org_data = await asyncio.to_thread(client.get_organization, request.org_id)
             # API response format: {"organization": {"displayName": "..."}}
             org_info = org_data.get("organization", {})
             org_name = org_info.get("displayName", "Unknown")
@@ -302,8 +265,6 @@ async def validate_all_credentials(request: ValidateAllCredentialsRequest):
     Returns:
         Validation results for both credentials
     """
-    import asyncio
-
     from mimic.gh import GitHubClient
 
     cloudbees_valid = False
@@ -316,7 +277,9 @@ async def validate_all_credentials(request: ValidateAllCredentialsRequest):
         with UnifyAPIClient(
             base_url=request.cloudbees_url, api_key=request.cloudbees_pat
         ) as client:
-            success, error = client.validate_credentials(request.organization_id)
+            success, error = await asyncio.to_thread(
+                client.validate_credentials, request.organization_id
+            )
             if success:
                 cloudbees_valid = True
             else:
@@ -326,9 +289,9 @@ async def validate_all_credentials(request: ValidateAllCredentialsRequest):
         cloudbees_error = sanitize_error_message(str(e))
 
     # Validate GitHub credentials
-    github_client = GitHubClient(request.github_pat)
     try:
-        success, error = asyncio.run(github_client.validate_credentials())
+        async with GitHubClient(request.github_pat) as github_client:
+            success, error = await github_client.validate_credentials()
         if success:
             github_valid = True
         else:
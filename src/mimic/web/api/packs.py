@@ -1,6 +1,8 @@
 """API endpoints for scenario pack management."""
 
+import asyncio
 import logging
+import os
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, status
@@ -55,12 +57,16 @@ def _count_scenarios_in_pack(pack_path: Path) -> int:
     Returns:
         Number of .yaml and .yml files in the pack directory
     """
-    if not pack_path.exists():
-        return 0
-
     # Count both .yaml and .yml files (matching scenarios.py loading behavior)
-    yaml_files = list(pack_path.glob("*.yaml")) + list(pack_path.glob("*.yml"))
-    return len(yaml_files)
+    try:
+        with os.scandir(pack_path) as entries:
+            return sum(
+                1
+                for entry in entries
+                if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
 
 
 @router.get("", response_model=ScenarioPackListResponse)
@@ -136,12 +142,13 @@ async def discover_refs(request: DiscoverRefsRequest, config: ConfigDep):
         )
 
     try:
-        client = GitHubClient(github_pat)
-
         # Fetch branches, PRs, and default branch concurrently
-        branches_data = await client.list_branches(owner, repo)
-        prs_data = await client.list_pull_requests(owner, repo, state="open")
-        default_branch = await client.get_default_branch(owner, repo)
+        async with GitHubClient(github_pat) as client:
+            branches_data, prs_data, default_branch = await asyncio.gather(
+                client.list_branches(owner, repo),
+                client.list_pull_requests(owner, repo, state="open"),
+                client.get_default_branch(owner, repo),
+            )
 
         # Convert to response models
         branches = [
@@ -407,10 +414,9 @@ async def switch_pack_ref(
                 )
 
             owner, repo = parsed
-            client = GitHubClient(github_pat)
-
             # Fetch PR details
-            prs = await client.list_pull_requests(owner, repo, state="all")
+            async with GitHubClient(github_pat) as client:
+                prs = await client.list_pull_requests(owner, repo, state="all")
             pr_data = next(
                 (pr for pr in prs if pr["number"] == request.pr_number), None
             )
@@ -485,32 +491,42 @@ async def update_packs(request: UpdatePacksRequest, config: ConfigDep):
         [request.pack_name] if request.pack_name else list(pack_configs.keys())
     )
 
+    async def update(pack_name: str) -> None:
+        # Get current ref info to handle PR updates correctly
+        ref_info = config.get_pack_current_ref(pack_name) or {}
+        await asyncio.to_thread(
+            pack_manager.update_pack,
+            pack_name,
+            pr_number=ref_info.get("pr_number"),
+            head_branch=ref_info.get("branch"),
+            head_repo_url=ref_info.get("pr_head_repo_url"),
+        )
+
+    known_packs = []
     for pack_name in packs_to_update:
         if pack_name not in pack_configs:
             errors[pack_name] = "Pack not found"
-            continue
+        else:
+            known_packs.append(pack_name)
 
-        try:
-            # Get current ref info to handle PR updates correctly
-            ref_info = config.get_pack_current_ref(pack_name) or {}
-            pr_number = ref_info.get("pr_number")
-            head_branch = ref_info.get("branch")
-            head_repo_url = ref_info.get("pr_head_repo_url")
+    # Each pack is its own git checkout, so their fetches can run side by side
+    results = await asyncio.gather(
+        *(update(pack_name) for pack_name in known_packs), return_exceptions=True
+    )
 
-            pack_manager.update_pack(
-                pack_name,
-                pr_number=pr_number,
-                head_branch=head_branch,
-                head_repo_url=head_repo_url,
+    for pack_name, result in zip(known_packs, results, strict=True):
+        if isinstance(result, ScenarioError):
+            errors[pack_name] = str(result)
+            logger.error(f"Failed to update scenario pack {pack_name}: {result}")
+        elif isinstance(result, Exception):
+            errors[pack_name] = str(result)
+            logger.error(
+                f"Unexpected error updating scenario pack {pack_name}: {result}"
             )
+        elif isinstance(result, BaseException):
+            raise result
+        else:
             updated.append(pack_name)
             logger.info(f"Updated scenario pack: {pack_name}")
 
-        except ScenarioError as e:
-            errors[pack_name] = str(e)
-            logger.error(f"Failed to update scenario pack {pack_name}: {e}")
-        except Exception as e:
-            errors[pack_name] = str(e)
-            logger.error(f"Unexpected error updating scenario pack {pack_name}: {e}")
-
     return UpdatePacksResponse(updated=updated, errors=errors)
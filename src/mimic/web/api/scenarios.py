@@ -1,12 +1,12 @@
 """API endpoints for scenario management and execution."""
 
 import asyncio
-import json
 import logging
 import uuid
 from datetime import datetime, timedelta
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
@@ -18,7 +18,14 @@ from mimic.exceptions import (
     ValidationError,
 )
 from mimic.instance_repository import InstanceRepository
+from mimic.models import (
+    CloudBeesApplication,
+    CloudBeesComponent,
+    CloudBeesEnvironment,
+    CloudBeesFlag,
+)
 from mimic.pipeline import CreationPipeline
+from mimic.unify import UnifyAPIClient
 from mimic.utils import resolve_run_name
 
 from ..dependencies import (
@@ -68,7 +75,9 @@ def _safe_json_serialize(data: Any) -> str:
             return obj.isoformat()
         raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-    return json.dumps(data, default=default_serializer)
+    return orjson.dumps(
+        data, default=default_serializer, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 def _enrich_instance_with_urls(instance_dict: dict, config, environment: str) -> dict:
@@ -99,14 +108,6 @@ def _enrich_instance_with_urls(instance_dict: dict, config, environment: str) ->
         # Convert API URL to UI URL: https://api.cloudbees.io -> https://cloudbees.io
         base_url = api_url.replace("//api.", "//")
 
-    # Import models for URL generation
-    from mimic.models import (
-        CloudBeesApplication,
-        CloudBeesComponent,
-        CloudBeesEnvironment,
-        CloudBeesFlag,
-    )
-
     # Add URLs to components
     if "components" in instance_dict and base_url and org_slug:
         for comp_dict in instance_dict["components"]:
@@ -179,31 +180,13 @@ async def get_scenario(
     Returns:
         Scenario details including parameter schema
     """
-    scenario = scenarios.get_scenario(scenario_id, pack_source)
-    if not scenario:
+    scenario_dict = scenarios.get_scenario_detail(scenario_id, pack_source)
+    if scenario_dict is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Scenario '{scenario_id}' not found",
         )
 
-    # Convert scenario to dict for response
-    scenario_dict = {
-        "id": scenario.id,
-        "name": scenario.name,
-        "summary": scenario.summary,
-        "details": scenario.details,
-        "wip": scenario.wip,
-        "pack_source": scenario.pack_source,
-        "scenario_pack": scenario.pack_source,  # For frontend compatibility
-        "parameter_schema": (
-            scenario.parameter_schema.model_dump()
-            if scenario.parameter_schema
-            else None
-        ),
-        "required_properties": scenario.required_properties,
-        "required_secrets": scenario.required_secrets,
-    }
-
     return ScenarioDetailResponse(scenario=scenario_dict)
 
 
@@ -259,8 +242,6 @@ async def check_properties(
     Returns:
         List of required and missing properties/secrets
     """
-    from mimic.unify import UnifyAPIClient
-
     scenario = scenarios.get_scenario(scenario_id, pack_source)
     if not scenario:
         raise HTTPException(
@@ -274,7 +255,9 @@ async def check_properties(
     try:
         # Fetch existing properties from the organization
         with UnifyAPIClient(base_url=cloudbees_url, api_key=cloudbees_pat) as client:
-            response = client.list_properties(request.organization_id)
+            response = await asyncio.to_thread(
+                client.list_properties, request.organization_id
+            )
             existing_properties = response.get("properties", [])
 
             # Build a set of existing property names
@@ -336,14 +319,13 @@ async def create_property(
     Returns:
         Status message
     """
-    from mimic.unify import UnifyAPIClient
-
     # Extract CloudBees credentials
     _, cloudbees_pat, cloudbees_url, _ = cloudbees_creds
 
     try:
         with UnifyAPIClient(base_url=cloudbees_url, api_key=cloudbees_pat) as client:
-            client.create_property(
+            await asyncio.to_thread(
+                client.create_property,
                 resource_id=request.organization_id,
                 name=request.name,
                 value=request.value,
@@ -507,13 +489,13 @@ async def run_scenario(
 
     # Pre-flight check: Validate GitHub App integration
     if scenario.repositories and validated_params.get("target_org"):
-        from mimic.unify import UnifyAPIClient
-
         try:
             with UnifyAPIClient(
                 base_url=cloudbees_url, api_key=cloudbees_pat
             ) as client:
-                github_orgs = client.list_github_apps(organization_id)
+                github_orgs = await asyncio.to_thread(
+                    client.list_github_apps, organization_id
+                )
                 target_org = validated_params.get("target_org")
 
                 if target_org not in github_orgs:
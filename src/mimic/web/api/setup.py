@@ -2,7 +2,7 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 
 from ...exceptions import KeyringUnavailableError
 from ..dependencies import ConfigDep
@@ -20,40 +20,26 @@ async def get_setup_status(config: ConfigDep):
     Returns:
         Status indicating whether setup is required and what's missing
     """
-    try:
-        missing_config = []
-
-        # Check GitHub credentials
-        if not config.get_github_username():
-            missing_config.append("github_username")
-        if not config.get_github_pat():
-            missing_config.append("github_token")
-
-        # Check if any environment is configured
-        current_env = config.get_current_tenant()
-        if not current_env:
-            missing_config.append("current_environment")
-        else:
-            # Check if current environment has CloudBees PAT
-            if not config.get_cloudbees_pat(current_env):
-                missing_config.append("cloudbees_token")
-
-        needs_setup = len(missing_config) > 0
-
-        return SetupStatusResponse(
-            needs_setup=needs_setup, missing_config=missing_config
-        )
-
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    missing_config = []
+
+    # Check GitHub credentials
+    if not config.get_github_username():
+        missing_config.append("github_username")
+    if not config.get_github_pat():
+        missing_config.append("github_token")
+
+    # Check if any environment is configured
+    current_env = config.get_current_tenant()
+    if not current_env:
+        missing_config.append("current_environment")
+    else:
+        # Check if current environment has CloudBees PAT
+        if not config.get_cloudbees_pat(current_env):
+            missing_config.append("cloudbees_token")
+
+    needs_setup = len(missing_config) > 0
+
+    return SetupStatusResponse(needs_setup=needs_setup, missing_config=missing_config)
 
 
 @router.post("/run", response_model=RunSetupResponse)
@@ -90,16 +76,9 @@ async def run_setup(request: RunSetupRequest, config: ConfigDep):
 
         return RunSetupResponse(success=True, message="Setup completed successfully")
 
-    except KeyringUnavailableError as e:
-        logger.error(f"Keyring unavailable during setup: {e}")
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "Keyring backend is not available",
-                "message": str(e),
-                "instructions": e.instructions,
-            },
-        ) from e
+    except KeyringUnavailableError:
+        # Handled by the app-level keyring error handler
+        raise
 
     except Exception as e:
         logger.error(f"Setup failed: {e}")
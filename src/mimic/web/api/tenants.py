@@ -1,5 +1,6 @@
 """API endpoints for tenant management."""
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, status
@@ -71,12 +72,16 @@ async def validate_credentials(request: ValidateCredentialsRequest):
         with UnifyAPIClient(
             base_url=request.environment_url, api_key=request.pat
         ) as client:
-            success, error = client.validate_credentials(request.org_id)
+            success, error = await asyncio.to_thread(
+                client.validate_credentials, request.org_id
+            )
 
             if success:
                 # Try to fetch org name for better UX
                 try:
-                    org_data = client.get_organization(request.org_id)
+                    org_data = await asyncio.to_thread(
+                        client.get_organization, request.org_id
+                    )
                     # API response format: {"organization": {"displayName": "..."}}
                     org_info = org_data.get("organization", {})
                     org_name = org_info.get("displayName", "Unknown")
@@ -126,7 +131,9 @@ async def add_preset_tenant(request: AddPresetTenantRequest, config: ConfigDep):
 
         # Validate credentials first
         with UnifyAPIClient(base_url=preset_config.url, api_key=request.pat) as client:
-            success, error = client.validate_credentials(request.org_id)
+            success, error = await asyncio.to_thread(
+                client.validate_credentials, request.org_id
+            )
 
             if not success:
                 raise HTTPException(
@@ -223,7 +230,9 @@ async def add_tenant(request: AddTenantRequest, config: ConfigDep):
             from mimic.unify import UnifyAPIClient
 
             with UnifyAPIClient(base_url=request.url, api_key=request.pat) as client:
-                success, error = client.validate_credentials(request.org_id)
+                success, error = await asyncio.to_thread(
+                    client.validate_credentials, request.org_id
+                )
                 if not success:
                     raise HTTPException(
                         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,6 +1,7 @@
 """FastAPI dependency injection for shared components."""
 
 import logging
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -11,8 +12,14 @@ from mimic.scenarios import ScenarioManager, initialize_scenarios_from_config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_config_manager() -> ConfigManager:
-    """Get a ConfigManager instance.
+    """Get the shared ConfigManager instance.
+
+    One instance serves every request: parsed config is reused only while
+    config.yaml's mtime and size are unchanged, and cached keyring secrets
+    expire after settings.KEYRING_CACHE_TTL seconds, so edits from the CLI
+    or another process are still picked up.
 
     Returns:
         ConfigManager instance for accessing configuration
@@ -20,13 +27,21 @@ def get_config_manager() -> ConfigManager:
     return ConfigManager()
 
 
-def get_scenario_manager() -> ScenarioManager:
+def get_scenario_manager(
+    config: Annotated[ConfigManager, Depends(get_config_manager)],
+) -> ScenarioManager:
     """Get a ScenarioManager instance.
 
+    Built per request so enabled/updated packs are picked up immediately;
+    unchanged scenario files are served from ScenarioManager's parse cache.
+
+    Args:
+        config: ConfigManager dependency
+
     Returns:
         ScenarioManager instance for accessing scenarios
     """
-    return initialize_scenarios_from_config()
+    return initialize_scenarios_from_config(config)
 
 
 def require_github_credentials(
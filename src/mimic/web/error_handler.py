@@ -23,21 +23,10 @@ from .models import ErrorCode, ErrorDetail, ErrorResponse
 
 logger = logging.getLogger(__name__)
 
-
-def sanitize_error_message(message: str) -> str:
-    """Sanitize error messages to prevent information disclosure.
-
-    Removes potential tokens, API keys, and other sensitive information
-    that might be present in error messages from external APIs.
-
-    Args:
-        message: Raw error message that may contain sensitive data
-
-    Returns:
-        Sanitized error message safe for client consumption
-    """
-    # Patterns to detect and remove sensitive information
-    patterns = [
+# Patterns to detect and remove sensitive information, compiled once
+_SENSITIVE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in [
         # Bearer tokens
         (r"Bearer\s+[A-Za-z0-9\-._~+/]+=*", "Bearer [REDACTED]"),
         # API keys (various formats)
@@ -53,10 +42,24 @@ def sanitize_error_message(message: str) -> str:
         # Basic auth credentials
         (r"Basic\s+[A-Za-z0-9+/=]+", "Basic [REDACTED]"),
     ]
+]
 
+
+def sanitize_error_message(message: str) -> str:
+    """Sanitize error messages to prevent information disclosure.
+
+    Removes potential tokens, API keys, and other sensitive information
+    that might be present in error messages from external APIs.
+
+    Args:
+        message: Raw error message that may contain sensitive data
+
+    Returns:
+        Sanitized error message safe for client consumption
+    """
     sanitized = message
-    for pattern, replacement in patterns:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+    for pattern, replacement in _SENSITIVE_PATTERNS:
+        sanitized = pattern.sub(replacement, sanitized)
 
     return sanitized
 
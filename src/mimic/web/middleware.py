@@ -12,6 +12,9 @@ from starlette.types import ASGIApp
 
 logger = logging.getLogger(__name__)
 
+# Client-supplied request IDs may only contain these characters
+_REQUEST_ID_PATTERN = re.compile(r"^[a-zA-Z0-9\-_]+$")
+
 # Context variable for request ID (accessible throughout request lifecycle)
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
@@ -41,7 +44,7 @@ def validate_request_id(request_id: str | None) -> str:
 
     # Validate format: alphanumeric, hyphens, underscores only
     # This prevents log injection and other special character attacks
-    if not re.match(r"^[a-zA-Z0-9\-_]+$", request_id):
+    if not _REQUEST_ID_PATTERN.match(request_id):
         logger.warning(
             f"Request ID contains invalid characters, generating new one: {request_id[:50]}"
         )
@@ -1,13 +1,18 @@
 """FastAPI server for Mimic web UI."""
 
+import hashlib
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
 
 from mimic.config_manager import ConfigManager
 from mimic.exceptions import (
@@ -39,6 +44,20 @@ logger = logging.getLogger(__name__)
 STATIC_DIR = Path(__file__).parent / "static"
 
 
+class ImmutableStaticFiles(StaticFiles):
+    """StaticFiles for content-hashed build output.
+
+    Vite puts a content hash in every asset file name, so a given URL never
+    changes content and browsers can cache it for good without revalidating.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for startup/shutdown tasks."""
@@ -85,55 +104,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-
-# Exception handlers - Using centralized error handlers with proper typing
-@app.exception_handler(ValidationError)
-async def validation_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle validation errors from Mimic."""
-    return await handle_validation_error(request, exc)  # type: ignore
-
-
-@app.exception_handler(PipelineError)
-async def pipeline_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle pipeline errors from Mimic."""
-    return await handle_pipeline_error(request, exc)  # type: ignore
-
-
-@app.exception_handler(GitHubError)
-async def github_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle GitHub API errors."""
-    return await handle_github_error(request, exc)  # type: ignore
-
-
-@app.exception_handler(UnifyAPIError)
-async def unify_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle CloudBees Unify API errors."""
-    return await handle_unify_error(request, exc)  # type: ignore
+# Compress larger responses (scenario/session listings, the JS bundle).
+# Starlette already skips text/event-stream, so SSE progress is unaffected.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
-@app.exception_handler(CredentialError)
-async def credential_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle credential errors."""
-    return await handle_credential_error(request, exc)  # type: ignore
-
-
-@app.exception_handler(KeyringUnavailableError)
-async def keyring_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle keyring unavailable errors."""
-    return await handle_keyring_error(request, exc)  # type: ignore
-
-
-@app.exception_handler(ScenarioError)
-async def scenario_error_handler_wrapper(request: Request, exc: Exception):
-    """Handle scenario loading/processing errors."""
-    return await handle_scenario_error(request, exc)  # type: ignore
-
-
-# Catch-all handler for unexpected exceptions
-@app.exception_handler(Exception)
-async def generic_exception_handler_wrapper(request: Request, exc: Exception):
-    """Handle unexpected exceptions."""
-    return await handle_generic_exception(request, exc)
+# Exception handlers - Using centralized error handlers with proper typing.
+# Starlette picks the handler by walking the exception's MRO, so each entry also
+# covers subclasses, with Exception as the catch-all for anything unexpected.
+EXCEPTION_HANDLERS = {
+    ValidationError: handle_validation_error,
+    PipelineError: handle_pipeline_error,
+    GitHubError: handle_github_error,
+    UnifyAPIError: handle_unify_error,
+    CredentialError: handle_credential_error,
+    KeyringUnavailableError: handle_keyring_error,
+    ScenarioError: handle_scenario_error,
+    Exception: handle_generic_exception,
+}
+for exc_type, handler in EXCEPTION_HANDLERS.items():
+    app.add_exception_handler(exc_type, handler)
 
 
 # Keep HTTPException handler for FastAPI's own exceptions
@@ -146,11 +136,15 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     )
 
 
-# Health check endpoint
+# Health check endpoint. The body never changes, so it is encoded once rather
+# than going through FastAPI's JSON serialization on every probe.
+HEALTH_RESPONSE_BODY = orjson.dumps({"status": "ok", "service": "mimic-api"})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "ok", "service": "mimic-api"}
+    return Response(HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 # Register API routers
@@ -165,10 +159,27 @@ app.include_router(version.router, prefix="/api")
 
 # Static file serving for production builds
 if STATIC_DIR.exists() and (STATIC_DIR / "index.html").exists():
+    # The built UI doesn't change while the server runs, so index its files once
+    # at import instead of hitting the filesystem on every SPA route
+    STATIC_FILES = frozenset(
+        path.relative_to(STATIC_DIR).as_posix()
+        for path in STATIC_DIR.rglob("*")
+        if path.is_file()
+    )
+    # index.html is the response for every client-side route, so keep it in
+    # memory rather than re-reading it from disk per page load
+    INDEX_HTML = (STATIC_DIR / "index.html").read_bytes()
+    # Unlike the hashed assets, index.html must be revalidated so a new build
+    # is picked up; the ETag lets that revalidation be a bodiless 304
+    INDEX_HEADERS = {
+        "ETag": f'"{hashlib.blake2b(INDEX_HTML, digest_size=8).hexdigest()}"',
+        "Cache-Control": "no-cache",
+    }
+
     # Mount static assets (JS, CSS, etc.) with caching
     app.mount(
         "/assets",
-        StaticFiles(directory=str(STATIC_DIR / "assets")),
+        ImmutableStaticFiles(directory=str(STATIC_DIR / "assets")),
         name="static-assets",
     )
 
@@ -179,12 +190,14 @@ if STATIC_DIR.exists() and (STATIC_DIR / "index.html").exists():
         This enables client-side routing to work correctly.
         """
         # If the path points to a file that exists, serve it
-        file_path = STATIC_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
+        if full_path in STATIC_FILES:
+            return FileResponse(STATIC_DIR / full_path)
 
         # Otherwise, serve index.html for SPA routing
-        return FileResponse(STATIC_DIR / "index.html")
+        if_none_match = request.headers.get("if-none-match", "")
+        if INDEX_HEADERS["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=INDEX_HEADERS)
+        return HTMLResponse(INDEX_HTML, headers=INDEX_HEADERS)
 
 else:
     logger.warning(
@@ -1,6 +1,8 @@
 """Tests for the cleanup manager."""
 
+import asyncio
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,6 +18,7 @@ from src.mimic.models import (
     GitHubRepository,
     Instance,
 )
+from src.mimic.unify import UnifyAPIClient
 
 
 @pytest.fixture
@@ -147,7 +150,7 @@ async def test_cleanup_session_github_repo(cleanup_manager, instance_repository)
     with patch("src.mimic.cleanup_manager.GitHubClient") as mock_github:
         mock_client = AsyncMock()
         mock_github.return_value = mock_client
-        mock_client.delete_repository.return_value = True
+        mock_client.delete_repositories.return_value = {"owner/test-repo": True}
 
         # Run cleanup
         results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
@@ -188,12 +191,8 @@ async def test_cleanup_session_cloudbees_component(
     )
     instance_repository.save(instance)
 
-    # Mock UnifyAPIClient
-    with patch("src.mimic.cleanup_manager.UnifyAPIClient") as mock_unify:
-        mock_client = MagicMock()
-        mock_unify.return_value = mock_client
-        mock_client.delete_component.return_value = None
-
+    # Mock the single-resource delete the bulk helper fans out to
+    with patch.object(UnifyAPIClient, "delete_component") as delete_component:
         # Run cleanup
         results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
 
@@ -204,7 +203,7 @@ async def test_cleanup_session_cloudbees_component(
         assert len(results["errors"]) == 0
 
         # Verify delete_component was called
-        mock_client.delete_component.assert_called_once_with("org-uuid", "comp-uuid")
+        delete_component.assert_called_once_with("org-uuid", "comp-uuid")
 
 
 @pytest.mark.asyncio
@@ -246,7 +245,12 @@ async def test_cleanup_session_dry_run(cleanup_manager, instance_repository):
         assert results["cleaned"][0]["dry_run"] is True
 
         # Verify delete was NOT called
-        mock_client.delete_repository.assert_not_called()
+        mock_client.delete_repositories.assert_not_called()
+
+        # A dry run needs neither credentials nor clients
+        mock_github.assert_not_called()
+        cleanup_manager.config_manager.get_github_pat.assert_not_called()
+        cleanup_manager.config_manager.get_cloudbees_pat.assert_not_called()
 
         # Verify instance was NOT deleted
         assert instance_repository.get_by_id("test-session") is not None
@@ -281,7 +285,9 @@ async def test_cleanup_session_with_errors(cleanup_manager, instance_repository)
     with patch("src.mimic.cleanup_manager.GitHubClient") as mock_github:
         mock_client = AsyncMock()
         mock_github.return_value = mock_client
-        mock_client.delete_repository.side_effect = Exception("API Error")
+        mock_client.delete_repositories.return_value = {
+            "owner/test-repo": Exception("API Error")
+        }
 
         # Run cleanup
         results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
@@ -322,20 +328,96 @@ async def test_cleanup_expired_sessions(cleanup_manager, instance_repository):
     with patch("src.mimic.cleanup_manager.GitHubClient") as mock_github:
         mock_client = AsyncMock()
         mock_github.return_value = mock_client
-        mock_client.delete_repository.return_value = True
+        mock_client.delete_repositories.side_effect = lambda names: dict.fromkeys(
+            names, True
+        )
 
         # Run cleanup
-        results = await cleanup_manager.cleanup_expired_sessions(
-            dry_run=False, auto_confirm=True
-        )
+        with (
+            patch.object(
+                instance_repository, "delete", side_effect=AssertionError
+            ) as delete,
+            patch.object(
+                instance_repository, "get_by_id", side_effect=AssertionError
+            ) as get_by_id,
+        ):
+            results = await cleanup_manager.cleanup_expired_sessions(
+                dry_run=False, auto_confirm=True
+            )
+        delete.assert_not_called()
+        # The sweep hands each loaded instance straight to cleanup_session
+        get_by_id.assert_not_called()
+        # All three instances share one tenant, so credentials are looked up once
+        config = cleanup_manager.config_manager
+        config.get_github_pat.assert_called_once_with()
+        config.get_cloudbees_pat.assert_called_once_with("prod")
+        config.get_tenant_url.assert_called_once_with("prod")
+        # ...and they share one client, closed once the sweep is done
+        mock_github.assert_called_once_with("test-github-token")
+        mock_client.aclose.assert_awaited_once()
 
         # Verify results
         assert results["total_sessions"] == 3
         assert results["cleaned_sessions"] == 3
         assert results["failed_sessions"] == 0
 
-        # Verify all instances were deleted
+        # Verify all instances were deleted, in a single state write
         assert len(instance_repository.find_all()) == 0
+        assert all(s["session_deleted"] for s in results["sessions"])
+
+
+@pytest.mark.asyncio
+async def test_cleanup_expired_sessions_runs_concurrently(
+    cleanup_manager, instance_repository, monkeypatch
+):
+    """Expired instances are cleaned up in parallel, up to the concurrency cap."""
+    monkeypatch.setattr("src.mimic.settings.CLEANUP_CONCURRENCY", 2)
+    past_time = datetime.now() - timedelta(days=1)
+
+    for i in range(3):
+        instance_repository.save(
+            Instance(
+                id=f"expired-{i}",
+                scenario_id="test-scenario",
+                name=f"test-run-{i}",
+                tenant="prod",
+                created_at=past_time,
+                expires_at=past_time,
+                repositories=[
+                    GitHubRepository(
+                        id=f"owner/repo-{i}",
+                        name=f"repo-{i}",
+                        owner="owner",
+                        url=f"https://github.com/owner/repo-{i}",
+                        created_at=past_time,
+                    )
+                ],
+            )
+        )
+
+    running = 0
+    peak = 0
+
+    async def delete_repositories(repo_names):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return dict.fromkeys(repo_names, True)
+
+    with patch("src.mimic.cleanup_manager.GitHubClient") as mock_github:
+        mock_client = AsyncMock()
+        mock_github.return_value = mock_client
+        mock_client.delete_repositories.side_effect = delete_repositories
+
+        results = await cleanup_manager.cleanup_expired_sessions(
+            dry_run=False, auto_confirm=True
+        )
+
+    assert peak == 2
+    assert results["cleaned_sessions"] == 3
+    assert len(instance_repository.find_all()) == 0
 
 
 @pytest.mark.asyncio
@@ -397,14 +479,13 @@ async def test_cleanup_multiple_resource_types(cleanup_manager, instance_reposit
     # Mock clients
     with (
         patch("src.mimic.cleanup_manager.GitHubClient") as mock_github,
-        patch("src.mimic.cleanup_manager.UnifyAPIClient") as mock_unify,
+        patch.object(UnifyAPIClient, "delete_component") as delete_component,
+        patch.object(UnifyAPIClient, "delete_environment") as delete_environment,
+        patch.object(UnifyAPIClient, "delete_application") as delete_application,
     ):
         mock_github_client = AsyncMock()
         mock_github.return_value = mock_github_client
-        mock_github_client.delete_repository.return_value = True
-
-        mock_unify_client = MagicMock()
-        mock_unify.return_value = mock_unify_client
+        mock_github_client.delete_repositories.return_value = {"owner/repo": True}
 
         # Run cleanup
         results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
@@ -413,10 +494,230 @@ async def test_cleanup_multiple_resource_types(cleanup_manager, instance_reposit
         assert len(results["cleaned"]) == 4
 
         # Verify all delete methods were called
-        mock_github_client.delete_repository.assert_called_once()
-        mock_unify_client.delete_component.assert_called_once()
-        mock_unify_client.delete_environment.assert_called_once()
-        mock_unify_client.delete_application.assert_called_once()
+        mock_github_client.delete_repositories.assert_called_once_with(["owner/repo"])
+        delete_component.assert_called_once_with("org-uuid", "comp-uuid")
+        delete_environment.assert_called_once_with("org-uuid", "env-uuid")
+        delete_application.assert_called_once_with("org-uuid", "app-uuid")
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_deletes_tier_concurrently(
+    cleanup_manager, instance_repository
+):
+    """Resources in the same tier are deleted concurrently, not one by one."""
+    now = datetime.now()
+
+    instance = Instance(
+        id="test-session",
+        scenario_id="test-scenario",
+        name="test-run",
+        tenant="prod",
+        created_at=now,
+        expires_at=now + timedelta(days=7),
+        components=[
+            CloudBeesComponent(
+                id=f"comp-{i}",
+                name=f"component-{i}",
+                org_id="org-uuid",
+                created_at=now,
+            )
+            for i in range(2)
+        ],
+    )
+    instance_repository.save(instance)
+
+    # Each delete waits for the other, so this only completes if both are in flight
+    barrier = threading.Barrier(2, timeout=1)
+
+    with patch.object(
+        UnifyAPIClient,
+        "delete_component",
+        side_effect=lambda org_id, component_id: barrier.wait(),
+    ):
+        results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
+
+    assert len(results["cleaned"]) == 2
+    assert results["errors"] == []
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_bulk_deletes_per_org(
+    cleanup_manager, instance_repository
+):
+    """Each organization's resources in a tier go out in one bulk delete."""
+    now = datetime.now()
+
+    instance = Instance(
+        id="test-session",
+        scenario_id="test-scenario",
+        name="test-run",
+        tenant="prod",
+        created_at=now,
+        expires_at=now + timedelta(days=7),
+        components=[
+            CloudBeesComponent(
+                id=f"comp-{i}",
+                name=f"component-{i}",
+                org_id=f"org-{i % 2}",
+                created_at=now,
+            )
+            for i in range(4)
+        ],
+    )
+    instance_repository.save(instance)
+
+    async def bulk_delete_components(org_id, component_ids):
+        return {
+            component_id: Exception("API Error") if component_id == "comp-3" else None
+            for component_id in component_ids
+        }
+
+    with patch.object(
+        UnifyAPIClient, "bulk_delete_components", side_effect=bulk_delete_components
+    ) as bulk_delete:
+        results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
+
+    assert [c.args for c in bulk_delete.call_args_list] == [
+        ("org-0", ["comp-0", "comp-2"]),
+        ("org-1", ["comp-1", "comp-3"]),
+    ]
+    assert [r["id"] for r in results["cleaned"]] == ["comp-0", "comp-2", "comp-1"]
+    assert results["errors"] == [
+        {"type": "cloudbees_component", "id": "comp-3", "error": "API Error"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_continues_after_a_failed_delete(
+    cleanup_manager, instance_repository
+):
+    """One failed CloudBees delete is reported without stopping later tiers."""
+    now = datetime.now()
+
+    instance = Instance(
+        id="test-session",
+        scenario_id="test-scenario",
+        name="test-run",
+        tenant="prod",
+        created_at=now,
+        expires_at=now + timedelta(days=7),
+        repositories=[
+            GitHubRepository(
+                id="test-org/test-repo",
+                owner="test-org",
+                name="test-repo",
+                url="https://github.com/test-org/test-repo",
+                created_at=now,
+            )
+        ],
+        components=[
+            CloudBeesComponent(
+                id=f"comp-{i}",
+                name=f"component-{i}",
+                org_id="org-uuid",
+                created_at=now,
+            )
+            for i in range(3)
+        ],
+    )
+    instance_repository.save(instance)
+
+    def delete_component(org_id, component_id):
+        if component_id == "comp-1":
+            raise Exception("API Error")
+
+    with (
+        patch.object(
+            UnifyAPIClient, "delete_component", side_effect=delete_component
+        ) as delete,
+        patch.object(UnifyAPIClient, "close") as close_unify,
+        patch(
+            "src.mimic.cleanup_manager.GitHubClient.delete_repositories",
+            new_callable=AsyncMock,
+            return_value={"test-org/test-repo": True},
+        ) as delete_repos,
+    ):
+        results = await cleanup_manager.cleanup_session("test-session", dry_run=False)
+
+    assert delete.call_count == 3
+    assert sorted(r["id"] for r in results["cleaned"]) == [
+        "comp-0",
+        "comp-2",
+        "test-org/test-repo",
+    ]
+    assert results["errors"] == [
+        {"type": "cloudbees_component", "id": "comp-1", "error": "API Error"}
+    ]
+    delete_repos.assert_awaited_once()
+    close_unify.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_closes_clients_when_a_tier_raises(
+    cleanup_manager, instance_repository
+):
+    """Clients opened by cleanup_session are closed even if a tier raises."""
+    now = datetime.now()
+
+    instance = Instance(
+        id="test-session",
+        scenario_id="test-scenario",
+        name="test-run",
+        tenant="prod",
+        created_at=now,
+        expires_at=now + timedelta(days=7),
+    )
+    instance_repository.save(instance)
+
+    with (
+        patch.object(
+            cleanup_manager,
+            "_cleanup_cloudbees_tier",
+            side_effect=RuntimeError("boom"),
+        ),
+        patch.object(
+            cleanup_manager, "_close_clients", new_callable=AsyncMock
+        ) as close_clients,
+    ):
+        with pytest.raises(RuntimeError, match="boom"):
+            await cleanup_manager.cleanup_session("test-session", dry_run=False)
+
+    close_clients.assert_awaited_once()
+    assert instance_repository.get_by_id("test-session") is not None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_session_prints_each_tier_once(
+    cleanup_manager, instance_repository
+):
+    """A tier's output lines are rendered with a single console call."""
+    now = datetime.now()
+
+    instance = Instance(
+        id="test-session",
+        scenario_id="test-scenario",
+        name="test-run",
+        tenant="prod",
+        created_at=now,
+        expires_at=now + timedelta(days=7),
+        components=[
+            CloudBeesComponent(
+                id=f"comp-{i}",
+                name=f"component-{i}",
+                org_id="org-uuid",
+                created_at=now,
+            )
+            for i in range(3)
+        ],
+    )
+    instance_repository.save(instance)
+
+    with patch.object(UnifyAPIClient, "delete_component"):
+        await cleanup_manager.cleanup_session("test-session", dry_run=False)
+
+    cleanup_manager.console.print.assert_called_once()
+    output = cleanup_manager.console.print.call_args.args[0]
+    assert output.count("Deleted component") == 3
 
 
 @pytest.mark.asyncio
@@ -105,6 +105,8 @@ class TestSetupCommand:
 
         # Mock GitHubClient validation (async method)
         mock_gh_instance = MagicMock()
+        mock_gh_instance.__aenter__ = AsyncMock(return_value=mock_gh_instance)
+        mock_gh_instance.__aexit__ = AsyncMock(return_value=None)
         mock_gh_instance.validate_credentials = AsyncMock(return_value=(True, None))
         mock_github_client.return_value = mock_gh_instance
 
@@ -167,6 +169,8 @@ class TestSetupCommand:
 
         # Mock GitHubClient validation
         mock_gh_instance = MagicMock()
+        mock_gh_instance.__aenter__ = AsyncMock(return_value=mock_gh_instance)
+        mock_gh_instance.__aexit__ = AsyncMock(return_value=None)
         mock_gh_instance.validate_credentials = AsyncMock(return_value=(True, None))
         mock_github_client.return_value = mock_gh_instance
 
@@ -218,6 +222,8 @@ class TestSetupCommand:
 
         # Mock GitHubClient validation
         mock_gh_instance = MagicMock()
+        mock_gh_instance.__aenter__ = AsyncMock(return_value=mock_gh_instance)
+        mock_gh_instance.__aexit__ = AsyncMock(return_value=None)
         mock_gh_instance.validate_credentials = AsyncMock(return_value=(True, None))
         mock_github_client.return_value = mock_gh_instance
 
@@ -347,6 +353,8 @@ class TestSetupCommand:
 
         # Mock GitHubClient validation
         mock_gh_instance = MagicMock()
+        mock_gh_instance.__aenter__ = AsyncMock(return_value=mock_gh_instance)
+        mock_gh_instance.__aexit__ = AsyncMock(return_value=None)
         mock_gh_instance.validate_credentials = AsyncMock(return_value=(True, None))
         mock_github_client.return_value = mock_gh_instance
 
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
 from mimic.config_manager import ConfigManager
 
@@ -347,6 +348,32 @@ class TestCredentialManagement:
         mock_keyring.delete_password.assert_called_with("mimic", "github")
         assert config_manager.get_github_pat() is None
 
+    def test_recent_keyring_lookups_are_reused(self, config_manager, mock_keyring):
+        """Repeated reads within the TTL hit the keyring backend once."""
+        mock_keyring.get_password.side_effect = lambda service, username: "pat"
+
+        assert config_manager.get_github_pat() == "pat"
+        assert config_manager.get_github_pat() == "pat"
+
+        mock_keyring.get_password.assert_called_once_with("mimic", "github")
+
+    def test_keyring_cache_expires(self, config_manager, mock_keyring, monkeypatch):
+        """Lookups older than the TTL go back to the keyring."""
+        monkeypatch.setattr("mimic.settings.KEYRING_CACHE_TTL", 0)
+
+        config_manager.get_github_pat()
+        config_manager.get_github_pat()
+
+        assert mock_keyring.get_password.call_count == 2
+
+    def test_setting_pat_updates_cached_lookup(self, config_manager):
+        """A PAT stored after a lookup is returned immediately."""
+        assert config_manager.get_cloudbees_pat("prod") is None
+
+        config_manager.set_cloudbees_pat("prod", "new-pat")
+
+        assert config_manager.get_cloudbees_pat("prod") == "new-pat"
+
 
 class TestSettingsManagement:
     """Test settings management."""
@@ -436,6 +463,33 @@ class TestConfigPersistence:
         assert config["tenants"] == {}
         assert config["current_tenant"] is None
 
+    def test_config_parsed_once_until_file_changes(self, config_manager):
+        """Repeated loads reuse the parsed config until the file changes."""
+        config_manager.set_setting("default_expiration_days", 30)
+
+        with patch(
+            "mimic.config_manager.yaml.safe_load", wraps=yaml.safe_load
+        ) as safe_load:
+            assert config_manager.get_setting("default_expiration_days") == 30
+            assert config_manager.get_setting("auto_cleanup_prompt") is True
+            safe_load.assert_not_called()
+
+            # An edit from outside the process is picked up
+            config_manager.config_file.write_text(
+                yaml.dump({"settings": {"default_expiration_days": 3}})
+            )
+            assert config_manager.get_setting("default_expiration_days") == 3
+            safe_load.assert_called_once()
+
+    def test_loaded_config_is_a_private_copy(self, config_manager):
+        """Modifying a loaded config without saving doesn't leak into later loads."""
+        config_manager.set_setting("default_expiration_days", 30)
+
+        config = config_manager.load_config()
+        config["settings"]["default_expiration_days"] = 1
+
+        assert config_manager.get_setting("default_expiration_days") == 30
+
 
 class TestFirstRunDetection:
     """Test first-run detection functionality."""
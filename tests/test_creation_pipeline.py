@@ -0,0 +1,71 @@
+"""Tests for CreationPipeline instance building."""
+
+import logging
+
+from mimic.pipeline import CreationPipeline
+from mimic.scenarios import ApplicationConfig, Scenario
+
+
+def _pipeline() -> CreationPipeline:
+    return CreationPipeline(
+        organization_id="org-1",
+        endpoint_id="endpoint-1",
+        unify_pat="pat",
+        unify_base_url="https://unify.test",
+        session_id="session-1",
+        github_pat="gh-pat",
+        scenario_id="demo",
+        tenant="prod",
+    )
+
+
+class TestBuildInstance:
+    """Tests for _build_instance."""
+
+    def test_links_resources_and_shared_flag(self):
+        """Applications link only their own components/environments."""
+        pipeline = _pipeline()
+        resources = pipeline.resource_manager
+        resources.created_components = {"api": {"id": "c-1"}, "web": {"id": "c-2"}}
+        resources.created_environments = {
+            "dev": {"id": "e-1", "properties": []},
+            "prod": {"id": "e-2", "properties": []},
+        }
+        resources.created_flags = {"beta": {"id": "f-1"}}
+        resources.created_applications = {
+            "shop": {"id": "a-1", "components": ["c-2"], "environments": ["e-1"]},
+            "shared": {"id": "a-2", "components": [], "environments": []},
+        }
+        scenario = Scenario(
+            id="demo",
+            name="Demo",
+            summary="demo",
+            repositories=[],
+            applications=[
+                ApplicationConfig(name="shop"),
+                ApplicationConfig(name="shared", is_shared=True),
+            ],
+        )
+
+        instance = pipeline._build_instance(scenario)
+
+        apps = {app.name: app for app in instance.applications}
+        assert apps["shop"].component_ids == ["c-2"]
+        assert apps["shop"].environment_ids == ["e-1"]
+        assert not apps["shop"].is_shared
+        assert apps["shared"].is_shared
+        assert all(env.flag_ids == ["f-1"] for env in instance.environments)
+
+
+class TestPipelineLogging:
+    """Tests for pipeline logging setup."""
+
+    def test_constructor_leaves_logging_untouched(self):
+        """Building a pipeline doesn't add handlers or stop propagation."""
+        pipeline_logger = logging.getLogger("mimic.pipeline")
+        handlers = list(pipeline_logger.handlers)
+
+        _pipeline()
+
+        assert pipeline_logger.handlers == handlers
+        assert pipeline_logger.propagate
@@ -1,9 +1,13 @@
 """Tests for GitHub API client."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from mimic.exceptions import GitHubError
 from mimic.gh import GitHubClient, parse_github_url
 
 
@@ -242,3 +246,254 @@ class TestGitHubClientDefaultBranch:
             default_branch = await client.get_default_branch("owner", "repo")
 
         assert default_branch is None
+
+
+class TestGitHubClientCommitFileChanges:
+    """Tests for GitHubClient.commit_file_changes."""
+
+    @pytest.mark.asyncio
+    async def test_commits_additions_and_deletions_in_one_mutation(self):
+        """Test the head is resolved and all changes go in one commit."""
+        client = GitHubClient("test_token")
+
+        head_response = AsyncMock()
+        head_response.status_code = 200
+        head_response.json = lambda: {
+            "data": {
+                "repository": {
+                    "defaultBranchRef": {"name": "main", "target": {"oid": "abc123"}}
+                }
+            }
+        }
+        commit_response = AsyncMock()
+        commit_response.status_code = 200
+        commit_response.json = lambda: {
+            "data": {"createCommitOnBranch": {"commit": {"oid": "def456"}}}
+        }
+
+        with patch.object(
+            client, "_request", side_effect=[head_response, commit_response]
+        ) as mock_request:
+            commit = await client.commit_file_changes(
+                "owner",
+                "repo",
+                "Move files",
+                additions={"new.txt": "hi"},
+                deletions=["old.txt"],
+            )
+
+        assert commit == {"oid": "def456"}
+        mutation_input = mock_request.call_args.kwargs["json"]["variables"]["input"]
+        assert mutation_input["expectedHeadOid"] == "abc123"
+        assert mutation_input["branch"]["branchName"] == "main"
+        assert mutation_input["fileChanges"] == {
+            "additions": [{"path": "new.txt", "contents": "aGk="}],
+            "deletions": [{"path": "old.txt"}],
+        }
+
+    @pytest.mark.asyncio
+    async def test_graphql_errors_raise(self):
+        """Test GraphQL errors surface as GitHubError."""
+        client = GitHubClient("test_token")
+
+        mock_response = AsyncMock()
+        mock_response.status_code = 200
+        mock_response.json = lambda: {"errors": [{"message": "Bad credentials"}]}
+
+        with patch.object(client, "_request", return_value=mock_response):
+            with pytest.raises(GitHubError, match="Bad credentials"):
+                await client.commit_file_changes(
+                    "owner", "repo", "msg", deletions=["a.txt"]
+                )
+
+
+class TestGitHubClientSession:
+    """Tests for the pooled HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_http_client(self):
+        """Requests on the same loop reuse one pool until the client is closed."""
+        client = GitHubClient("test-token")
+
+        first = client._get_http_client()
+        assert client._get_http_client() is first
+        assert str(first.base_url) == "https://api.github.com"
+        assert first.headers["Authorization"] == "Bearer test-token"
+
+        await client.aclose()
+        assert first.is_closed
+        second = client._get_http_client()
+        assert second is not first
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_pool_from_another_loop_is_closed_there(self):
+        """Switching loops closes the old pool on the loop that opened it."""
+        client = GitHubClient("test-token")
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+
+            async def open_pool() -> httpx.AsyncClient:
+                return client._get_http_client()
+
+            first = asyncio.run_coroutine_threadsafe(open_pool(), other_loop).result()
+            second = client._get_http_client()
+            assert second is not first
+
+            # Let the scheduled close run on the other loop
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result()
+            assert first.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+            await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_json_body_is_serialized_once(self):
+        """JSON bodies are encoded up front and reused across retries."""
+        client = GitHubClient("test-token")
+        http = AsyncMock()
+        http.request.side_effect = [
+            httpx.Response(502, headers={"Retry-After": "0"}),
+            httpx.Response(200),
+        ]
+
+        with patch.object(client, "_get_http_client", return_value=http):
+            response = await client._request("PUT", "/x", json={"content": "YQ=="})
+
+        assert response.status_code == 200
+        bodies = [c.kwargs["content"] for c in http.request.call_args_list]
+        assert bodies == [b'{"content":"YQ=="}'] * 2
+        assert http.request.call_args.kwargs["headers"] == {
+            "Content-Type": "application/json"
+        }
+
+
+class TestGitHubClientExistenceChecks:
+    """Tests for checks that only need a status code."""
+
+    @pytest.mark.asyncio
+    async def test_repo_exists_uses_head(self):
+        """repo_exists issues a HEAD request and maps 200 to True."""
+        client = GitHubClient("test-token")
+        with patch.object(
+            client, "_request", return_value=httpx.Response(200)
+        ) as mock_request:
+            assert await client.repo_exists("owner", "repo")
+        mock_request.assert_awaited_once_with("HEAD", "/repos/owner/repo")
+
+    @pytest.mark.asyncio
+    async def test_check_user_collaboration_uses_head(self):
+        """Collaborator checks issue a HEAD request and map 204 to True."""
+        client = GitHubClient("test-token")
+        with patch.object(
+            client, "_request", return_value=httpx.Response(404)
+        ) as mock_request:
+            assert not await client.check_user_collaboration("owner", "repo", "dev")
+        mock_request.assert_awaited_once_with(
+            "HEAD", "/repos/owner/repo/collaborators/dev"
+        )
+
+
+class TestGitHubClientSecrets:
+    """Tests for Actions secret uploads."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_secrets_fetch_public_key_once(self):
+        """Several secrets share one public-key lookup and upload concurrently."""
+        from nacl import encoding, public
+
+        client = GitHubClient("test-token")
+        key = public.PrivateKey.generate().public_key.encode(encoding.Base64Encoder)
+        key_response = AsyncMock(status_code=200)
+        key_response.json = lambda: {"key_id": "k-1", "key": key.decode()}
+        put_response = AsyncMock(status_code=201)
+
+        async def fake_request(method, endpoint, **kwargs):
+            return key_response if method == "GET" else put_response
+
+        with patch.object(client, "_request", side_effect=fake_request) as request:
+            results = await client.create_or_update_secrets(
+                "owner", "repo", {"A": "1", "B": "2"}
+            )
+
+        assert results == {"A": True, "B": True}
+        methods = [c.args[0] for c in request.call_args_list]
+        assert methods.count("GET") == 1
+        assert methods.count("PUT") == 2
+
+        # The public key is cached for later secrets on the same repository
+        with patch.object(client, "_request", side_effect=fake_request) as request:
+            assert await client.create_or_update_secret("owner", "repo", "C", "3")
+        assert [c.args[0] for c in request.call_args_list] == ["PUT"]
+
+        # A failed upload drops the cached key
+        put_response.status_code = 422
+        with patch.object(client, "_request", side_effect=fake_request):
+            assert not await client.create_or_update_secret("owner", "repo", "D", "4")
+        assert ("owner", "repo") not in client._public_key_cache
+
+    @pytest.mark.asyncio
+    async def test_missing_public_key_fails_all(self):
+        """Without a public key nothing is uploaded."""
+        client = GitHubClient("test-token")
+        with patch.object(client, "get_repo_public_key", return_value=None):
+            results = await client.create_or_update_secrets("o", "r", {"A": "1"})
+        assert results == {"A": False}
+
+
+class TestGitHubClientDeleteRepositories:
+    """Tests for GitHubClient.delete_repositories."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_concurrently_and_collects_failures(self):
+        """Deletes run side by side and a failure doesn't hide the others."""
+        import asyncio
+
+        client = GitHubClient("test-token")
+        # Each delete waits for the other, so this only completes if both are in flight
+        barrier = asyncio.Barrier(2)
+
+        async def fake_request(method, endpoint, **kwargs):
+            await asyncio.wait_for(barrier.wait(), timeout=1)
+            status = 500 if endpoint == "/repos/owner/bad" else 204
+            return httpx.Response(status, text="boom")
+
+        with patch.object(client, "_request", side_effect=fake_request):
+            results = await client.delete_repositories(["owner/good", "owner/bad"])
+
+        assert results["owner/good"] is True
+        assert isinstance(results["owner/bad"], Exception)
+        assert "500" in str(results["owner/bad"])
+
+
+class TestGitHubClientGetFile:
+    """Tests for GitHubClient.get_file_in_repo."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_content_by_default(self):
+        """File content is decoded into decoded_content."""
+        client = GitHubClient("test-token")
+        response = AsyncMock(status_code=200)
+        response.json = lambda: {"sha": "s1", "content": "aGVsbG8=\n"}
+
+        with patch.object(client, "_request", return_value=response):
+            data = await client.get_file_in_repo("o", "r", "a.txt")
+
+        assert data is not None
+        assert data["decoded_content"] == "hello"
+
+    @pytest.mark.asyncio
+    async def test_decode_false_skips_decoding(self):
+        """Metadata-only callers don't pay for decoding (even of binary files)."""
+        client = GitHubClient("test-token")
+        response = AsyncMock(status_code=200)
+        response.json = lambda: {"sha": "s1", "content": "//79"}
+
+        with patch.object(client, "_request", return_value=response):
+            data = await client.get_file_in_repo("o", "r", "a.bin", decode=False)
+
+        assert data == {"sha": "s1", "content": "//79"}
@@ -1,6 +1,9 @@
 """Tests for InstanceRepository - persistence and retrieval of Instance objects."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -502,6 +505,38 @@ class TestFindByTenant:
         assert instances == []
 
 
+class TestFindByFieldSinglePass:
+    """Test that scenario/tenant lookups only hydrate matching instances."""
+
+    def test_non_matching_instances_are_not_hydrated(self, repo, sample_instance):
+        """Other scenarios' and tenants' data is never validated."""
+        repo.save(sample_instance)
+        with repo._writer() as state:
+            # Not a valid Instance - would fail if it were hydrated
+            state["instances"]["other"] = {"scenario_id": "other", "tenant": "demo"}
+
+        assert [i.id for i in repo.find_by_scenario("test-scenario")] == ["test-123"]
+        assert [i.id for i in repo.find_by_tenant("prod")] == ["test-123"]
+
+    def test_field_index_follows_writes(self, repo, sample_instance):
+        """Lookups reuse one index per snapshot and see later saves and deletes."""
+        repo.save(sample_instance)
+        assert repo.get_by_name("test-instance").id == "test-123"
+        index = InstanceRepository._index_cache[repo.state_file][1]["field:name"]
+        assert repo.get_by_name("missing") is None
+        assert (
+            InstanceRepository._index_cache[repo.state_file][1]["field:name"] is index
+        )
+
+        repo.save(sample_instance.model_copy(update={"id": "b", "name": "second"}))
+        assert repo.get_by_name("second").id == "b"
+        assert len(repo.find_by_scenario("test-scenario")) == 2
+
+        repo.delete("test-123")
+        assert repo.get_by_name("test-instance") is None
+        assert [i.id for i in repo.find_by_tenant("prod")] == ["b"]
+
+
 class TestFindExpired:
     """Test find_expired method."""
 
@@ -588,6 +623,85 @@ class TestFindExpired:
         expired_instances = repo.find_expired()
         assert expired_instances == []
 
+    def test_find_expired_only_hydrates_expired(self, repo, sample_instance):
+        """Active instances are filtered on raw data and never hydrated."""
+        expired = sample_instance.model_copy(
+            update={"id": "old", "expires_at": datetime.now() - timedelta(days=1)}
+        )
+        repo.save(expired)
+        with repo._writer() as state:
+            # Not a valid Instance - would fail if it were hydrated
+            state["instances"]["active"] = {
+                "expires_at": (datetime.now() + timedelta(days=1)).isoformat()
+            }
+
+        assert [i.id for i in repo.find_expired()] == ["old"]
+
+    def test_iter_expired_is_lazy_and_safe_to_delete_during(
+        self, repo, sample_instance
+    ):
+        """Instances are hydrated on demand and deletes don't disturb iteration."""
+        for instance_id in ("a", "b"):
+            repo.save(
+                sample_instance.model_copy(
+                    update={
+                        "id": instance_id,
+                        "expires_at": datetime.now() - timedelta(days=1),
+                    }
+                )
+            )
+        repo.save(sample_instance)
+
+        seen = []
+        for instance in repo.iter_expired():
+            seen.append(instance.id)
+            repo.delete(instance.id)
+
+        assert sorted(seen) == ["a", "b"]
+        assert [i.id for i in repo.find_all()] == ["test-123"]
+
+    def test_expiry_index_skips_never_expiring(self, repo, sample_instance):
+        """Only instances with an expiry are indexed, in expiry order."""
+        now = datetime.now()
+        for instance_id, days in (("late", 1), ("early", 3)):
+            repo.save(
+                sample_instance.model_copy(
+                    update={"id": instance_id, "expires_at": now - timedelta(days)}
+                )
+            )
+        repo.save(
+            sample_instance.model_copy(update={"id": "never", "expires_at": None})
+        )
+        repo.save(sample_instance)
+
+        assert [i.id for i in repo.iter_expired()] == ["early", "late"]
+        times, ids = InstanceRepository._index_cache[repo.state_file][1]["expiry"]
+        assert ids == ["early", "late", "test-123"]
+        assert times == sorted(times)
+
+
+class TestCount:
+    """Test count method."""
+
+    def test_count_reads_raw_data_without_hydrating(self, repo, sample_instance):
+        """Totals and expired counts come from stored data alone."""
+        expired = sample_instance.model_copy(
+            update={"id": "old", "expires_at": datetime.now() - timedelta(days=1)}
+        )
+        repo.save(sample_instance)
+        repo.save(expired)
+        with repo._writer() as state:
+            # Not a valid Instance - would fail if it were hydrated
+            state["instances"]["never"] = {"expires_at": None}
+
+        assert repo.count() == 3
+        assert repo.count(expired_only=True) == 1
+
+    def test_count_empty(self, repo):
+        """An empty repository counts zero instances."""
+        assert repo.count() == 0
+        assert repo.count(expired_only=True) == 0
+
 
 class TestDelete:
     """Test delete method."""
@@ -618,6 +732,23 @@ class TestDelete:
 
         assert "Instance nonexistent not found" in str(exc_info.value)
 
+    def test_delete_many_removes_in_one_write(self, repo, sample_instance):
+        """delete_many removes every stored ID and ignores unknown ones."""
+        for instance_id in ("a", "b", "c"):
+            repo.save(sample_instance.model_copy(update={"id": instance_id}))
+
+        with patch.object(repo, "_save_state", wraps=repo._save_state) as save:
+            assert repo.delete_many(["a", "c", "missing"]) == 2
+
+        save.assert_called_once()
+        assert [i.id for i in repo.find_all()] == ["b"]
+
+    def test_delete_many_empty_is_noop(self, repo):
+        """Nothing is written when there is nothing to delete."""
+        with patch.object(repo, "_save_state") as save:
+            assert repo.delete_many([]) == 0
+        save.assert_not_called()
+
 
 class TestExists:
     """Test exists method."""
@@ -638,3 +769,57 @@ class TestExists:
 
         repo.delete("test-123")
         assert not repo.exists("test-123")
+
+
+class TestStateCache:
+    """Test in-memory caching of the parsed state file."""
+
+    def test_reads_reuse_parsed_state(self, repo, sample_instance):
+        """Repeated reads don't re-parse an unchanged state file."""
+        repo.save(sample_instance)
+        repo2 = InstanceRepository(state_file=repo.state_file)
+
+        with patch("mimic.instance_repository.orjson.loads") as load:
+            assert repo2.get_by_id("test-123") is not None
+            assert repo2.exists("test-123")
+            assert len(repo2.find_all()) == 1
+
+        load.assert_not_called()
+
+    def test_external_changes_are_picked_up(self, repo, sample_instance):
+        """Edits made to the file outside the repository invalidate the cache."""
+        repo.save(sample_instance)
+        assert repo.exists("test-123")
+
+        repo.state_file.write_text(json.dumps({"instances": {}}, indent=4))
+
+        assert not repo.exists("test-123")
+
+    def test_save_replaces_file_atomically(self, repo, sample_instance):
+        """Saves go through a temporary file that is renamed into place."""
+        repo.save(sample_instance)
+
+        assert json.loads(repo.state_file.read_text())["instances"]["test-123"]
+        assert list(repo.state_file.parent.iterdir()) == [repo.state_file]
+
+    def test_concurrent_saves_are_not_lost(self, repo, sample_instance):
+        """Saves from several threads all land in the state file."""
+        instances = [
+            sample_instance.model_copy(update={"id": f"id-{i}"}) for i in range(20)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(repo.save, instances))
+
+        reloaded = InstanceRepository(state_file=repo.state_file)
+        assert {i.id for i in reloaded.find_all()} == {f"id-{i}" for i in range(20)}
+
+    def test_readers_keep_consistent_snapshot(self, repo, sample_instance):
+        """A snapshot handed to a reader isn't mutated by later writes."""
+        repo.save(sample_instance)
+        snapshot = repo._load_state()
+
+        repo.delete("test-123")
+
+        assert "test-123" in snapshot["instances"]
+        assert not repo.exists("test-123")
@@ -0,0 +1,74 @@
+"""Tests for client-side rate limiting and retry backoff."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from mimic.rate_limit import TokenBucket, retry_delay
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_wait(self):
+        """The first `capacity` tokens are free, then callers queue in order."""
+        bucket = TokenBucket(rate=10, capacity=2)
+        with patch("mimic.rate_limit.time.monotonic", return_value=100.0):
+            bucket._updated = 100.0
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == 0
+            assert bucket.reserve() == pytest.approx(0.1)
+            assert bucket.reserve() == pytest.approx(0.2)
+
+    def test_refills_over_time(self):
+        """Tokens come back at `rate` per second up to capacity."""
+        bucket = TokenBucket(rate=10, capacity=1)
+        with patch("mimic.rate_limit.time.monotonic", return_value=100.0):
+            bucket._updated = 100.0
+            assert bucket.reserve() == 0
+        with patch("mimic.rate_limit.time.monotonic", return_value=105.0):
+            assert bucket.reserve() == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_without_wait(self):
+        """An available token is handed out without sleeping."""
+        with patch("mimic.rate_limit.asyncio.sleep") as sleep:
+            await TokenBucket(rate=5).acquire_async()
+        sleep.assert_not_called()
+
+
+class TestRetryDelay:
+    """Tests for retry_delay."""
+
+    def test_success_and_client_errors_are_not_retried(self):
+        """2xx and ordinary 4xx responses are returned as-is."""
+        assert retry_delay(_response(200), "GET", 0) is None
+        assert retry_delay(_response(404), "GET", 0) is None
+        assert retry_delay(_response(403), "GET", 0) is None
+
+    def test_throttling_honours_retry_after(self):
+        """429s and GitHub secondary limits wait for Retry-After."""
+        assert retry_delay(_response(429, {"Retry-After": "3"}), "POST", 0) == 3
+        assert retry_delay(_response(403, {"Retry-After": "2"}), "GET", 0) == 2
+
+    def test_server_errors_only_retry_idempotent_methods(self):
+        """A 5xx on POST may have been applied, so it is not repeated."""
+        assert retry_delay(_response(503), "GET", 0) is not None
+        assert retry_delay(_response(503), "POST", 0) is None
+
+    def test_backoff_grows_and_stops(self):
+        """Delays grow exponentially and retries stop at the configured limit."""
+        with (
+            patch("mimic.rate_limit.settings.API_RETRY_BASE_DELAY", 1),
+            patch("mimic.rate_limit.settings.API_MAX_RETRIES", 3),
+        ):
+            first = retry_delay(_response(502), "GET", 0)
+            third = retry_delay(_response(502), "GET", 2)
+            assert first is not None and 0.5 <= first <= 1
+            assert third is not None and 2 <= third <= 4
+            assert retry_delay(_response(502), "GET", 3) is None
@@ -0,0 +1,117 @@
+"""Tests for the pipeline RepositoryManager."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mimic.pipeline.repository_manager import RepoChangePlan, RepositoryManager
+from mimic.scenarios import ConditionalFileOperation
+
+
+@pytest.fixture
+def github():
+    """Mock GitHubClient serving a small in-memory repository."""
+    files = {
+        "values.yaml": "name: ${APP}\n",
+        "ci/with-flags.yaml": "flags: on\n",
+    }
+    client = MagicMock()
+    client.get_file_in_repo = AsyncMock(
+        side_effect=lambda owner, repo, path: (
+            {"sha": f"sha-{path}", "decoded_content": files[path]}
+            if path in files
+            else None
+        )
+    )
+    client.commit_file_changes = AsyncMock(return_value={"oid": "abc"})
+    return client
+
+
+class TestFileChangePlanning:
+    """Tests for planning replacements and moves into one commit."""
+
+    @pytest.mark.asyncio
+    async def test_replace_then_move_is_one_commit(self, github):
+        """A replaced file that is then moved lands once, with replaced content."""
+        manager = RepositoryManager(github)
+        plan = RepoChangePlan()
+
+        await manager._apply_file_replacements(
+            "org", "repo", "values.yaml", {"${APP}": "demo"}, plan
+        )
+        await manager._apply_conditional_file_operations(
+            "org",
+            "repo",
+            [
+                ConditionalFileOperation(
+                    condition_parameter="flags",
+                    when_true={
+                        "values.yaml": "chart/values.yaml",
+                        "ci/with-flags.yaml": "ci/pipeline.yaml",
+                    },
+                )
+            ],
+            {"flags": True},
+            plan,
+        )
+        await manager._commit_plan("org", "repo", plan)
+
+        github.commit_file_changes.assert_awaited_once()
+        kwargs = github.commit_file_changes.call_args.kwargs
+        assert kwargs["additions"] == {
+            "chart/values.yaml": "name: demo\n",
+            "ci/pipeline.yaml": "flags: on\n",
+        }
+        assert sorted(kwargs["deletions"]) == ["ci/with-flags.yaml", "values.yaml"]
+        # Each source file is fetched once despite being read twice
+        assert github.get_file_in_repo.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_no_changes_skips_commit(self, github):
+        """Nothing is committed when replacements don't change any content."""
+        manager = RepositoryManager(github)
+        plan = RepoChangePlan()
+
+        await manager._apply_file_replacements(
+            "org", "repo", "values.yaml", {"${MISSING}": "x"}, plan
+        )
+        await manager._commit_plan("org", "repo", plan)
+
+        github.commit_file_changes.assert_not_awaited()
+
+
+class TestCollaboratorInvites:
+    """Tests for inviting the collaborator during repository creation."""
+
+    @pytest.mark.asyncio
+    async def test_invites_each_repository_once(self, github):
+        """Duplicate repositories are invited once, after all repos are set up."""
+        github.repo_exists = AsyncMock(return_value=True)
+        github.check_user_collaboration = AsyncMock(side_effect=[True, False])
+        github.invite_collaborator = AsyncMock(return_value=True)
+        manager = RepositoryManager(github, invitee_username="octocat")
+        repo = MagicMock(
+            source="templates/app",
+            repo_name_template="demo",
+            target_org="org",
+            files_to_modify=[],
+            replacements={},
+            conditional_file_operations=[],
+            create_component=False,
+        )
+        other = MagicMock(
+            source="templates/app",
+            repo_name_template="demo-2",
+            target_org="org",
+            files_to_modify=[],
+            replacements={},
+            conditional_file_operations=[],
+            create_component=False,
+        )
+
+        await manager.create_repositories([repo, other, repo], {})
+
+        assert github.check_user_collaboration.await_count == 2
+        github.invite_collaborator.assert_awaited_once_with(
+            "org", "demo-2", "octocat", "admin"
+        )
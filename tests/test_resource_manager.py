@@ -0,0 +1,178 @@
+"""Tests for the pipeline ResourceManager."""
+
+import threading
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mimic.exceptions import UnifyAPIError
+from mimic.pipeline.resource_manager import ResourceManager
+from mimic.scenarios import EnvironmentConfig, FlagConfig, Scenario
+from mimic.unify import UnifyAPIClient
+
+
+@pytest.fixture
+def unify_client():
+    """Mock UnifyAPIClient patched into the resource manager module.
+
+    The real bulk_* helpers are bound to the mock so they fan out to the mocked
+    single-item calls.
+    """
+    client = MagicMock()
+    for name in dir(UnifyAPIClient):
+        if name.startswith("bulk_"):
+            setattr(client, name, partial(getattr(UnifyAPIClient, name), client))
+    with patch("mimic.pipeline.resource_manager.UnifyAPIClient") as client_cls:
+        client_cls.return_value = client
+        yield client
+
+
+@pytest.fixture
+def manager():
+    """ResourceManager with fast batching settings."""
+    with patch("mimic.pipeline.resource_manager.settings.UNIFY_BATCH_DELAY", 0):
+        yield ResourceManager("org-1", "endpoint-1", "https://unify.test", "pat")
+
+
+class TestCreateEnvironments:
+    """Tests for create_environments."""
+
+    @pytest.mark.asyncio
+    async def test_records_created_environments_when_one_fails(
+        self, manager, unify_client
+    ):
+        """Environments created before a failure are recorded for cleanup."""
+        unify_client.list_environments.return_value = {"endpoints": []}
+
+        def create_basic_environment(org_id, name, **kwargs):
+            if name == "prod":
+                raise UnifyAPIError("Failed to create prod", status_code=500)
+            return {"id": f"env-{name}"}
+
+        unify_client.create_basic_environment.side_effect = create_basic_environment
+
+        with pytest.raises(UnifyAPIError):
+            await manager.create_environments(
+                [EnvironmentConfig(name="dev"), EnvironmentConfig(name="prod")]
+            )
+
+        assert manager.created_environments["dev"]["id"] == "env-dev"
+        assert "prod" not in manager.created_environments
+
+
+class TestConfigureFlags:
+    """Tests for configure_flags_in_environments."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_flags_and_enables_per_environment(
+        self, manager, unify_client
+    ):
+        """Existing flags are reused, missing ones created, and each pair enabled."""
+        manager.created_applications = {"app": {"id": "app-1"}}
+        manager.created_environments = {
+            "dev": {"id": "env-dev"},
+            "prod": {"id": "env-prod"},
+        }
+        manager.flag_definitions = {
+            "existing": FlagConfig(name="existing"),
+            "new": FlagConfig(name="new"),
+        }
+        unify_client.list_flags.return_value = {
+            "flags": [{"id": "flag-existing", "name": "existing"}]
+        }
+        unify_client.create_boolean_flag.return_value = {
+            "flag": {"id": "flag-new", "name": "new"}
+        }
+        scenario = Scenario(
+            id="s",
+            name="S",
+            summary="s",
+            repositories=[],
+            environments=[
+                EnvironmentConfig(name="dev", flags=["existing", "new"]),
+                EnvironmentConfig(name="prod", flags=["new"]),
+            ],
+            flags=list(manager.flag_definitions.values()),
+        )
+
+        await manager.configure_flags_in_environments(scenario)
+
+        unify_client.create_boolean_flag.assert_called_once_with(
+            "app-1", name="new", description="Flag new for app"
+        )
+        enabled = {
+            (c.kwargs["flag_id"], c.kwargs["env_id"])
+            for c in unify_client.enable_flag_in_environment.call_args_list
+        }
+        assert enabled == {
+            ("flag-existing", "env-dev"),
+            ("flag-new", "env-dev"),
+            ("flag-new", "env-prod"),
+        }
+        assert manager.created_flags["new"]["id"] == "flag-new"
+
+
+class TestUpdateEnvironmentsWithFmTokens:
+    """Tests for update_environments_with_fm_tokens."""
+
+    @pytest.mark.asyncio
+    async def test_single_update_per_environment_without_refetch(
+        self, manager, unify_client
+    ):
+        """SDK keys are fetched per env and each env is updated once from cache."""
+        manager.created_applications = {"app": {"id": "app-1"}}
+        manager.created_environments = {
+            "dev": {"id": "env-dev", "name": "dev", "properties": []},
+            "prod": {
+                "id": "env-prod",
+                "name": "prod",
+                "properties": [{"name": "FM_TOKEN", "string": "old"}],
+            },
+        }
+        unify_client.get_application_environment_sdk_key.return_value = {
+            "sdkKey": "key-dev"
+        }
+        environments = [
+            EnvironmentConfig(name="dev", create_fm_token_var=True),
+            EnvironmentConfig(name="prod", create_fm_token_var=True),
+        ]
+
+        await manager.update_environments_with_fm_tokens(
+            environments, False, {"dev": "app", "prod": "app"}
+        )
+
+        unify_client.get_application_environment_sdk_key.assert_called_once_with(
+            "app-1", "env-dev"
+        )
+        unify_client.get_environment.assert_not_called()
+        unify_client.update_environment.assert_called_once()
+        org_id, env_id, body = unify_client.update_environment.call_args.args
+        assert (org_id, env_id) == ("org-1", "env-dev")
+        assert body["properties"] == [
+            {"name": "FM_TOKEN", "string": "key-dev", "isSecret": False}
+        ]
+        assert manager.created_environments["dev"]["properties"] == body["properties"]
+
+
+class TestCachedList:
+    """Tests for the per-run cache of list_* calls."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_once_off_the_event_loop(self, manager, unify_client):
+        """The list call runs on a worker thread and is reused afterwards."""
+        loop_thread = threading.current_thread()
+        fetch_threads = []
+
+        def list_components(org_id):
+            fetch_threads.append(threading.current_thread())
+            return {"service": [{"id": "c-1", "name": "api"}]}
+
+        unify_client.list_components.side_effect = list_components
+
+        first = await manager._cached_list(unify_client, "components", "org-1")
+        second = await manager._cached_list(unify_client, "components", "org-1")
+
+        assert first is second
+        assert len(fetch_threads) == 1
+        assert fetch_threads[0] is not loop_thread
@@ -0,0 +1,45 @@
+"""Tests for pipeline retry/polling helpers."""
+
+import pytest
+
+from mimic.pipeline.retry_handler import RetryHandler
+
+
+class TestWaitUntil:
+    """Tests for RetryHandler.wait_until."""
+
+    @pytest.mark.asyncio
+    async def test_returns_as_soon_as_ready(self):
+        """Polling stops on the first passing check."""
+        calls = 0
+
+        async def predicate() -> bool:
+            nonlocal calls
+            calls += 1
+            return calls == 3
+
+        assert await RetryHandler.wait_until(predicate, timeout=5, initial=0.001)
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_exceptions_count_as_not_ready(self):
+        """A predicate raising is retried rather than propagated."""
+        calls = 0
+
+        async def predicate() -> bool:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("not found")
+            return True
+
+        assert await RetryHandler.wait_until(predicate, timeout=5, initial=0.001)
+
+    @pytest.mark.asyncio
+    async def test_times_out(self):
+        """Returns False when the resource never becomes ready."""
+
+        async def predicate() -> bool:
+            return False
+
+        assert not await RetryHandler.wait_until(predicate, timeout=0.01, initial=0.001)
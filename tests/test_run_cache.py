@@ -0,0 +1,74 @@
+"""Tests for RunCache - fingerprinting and recording completed runs."""
+
+import pytest
+
+from mimic.run_cache import RunCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a RunCache with a temporary cache file."""
+    return RunCache(cache_file=tmp_path / "run-cache.json")
+
+
+def fingerprint(**overrides):
+    """Fingerprint a baseline run, with any inputs overridden."""
+    inputs = {
+        "scenario_id": "s",
+        "tenant": "prod",
+        "organization_id": "org",
+        "parameters": {"a": "1"},
+        "definition": {"v": 1},
+        "expiration_days": 7,
+        "run_options": {"invitee_username": "octocat"},
+    }
+    return RunCache.fingerprint(**{**inputs, **overrides})
+
+
+class TestFingerprint:
+    """Tests for RunCache.fingerprint."""
+
+    def test_parameter_order_does_not_matter(self):
+        """Equal parameters produce the same fingerprint regardless of order."""
+        a = fingerprint(parameters={"a": "1", "b": "2"})
+        b = fingerprint(parameters={"b": "2", "a": "1"})
+        assert a == b
+
+    @pytest.mark.parametrize(
+        "override",
+        [
+            {"scenario_id": "t"},
+            {"tenant": "demo"},
+            {"organization_id": "org-2"},
+            {"parameters": {"a": "2"}},
+            {"definition": {"v": 2}},
+            {"expiration_days": 1},
+            {"expiration_days": None},
+            {"run_options": {"invitee_username": "someone-else"}},
+        ],
+    )
+    def test_inputs_change_fingerprint(self, override):
+        """Every run input is part of the fingerprint."""
+        assert fingerprint(**override) != fingerprint()
+
+
+class TestRecordAndGet:
+    """Tests for recording and looking up runs."""
+
+    def test_missing_file_is_empty(self, cache):
+        """Lookups on a fresh cache return None."""
+        assert cache.get("missing") is None
+
+    def test_record_round_trip(self, cache):
+        """Recorded instance IDs are returned for their fingerprint."""
+        cache.record("fp-1", "abc-123")
+        cache.record("fp-2", "def-456")
+        assert cache.get("fp-1") == "abc-123"
+        assert RunCache(cache_file=cache.cache_file).get("fp-2") == "def-456"
+
+    def test_corrupt_file_is_ignored(self, cache):
+        """An unreadable cache file behaves like an empty cache."""
+        cache.cache_file.write_text("not json")
+        assert cache.get("fp-1") is None
+        cache.record("fp-1", "abc-123")
+        assert cache.get("fp-1") == "abc-123"
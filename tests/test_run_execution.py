@@ -0,0 +1,128 @@
+"""Tests for execute_scenario's reuse of identical runs."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mimic.cli.run_helpers.execution import execute_scenario
+from mimic.instance_repository import InstanceRepository
+from mimic.models import Instance
+from mimic.scenarios import Scenario
+
+
+@pytest.fixture(autouse=True)
+def temp_config_dir(tmp_path, monkeypatch):
+    """Keep the run cache and instance state in a temporary directory."""
+    monkeypatch.setenv("MIMIC_CONFIG_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def scenario():
+    """A minimal scenario definition."""
+    return Scenario(id="demo", name="Demo", summary="A demo", repositories=[])
+
+
+@pytest.fixture
+def pipeline():
+    """Patch CreationPipeline so each run creates a fresh instance."""
+    runs = 0
+
+    async def execute(scenario, parameters):
+        nonlocal runs
+        runs += 1
+        return {
+            "instance": Instance(
+                id=f"run-{runs}",
+                scenario_id=scenario.id,
+                name="demo-run",
+                tenant="prod",
+                created_at=datetime.now(),
+                expires_at=None,
+            )
+        }
+
+    with (
+        patch("mimic.pipeline.CreationPipeline") as pipeline_class,
+        patch("mimic.cli.run_helpers.execution.display_success_summary"),
+    ):
+        pipeline_class.return_value.execute_scenario = AsyncMock(side_effect=execute)
+        yield pipeline_class
+
+
+@pytest.fixture
+def display_cached():
+    """Patch the message shown when an identical run is reused."""
+    with patch("mimic.cli.run_helpers.execution.display_cached_instance") as display:
+        yield display
+
+
+def make_config_manager(github_username="octocat"):
+    """A ConfigManager mock with fixed tenant settings."""
+    config_manager = MagicMock()
+    config_manager.get_github_username.return_value = github_username
+    config_manager.get_tenant_properties.return_value = {"region": "us"}
+    config_manager.get_tenant_uses_legacy_flags.return_value = False
+    return config_manager
+
+
+def run(scenario, pipeline, expiration_days=7, force=False, config_manager=None):
+    """Run execute_scenario with fixed credentials and parameters."""
+    execute_scenario(
+        config_manager=config_manager or make_config_manager(),
+        scenario=scenario,
+        parameters={"project": "x"},
+        scenario_id=scenario.id,
+        current_env="prod",
+        expiration_days=expiration_days,
+        expiration_label=f"{expiration_days} days",
+        no_expiration=False,
+        organization_id="org-1",
+        endpoint_id="endpoint-1",
+        cloudbees_pat="cb-pat",
+        env_url="https://api.cloudbees.io",
+        github_pat="gh-pat",
+        force=force,
+    )
+    return pipeline.return_value.execute_scenario.await_count
+
+
+class TestRunReuse:
+    """Tests for skipping identical re-runs."""
+
+    def test_identical_rerun_reuses_instance(self, scenario, pipeline, display_cached):
+        """A second identical run shows the existing instance instead of running."""
+        assert run(scenario, pipeline) == 1
+        assert run(scenario, pipeline) == 1
+
+        shown = display_cached.call_args.args[0]
+        assert shown.id == "run-1"
+
+    def test_force_runs_again(self, scenario, pipeline, display_cached):
+        """--force runs the pipeline even when an identical run exists."""
+        run(scenario, pipeline)
+        assert run(scenario, pipeline, force=True) == 2
+        display_cached.assert_not_called()
+
+    def test_changed_definition_runs_again(self, scenario, pipeline):
+        """An updated scenario definition is applied rather than reused."""
+        run(scenario, pipeline)
+        updated = scenario.model_copy(update={"summary": "Updated by a pack pull"})
+        assert run(updated, pipeline) == 2
+
+    def test_changed_expiration_runs_again(self, scenario, pipeline):
+        """A different requested expiration is not served from the cache."""
+        run(scenario, pipeline)
+        assert run(scenario, pipeline, expiration_days=1) == 2
+
+    def test_changed_invitee_runs_again(self, scenario, pipeline):
+        """A different GitHub invitee is not served from the cache."""
+        run(scenario, pipeline)
+        other_user = make_config_manager(github_username="someone-else")
+        assert run(scenario, pipeline, config_manager=other_user) == 2
+
+    def test_deleted_instance_runs_again(self, scenario, pipeline):
+        """A cached run whose instance was cleaned up is run again."""
+        run(scenario, pipeline)
+        InstanceRepository().delete("run-1")
+        assert run(scenario, pipeline) == 2
@@ -248,3 +248,33 @@ class TestScenarioLoadingIntegration:
 
             # Should have no scenarios
             assert len(manager.scenarios) == 0
+
+    def test_unchanged_files_are_not_reparsed(self, temp_scenarios_dir):
+        """Reloading reuses parsed scenarios until a file changes."""
+        from mimic.scenarios import ScenarioManager
+
+        first = ScenarioManager(local_dir=temp_scenarios_dir)
+        with patch("mimic.scenarios.yaml.safe_load") as safe_load:
+            second = ScenarioManager(local_dir=temp_scenarios_dir)
+        safe_load.assert_not_called()
+        assert second.scenarios[0] is first.scenarios[0]
+
+        scenario_file = temp_scenarios_dir / "test-scenario.yaml"
+        data = yaml.safe_load(scenario_file.read_text())
+        data["name"] = "Renamed Scenario"
+        scenario_file.write_text(yaml.dump(data))
+
+        third = ScenarioManager(local_dir=temp_scenarios_dir)
+        assert third.scenarios[0].name == "Renamed Scenario"
+
+    def test_api_views_are_shared_between_managers(self, temp_scenarios_dir):
+        """Managers loading the same unchanged file reuse its built API views."""
+        from mimic.scenarios import ScenarioManager
+
+        first = ScenarioManager(local_dir=temp_scenarios_dir)
+        second = ScenarioManager(local_dir=temp_scenarios_dir)
+
+        assert second.list_scenarios()[0] is first.list_scenarios()[0]
+        assert second.get_scenario_detail("test-scenario") is (
+            first.get_scenario_detail("test-scenario")
+        )
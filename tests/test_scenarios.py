@@ -531,6 +531,22 @@ class TestParameterPlaceholders:
         assert target_org_param.get("placeholder") is not None
         assert target_org_param["placeholder"] == "cb-demos"
 
+    def test_scenario_views_are_built_once(self):
+        """Listing and detail views are precomputed rather than rebuilt per call."""
+        from mimic.scenarios import initialize_scenarios
+
+        manager = initialize_scenarios("scenarios")
+        first = manager.list_scenarios()
+        second = manager.list_scenarios()
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+        detail = manager.get_scenario_detail("param-demo")
+        assert detail is not None
+        assert detail["parameter_schema"]["properties"]["project_name"]
+        assert manager.get_scenario_detail("param-demo") is detail
+        assert manager.get_scenario_detail("does-not-exist") is None
+
     def test_form_data_preprocessing(self):
         """Test that form data preprocessing handles checkbox values correctly."""
         from mimic.scenarios import initialize_scenarios
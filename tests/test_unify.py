@@ -0,0 +1,37 @@
+"""Tests for the CloudBees Unify API client."""
+
+from unittest.mock import patch
+
+import pytest
+
+from mimic.exceptions import UnifyAPIError
+from mimic.unify import UnifyAPIClient
+
+
+class TestBulkDelete:
+    """Tests for the bulk_delete_* helpers."""
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_is_reported_per_id(self):
+        """A failed delete is returned as that id's error; the others still run."""
+        client = UnifyAPIClient(base_url="https://api.example.com", api_key="key")
+        failure = UnifyAPIError("Failed to delete comp-2", status_code=500)
+        deleted = []
+
+        def delete_component(org_id, component_id):
+            if component_id == "comp-2":
+                raise failure
+            deleted.append(component_id)
+
+        with (
+            patch.object(client, "delete_component", side_effect=delete_component),
+            patch("mimic.unify.settings.UNIFY_BATCH_SIZE", 2),
+            patch("mimic.unify.settings.UNIFY_BATCH_DELAY", 0),
+        ):
+            results = await client.bulk_delete_components(
+                "org-1", ["comp-1", "comp-2", "comp-3"]
+            )
+
+        assert results == {"comp-1": None, "comp-2": failure, "comp-3": None}
+        assert sorted(deleted) == ["comp-1", "comp-3"]
+        client.close()
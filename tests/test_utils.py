@@ -0,0 +1,135 @@
+"""Tests for shared utility helpers."""
+
+import asyncio
+
+import pytest
+
+from mimic.exceptions import BatchError
+from mimic.utils import apply_replacements, batched_gather, gather_or_cancel
+
+
+class TestApplyReplacements:
+    """Tests for apply_replacements."""
+
+    def test_replaces_all_occurrences(self):
+        """Every occurrence of every find string is replaced."""
+        content = "name: ${APP}\nimage: ${REGISTRY}/${APP}\n"
+        result = apply_replacements(
+            content, {"${APP}": "demo", "${REGISTRY}": "ghcr.io/acme"}
+        )
+        assert result == "name: demo\nimage: ghcr.io/acme/demo\n"
+
+    def test_longest_match_wins(self):
+        """Overlapping find strings prefer the longer match."""
+        result = apply_replacements("foobar foo", {"foo": "x", "foobar": "y"})
+        assert result == "y x"
+
+    def test_replacement_values_are_not_rescanned(self):
+        """A value containing another find string is left as-is."""
+        assert apply_replacements("a", {"a": "b", "b": "c"}) == "b"
+
+    def test_empty_replacements(self):
+        """No replacements (or only empty keys) leave content untouched."""
+        assert apply_replacements("abc", {}) == "abc"
+        assert apply_replacements("abc", {"": "x"}) == "abc"
+
+
+class TestBatchedGather:
+    """Tests for batched_gather."""
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_across_batches(self):
+        """Results come back in operation order even when split into batches."""
+
+        def make_op(value: int):
+            async def op() -> int:
+                await asyncio.sleep(0.001 * (5 - value))
+                return value
+
+            return op
+
+        results = await batched_gather(
+            [make_op(i) for i in range(5)], batch_size=2, inter_batch_delay=0
+        )
+        assert results == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency_to_batch_size(self):
+        """No more than batch_size operations run at the same time."""
+        running = 0
+        peak = 0
+
+        async def op() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+        await batched_gather([op] * 7, batch_size=3, inter_batch_delay=0)
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_empty_operations(self):
+        """An empty operation list returns an empty result without sleeping."""
+        assert await batched_gather([]) == []
+
+    @pytest.mark.asyncio
+    async def test_failure_finishes_batch_and_stops(self):
+        """A failure lets its batch finish, skips later batches, and keeps results."""
+        started: list[int] = []
+        failure = ValueError("boom")
+
+        def make_op(value: int):
+            async def op() -> int:
+                started.append(value)
+                if value == 1:
+                    raise failure
+                await asyncio.sleep(0.001)
+                return value
+
+            return op
+
+        with pytest.raises(BatchError) as exc_info:
+            await batched_gather(
+                [make_op(i) for i in range(5)], batch_size=3, inter_batch_delay=0
+            )
+
+        assert sorted(started) == [0, 1, 2]
+        assert exc_info.value.results == [0, failure, 2]
+        assert exc_info.value.error is failure
+
+
+class TestGatherOrCancel:
+    """Tests for gather_or_cancel."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        """Results follow argument order."""
+
+        async def value(v: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return v
+
+        assert await gather_or_cancel(value(1, 0.002), value(2, 0)) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_siblings(self):
+        """The first failure propagates unwrapped and cancels the other tasks."""
+        cancelled = False
+
+        async def slow() -> None:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await gather_or_cancel(slow(), fail())
+        await asyncio.sleep(0)
+        assert cancelled